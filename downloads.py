@@ -0,0 +1,268 @@
+# http client and resumable downloads, kept apart from ui.py so they can be used (and tested) without tkinter :3
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+import requests.adapters
+
+# one keep-alive session per host so repeat requests skip the tcp+tls handshake :3
+# every request gets a timeout unless the caller passes one, and per-host counts/bytes/latency are tracked :3
+class HttpClient:
+    DEFAULT_TIMEOUT = (10, 30)
+
+    def __init__(self, pool_size=8, timeout=DEFAULT_TIMEOUT):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.sessions = {}
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def session(self, host):
+        with self.lock:
+            if (session := self.sessions.get(host)) is None:
+                session = requests.Session()
+                # a few host pools per session since downloads redirect to the cdn :3
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self.sessions[host] = session
+            return session
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlparse(url).netloc
+        started = time.perf_counter()
+        try:
+            response = self.session(host).request(method, url, **kwargs)
+        except requests.RequestException:
+            self._record(host, time.perf_counter() - started, 0, failed=True)
+            raise
+
+        if kwargs.get('stream'):
+            self._track_stream(host, started, response)
+        else:
+            self._record(host, time.perf_counter() - started, len(response.content), failed=response.status_code >= 400)
+        return response
+
+    # streamed bodies haven't been read yet, so the bytes are counted as they come through iter_content
+    # and the request is recorded once the body runs out, fails or the response is closed :3
+    def _track_stream(self, host, started, response):
+        received = 0
+        failed = response.status_code >= 400
+        recorded = False
+        iter_content = response.iter_content
+        close = response.close
+
+        def record():
+            nonlocal recorded
+            if not recorded:
+                recorded = True
+                self._record(host, time.perf_counter() - started, received, failed=failed)
+
+        def counted_iter_content(*args, **kwargs):
+            nonlocal received, failed
+            try:
+                for chunk in iter_content(*args, **kwargs):
+                    received += len(chunk)
+                    yield chunk
+            except requests.RequestException:
+                failed = True
+                raise
+            finally:
+                record()
+
+        def counted_close():
+            record()
+            close()
+
+        response.iter_content = counted_iter_content
+        response.close = counted_close
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def _record(self, host, elapsed, size, failed=False):
+        with self.lock:
+            stats = self.stats.setdefault(host, {'requests': 0, 'errors': 0, 'bytes': 0, 'latency_total': 0.0, 'latency_max': 0.0})
+            stats['requests'] += 1
+            stats['errors'] += int(failed)
+            stats['bytes'] += size
+            stats['latency_total'] += elapsed
+            stats['latency_max'] = max(stats['latency_max'], elapsed)
+
+    def metrics(self):
+        with self.lock:
+            return {host: dict(stats) for host, stats in self.stats.items()}
+
+    def log_metrics(self):
+        for host, stats in sorted(self.metrics().items()):
+            average = stats['latency_total'] / stats['requests'] * 1000 if stats['requests'] else 0
+            logging.info(
+                f"HTTP {host}: {stats['requests']} requests, {stats['errors']} errors, "
+                f"{stats['bytes'] / 1024:.0f}KB, avg {average:.0f}ms, max {stats['latency_max'] * 1000:.0f}ms"
+            )
+
+http_client = HttpClient()
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# the body ended before content-length said it would :3
+class IncompleteDownload(requests.RequestException):
+    pass
+
+# decides which download errors are worth another go and how long to wait before it :3
+# exponential backoff with full jitter so parallel workers don't all retry at the same moment :3
+class RetryPolicy:
+    RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+    RETRY_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError, IncompleteDownload, ConnectionError)
+
+    def __init__(self, attempts=4, base_delay=1.0, max_delay=30.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def retryable(self, error):
+        if isinstance(error, requests.HTTPError):
+            return error.response is not None and error.response.status_code in self.RETRY_STATUSES
+        return isinstance(error, self.RETRY_ERRORS)
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+# partial downloads live in destination.part, with the validators needed to resume them in destination.part.json :3
+def _load_partial(destination, url):
+    part_path, meta_path = f"{destination}.part", f"{destination}.part.json"
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        if meta.get('url') == url and (meta.get('etag') or meta.get('last_modified')):
+            return meta, os.path.getsize(part_path)
+    except (OSError, ValueError):
+        pass
+    for path in (part_path, meta_path):
+        if os.path.exists(path):
+            os.remove(path)
+    return None, 0
+
+def _save_partial(destination, url, response):
+    etag = response.headers.get('etag')
+    meta = {
+        'url': url,
+        # weak etags can't be used with if-range :3
+        'etag': etag if etag and not etag.startswith('W/') else None,
+        'last_modified': response.headers.get('last-modified')
+    }
+    with open(f"{destination}.part.json", 'w') as f:
+        json.dump(meta, f)
+
+# downloads url to destination with a streaming get, hashing the chunks as they're written :3
+# dropped connections are retried per retry (a RetryPolicy) and pick up where the .part file left off when the server allows ranges :3
+# on_size gets the expected size (from the headers, or expected_size when they have none) before the body is read and can raise to abort :3
+# on_chunk gets called after every chunk, raising there stops the download too, on_retry gets (attempt, error, delay) :3
+def stream_download(url, destination, expected_size=0, on_size=None, on_chunk=None, timeout=None, retry=None, on_retry=None):
+    retry = retry or RetryPolicy()
+    part_path = f"{destination}.part"
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return _stream_download_attempt(url, destination, part_path, expected_size, on_size, on_chunk, timeout)
+        except Exception as e:
+            if attempt >= retry.attempts or not retry.retryable(e):
+                raise
+            delay = retry.delay(attempt)
+            logging.info(f"Download of {url} failed ({e.__class__.__name__}: {str(e)}), retrying in {delay:.1f}s")
+            if on_retry:
+                on_retry(attempt, e, delay)
+            time.sleep(delay)
+
+def _stream_download_attempt(url, destination, part_path, expected_size, on_size, on_chunk, timeout):
+    meta, offset = _load_partial(destination, url)
+    headers = {}
+    if offset:
+        headers['Range'] = f"bytes={offset}-"
+        headers['If-Range'] = meta.get('etag') or meta['last_modified']
+
+    kwargs = {'timeout': timeout} if timeout else {}
+    with http_client.get(url, stream=True, headers=headers, **kwargs) as response:
+        if response.status_code == 416:
+            # our partial doesn't line up with what the server has anymore, start over next attempt :3
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise IncompleteDownload(f"Server rejected resume of {url}")
+        response.raise_for_status()
+
+        digest = hashlib.sha256()
+        content_range = response.headers.get('content-range', '')
+        if offset and response.status_code == 206 and content_range.startswith(f"bytes {offset}-"):
+            # resuming, the bytes already on disk go into the hash first :3
+            with open(part_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+            total = int(content_range.rsplit('/', 1)[-1]) if not content_range.endswith('/*') else 0
+            mode = 'ab'
+        elif response.status_code == 200:
+            # no range support (or the file changed), the server sent everything again :3
+            offset = 0
+            total = int(response.headers.get('content-length', 0) or 0)
+            mode = 'wb'
+        else:
+            # a range we didn't ask for would be saved as if it were the whole file, start clean instead :3
+            discard_download(destination, keep_destination=True)
+            raise IncompleteDownload(f"Unexpected {response.status_code} ({content_range or 'no content-range'}) resuming {url}")
+
+        size = total or expected_size or 0
+        if on_size:
+            on_size(size)
+        _save_partial(destination, url, response)
+
+        written = offset
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if not chunk:
+                    continue
+                f.write(chunk)
+                digest.update(chunk)
+                written += len(chunk)
+                if on_chunk:
+                    on_chunk(written, size)
+
+    if total and written < total:
+        raise IncompleteDownload(f"Got {written} of {total} bytes from {url}")
+
+    os.replace(part_path, destination)
+    os.remove(f"{destination}.part.json")
+    return written, digest.hexdigest()
+
+# removes a download and the .part files it resumes from :3
+def discard_download(destination, keep_destination=False):
+    paths = [f"{destination}.part", f"{destination}.part.json"]
+    if not keep_destination:
+        paths.append(destination)
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.error(f"Failed to remove {path}: {str(e)}")
+
+# sha256 of a file on disk, read in download sized chunks :3
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
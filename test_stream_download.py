@@ -0,0 +1,121 @@
+# resume behaviour of stream_download against a local http server standing in for thunderstore :3
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from downloads import IncompleteDownload, RetryPolicy, stream_download
+
+PAYLOAD = bytes(range(256)) * 4096
+ETAG = '"meow"'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    # 'drop' cuts the first response short, 'no_range' ignores ranges, '416' refuses them, 'wrong_range' answers from byte 0 :3
+    mode = 'drop'
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def send_body(self, status, body, content_range=None, length=None):
+        self.send_response(status)
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(body) if length is None else length))
+        if content_range:
+            self.send_header('Content-Range', content_range)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        range_header = self.headers.get('Range')
+        self.requests_seen.append(range_header)
+        if range_header:
+            start = int(range_header[len('bytes='):].rstrip('-'))
+            if self.mode == '416':
+                self.send_body(416, b'')
+            elif self.mode == 'no_range':
+                self.send_body(200, PAYLOAD)
+            elif self.mode == 'wrong_range':
+                self.send_body(206, PAYLOAD[:100], f"bytes 0-99/{len(PAYLOAD)}")
+            else:
+                self.send_body(206, PAYLOAD[start:], f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}")
+        elif self.mode == 'drop' and len(self.requests_seen) == 1:
+            # promise the whole file, send half, hang up :3
+            half = len(PAYLOAD) // 2
+            self.send_body(200, PAYLOAD[:half], length=len(PAYLOAD))
+            self.close_connection = True
+        else:
+            self.send_body(200, PAYLOAD)
+
+
+class StreamDownloadTests(unittest.TestCase):
+    def setUp(self):
+        StandInHandler.requests_seen = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/mod.zip"
+        self.folder = tempfile.TemporaryDirectory()
+        self.destination = os.path.join(self.folder.name, 'mod.zip')
+        self.retry = RetryPolicy(attempts=3, base_delay=0, max_delay=0)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.folder.cleanup()
+
+    # leaves a .part of the first chunk behind as if an earlier attempt got that far :3
+    def write_partial(self, data):
+        with open(f"{self.destination}.part", 'wb') as f:
+            f.write(data)
+        with open(f"{self.destination}.part.json", 'w') as f:
+            json.dump({'url': self.url, 'etag': ETAG, 'last_modified': None}, f)
+
+    def assert_complete(self, result):
+        size, sha256 = result
+        self.assertEqual(size, len(PAYLOAD))
+        self.assertEqual(sha256, hashlib.sha256(PAYLOAD).hexdigest())
+        with open(self.destination, 'rb') as f:
+            self.assertEqual(f.read(), PAYLOAD)
+        self.assertFalse(os.path.exists(f"{self.destination}.part"))
+        self.assertFalse(os.path.exists(f"{self.destination}.part.json"))
+
+    def test_resumes_after_dropped_connection(self):
+        StandInHandler.mode = 'drop'
+        self.assert_complete(stream_download(self.url, self.destination, retry=self.retry))
+        self.assertIsNone(StandInHandler.requests_seen[0])
+        self.assertTrue(StandInHandler.requests_seen[1].startswith('bytes='))
+        self.assertNotEqual(StandInHandler.requests_seen[1], 'bytes=0-')
+
+    def test_full_body_when_server_ignores_range(self):
+        StandInHandler.mode = 'no_range'
+        self.write_partial(b'\xff' * 1000)
+        self.assert_complete(stream_download(self.url, self.destination, retry=self.retry))
+        self.assertEqual(len(StandInHandler.requests_seen), 1)
+
+    def test_416_starts_over(self):
+        StandInHandler.mode = '416'
+        self.write_partial(PAYLOAD[:1000])
+        self.assert_complete(stream_download(self.url, self.destination, retry=self.retry))
+        self.assertEqual(StandInHandler.requests_seen, ['bytes=1000-', None])
+
+    def test_mismatched_range_is_never_saved_as_the_file(self):
+        StandInHandler.mode = 'wrong_range'
+        self.write_partial(PAYLOAD[:1000])
+        self.assert_complete(stream_download(self.url, self.destination, retry=self.retry))
+        self.assertEqual(StandInHandler.requests_seen, ['bytes=1000-', None])
+
+    def test_mismatched_range_without_retries_fails_clean(self):
+        StandInHandler.mode = 'wrong_range'
+        self.write_partial(PAYLOAD[:1000])
+        with self.assertRaises(IncompleteDownload):
+            stream_download(self.url, self.destination, retry=RetryPolicy(attempts=1))
+        self.assertFalse(os.path.exists(self.destination))
+        self.assertFalse(os.path.exists(f"{self.destination}.part"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,6 +18,13 @@ import time
 import traceback
 import webbrowser
 import zipfile
+import select
+import struct
+import contextlib
+import bisect
+import itertools
+import concurrent.futures
+import atexit
 from urllib.parse import urlparse
 import argparse
 from packaging import version
@@ -26,10 +33,14 @@ from datetime import datetime, timedelta, timezone
 import logging
 import random
 import uuid
+import hashlib
+import sqlite3
 
 # third-party imports :3
 import appdirs
 import requests
+from downloads import (DOWNLOAD_CHUNK_SIZE, IncompleteDownload, RetryPolicy, discard_download, file_sha256,
+                       http_client, stream_download)
 import tkinter as tk
 from dotenv import load_dotenv
 from PIL import Image, ImageTk
@@ -102,6 +113,2492 @@ def get_version():
             logging.info(f"Error reading version file: {e}")
             return 'Unknown'
 
+THUNDERSTORE_PACKAGE_INDEX_URL = "https://thunderstore.io/c/webfishing/api/v1/package/"
+THUNDERSTORE_PACKAGE_URL = "https://thunderstore.io/c/webfishing/api/v1/package/{uuid4}/"
+
+# decodes a top level json array one element at a time so the whole document is never in memory at once :3
+def iter_json_array(stream, chunk_size=65536):
+    decoder = json.JSONDecoder()
+    buffer = ''
+    index = 0
+    eof = False
+
+    def read_more():
+        nonlocal buffer, index, eof
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+        # drop what we've already consumed so the buffer stays about one element big :3
+        buffer = buffer[index:] + chunk
+        index = 0
+
+    def skip_whitespace():
+        nonlocal index
+        while True:
+            while index < len(buffer) and buffer[index] in ' \t\r\n':
+                index += 1
+            if index < len(buffer) or eof:
+                return
+            read_more()
+
+    skip_whitespace()
+    if index >= len(buffer) or buffer[index] != '[':
+        raise ValueError("Expected a JSON array")
+    index += 1
+
+    while True:
+        skip_whitespace()
+        if index >= len(buffer):
+            raise ValueError("Unexpected end of JSON array")
+        if buffer[index] == ']':
+            return
+        if buffer[index] == ',':
+            index += 1
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buffer, index)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # the element is split across chunks, pull in more and try again :3
+            read_more()
+            continue
+
+        # a number right at the end of the buffer might still have digits coming :3
+        if end == len(buffer) and not eof and not isinstance(item, (dict, list, str)):
+            read_more()
+            continue
+
+        index = end
+        yield item
+
+# turns a raw thunderstore package into the mod info structure, only the latest version is kept :3
+def thunderstore_package_to_mod(package):
+    versions = package.get('versions')
+    if not versions:
+        return None
+
+    latest_version = versions[0]
+    return {
+        'title': package['name'],
+        'thunderstore_id': f"{package['owner']}-{package['name']}",
+        'id': f"{package['owner']}-{package['name']}",
+        'uuid4': package.get('uuid4'),
+        'description': latest_version['description'],
+        'version': latest_version['version_number'],
+        'download': latest_version['download_url'],
+        'categories': package['categories'],
+        'author': package['owner'],
+        'dependencies': latest_version['dependencies'],
+        'website': latest_version.get('website_url', ''),
+        'downloads': latest_version.get('downloads', 0),
+        'likes': package.get('rating_score', 0),
+        'last_updated': package.get('date_updated', ''),
+        'is_deprecated': package.get('is_deprecated', False),
+        'has_nsfw_content': package.get('has_nsfw_content', False),
+        'date_updated': package['date_updated'],
+        'file_size': latest_version.get('file_size', 0)
+    }
+
+# finds the shallowest manifest.json with an Id straight from the zip's central directory :3
+# returns the folder prefix it sits in (with trailing slash, or '' for the root) and the parsed manifest :3
+def find_zip_manifest(zip_ref):
+    candidates = sorted(
+        (info for info in zip_ref.infolist() if not info.is_dir() and info.filename.rsplit('/', 1)[-1] == 'manifest.json'),
+        key=lambda info: info.filename.count('/')
+    )
+    for info in candidates:
+        try:
+            manifest = json.loads(zip_ref.read(info).decode('utf-8-sig'))
+        except (ValueError, UnicodeDecodeError):
+            continue
+        if isinstance(manifest, dict) and manifest.get('Id'):
+            return info.filename[:-len('manifest.json')], manifest
+    return None, None
+
+# swaps source in at destination with renames only, the old folder is deleted afterwards :3
+def replace_directory(source, destination):
+    if not os.path.exists(destination):
+        os.replace(source, destination)
+        return
+    old = f"{destination}.old-{uuid.uuid4().hex[:8]}"
+    os.replace(destination, old)
+    try:
+        os.replace(source, destination)
+    except OSError:
+        os.replace(old, destination)
+        raise
+    shutil.rmtree(old, ignore_errors=True)
+
+# extracts only the members under prefix into a staging folder beside destination, then renames it into place :3
+def extract_zip_subtree(zip_ref, prefix, destination):
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    staging = f"{destination}.staging-{uuid.uuid4().hex[:8]}"
+    os.makedirs(staging)
+    staging_root = os.path.realpath(staging) + os.sep
+    try:
+        for info in zip_ref.infolist():
+            if not info.filename.startswith(prefix):
+                continue
+            relative = info.filename[len(prefix):]
+            if not relative:
+                continue
+
+            # never write outside the staging folder, whatever the archive says :3
+            target = os.path.realpath(os.path.join(staging, *relative.split('/')))
+            if not target.startswith(staging_root):
+                raise ValueError(f"Unsafe path in archive: {info.filename}")
+
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with zip_ref.open(info) as source, open(target, 'wb') as f:
+                shutil.copyfileobj(source, f, DOWNLOAD_CHUNK_SIZE)
+
+        replace_directory(staging, destination)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+# downloaded mod zips kept by content hash so reinstalling the same version never hits the network :3
+# entries are keyed by thunderstore_id + version, checked against their sha256 on reuse and evicted least recently used first :3
+class PackageCache:
+    def __init__(self, root, max_bytes=1024 * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(root, 'index.json')
+        self.entries = {}
+        self.pins = {}
+        # cache hits only move last_used, that waits for the next real change or flush on exit :3
+        self.unsaved = False
+        self.lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self._load()
+
+    @staticmethod
+    def key_for(mod):
+        return f"{mod.get('thunderstore_id') or mod['id']}-{mod.get('version', '')}"
+
+    def path_for(self, sha256):
+        return os.path.join(self.root, f"{sha256}.zip")
+
+    # returns a verified cached archive and pins it until release, or None :3
+    def acquire(self, key, url=None):
+        with self.lock:
+            entry = self.entries.get(key)
+            if not entry or (url and entry.get('url') and entry['url'] != url):
+                return None
+            self.pins[key] = self.pins.get(key, 0) + 1
+
+        path = self.path_for(entry['sha256'])
+        try:
+            valid = os.path.getsize(path) == entry['size'] and file_sha256(path) == entry['sha256']
+        except OSError:
+            valid = False
+
+        with self.lock:
+            if not valid:
+                logging.info(f"Dropping corrupt cached package {key}")
+                self._release(key)
+                self._drop(key)
+                self._save()
+                return None
+            entry['last_used'] = time.time()
+            self.unsaved = True
+        return path
+
+    def release(self, key):
+        with self.lock:
+            self._release(key)
+
+    # moves a freshly downloaded archive into the cache, pinned like acquire :3
+    def put(self, key, source_path, sha256, url=None):
+        path = self.path_for(sha256)
+        if os.path.exists(path):
+            os.remove(source_path)
+        else:
+            os.replace(source_path, path)
+
+        with self.lock:
+            self.entries[key] = {'sha256': sha256, 'size': os.path.getsize(path), 'url': url, 'last_used': time.time()}
+            self.pins[key] = self.pins.get(key, 0) + 1
+            self._evict()
+            self._save()
+        return path
+
+    def size(self):
+        with self.lock:
+            return self._size()
+
+    def clear(self):
+        with self.lock:
+            removable = [key for key in self.entries if not self.pins.get(key)]
+            for key in removable:
+                self._drop(key)
+            if removable:
+                self._save()
+
+    # writes last_used times from cache hits, nothing else is ever left unsaved :3
+    def flush(self):
+        with self.lock:
+            if self.unsaved:
+                self._save()
+
+    def _size(self):
+        return sum({entry['sha256']: entry['size'] for entry in self.entries.values()}.values())
+
+    def _release(self, key):
+        if self.pins.get(key, 0) > 1:
+            self.pins[key] -= 1
+        else:
+            self.pins.pop(key, None)
+
+    def _evict(self):
+        for key in sorted(self.entries, key=lambda key: self.entries[key]['last_used']):
+            if self._size() <= self.max_bytes:
+                break
+            if not self.pins.get(key):
+                logging.info(f"Evicting cached package {key}")
+                self._drop(key)
+
+    def _drop(self, key):
+        entry = self.entries.pop(key, None)
+        # archives are shared between keys with the same content, only delete the last reference :3
+        if entry and not any(other['sha256'] == entry['sha256'] for other in self.entries.values()):
+            try:
+                os.remove(self.path_for(entry['sha256']))
+            except OSError:
+                pass
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to read package cache index: {str(e)}")
+            self.entries = {}
+
+    def _save(self):
+        try:
+            write_json_atomic(self.index_path, self.entries, indent=2)
+            self.unsaved = False
+        except OSError as e:
+            logging.error(f"Failed to save package cache index: {str(e)}")
+
+# streams a package index file into compact mod records and reports how long and how much memory it took :3
+# set HLS_PROFILE_CATALOG=1 to also measure peak memory (and the old json.load path for comparison) :3
+# on_batch gets called with every batch_size records and the number of packages read so far :3
+def parse_thunderstore_index(path, profile=None, on_batch=None, batch_size=250):
+    if profile is None:
+        profile = bool(os.getenv('HLS_PROFILE_CATALOG'))
+
+    stats = {'packages': 0, 'bytes': os.path.getsize(path)}
+    if profile:
+        import tracemalloc
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    mods = []
+    batch = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for package in iter_json_array(f):
+            stats['packages'] += 1
+            if mod := thunderstore_package_to_mod(package):
+                mods.append(mod)
+                batch.append(mod)
+            if on_batch and len(batch) >= batch_size:
+                on_batch(batch, stats['packages'])
+                batch = []
+    if on_batch and batch:
+        on_batch(batch, stats['packages'])
+    stats['seconds'] = time.perf_counter() - started
+
+    if profile:
+        stats['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        with open(path, 'r', encoding='utf-8') as f:
+            json.load(f)
+        stats['full_load_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    message = f"Parsed {stats['packages']} Thunderstore packages ({stats['bytes'] / 1024 / 1024:.1f}MB) in {stats['seconds']:.3f}s"
+    if profile:
+        message += (f", peak memory {stats['peak_bytes'] / 1024 / 1024:.1f}MB"
+                    f" (json.load peak {stats['full_load_peak_bytes'] / 1024 / 1024:.1f}MB)")
+    logging.info(message)
+    return mods, stats
+
+# search index for the mod search box, built once per catalog load so typing never rescans every description :3
+# 1-3 character n-grams narrow title/author/category matches down to a few candidates, descriptions only match
+# at the start of a word through a sorted word list, and whole tokens get a fuzzy fallback for typos :3
+class ModSearchIndex:
+    FIELD_WEIGHTS = (('title', 100), ('author', 40), ('categories', 25), ('description', 10))
+    GRAM_FIELDS = ('title', 'author', 'categories')
+    GRAM_SIZE = 3
+    FUZZY_MIN_LENGTH = 4
+
+    def __init__(self, mods):
+        self.mods = list(mods)
+        self.fields = []
+        self.grams = {}
+        self.tokens = {}
+        self.description_words = {}
+        self.deletes = {}
+        self.last_exact = True
+        self._last = ([], None)
+
+        for doc_id, mod in enumerate(self.mods):
+            fields = {
+                'title': self.normalize(mod.get('title')),
+                'author': self.normalize(mod.get('author')),
+                'categories': self.normalize(' '.join(mod.get('categories') or [])),
+                'description': self.normalize(mod.get('description'))
+            }
+            self.fields.append(fields)
+
+            # postings are plain lists, doc ids go in once each and in order :3
+            doc_grams = set()
+            doc_tokens = set()
+            for field in self.GRAM_FIELDS:
+                doc_grams.update(self._grams(fields[field]))
+                doc_tokens.update(fields[field].split())
+            description_words = set(fields['description'].split())
+            doc_tokens.update(description_words)
+            for gram in doc_grams:
+                self.grams.setdefault(gram, []).append(doc_id)
+            for token in doc_tokens:
+                self.tokens.setdefault(token, []).append(doc_id)
+            for word in description_words:
+                self.description_words.setdefault(word, []).append(doc_id)
+        self.sorted_description_words = sorted(self.description_words)
+
+        # every token with one character dropped, so a typo can find the token it was meant to be :3
+        for token in self.tokens:
+            if len(token) >= self.FUZZY_MIN_LENGTH:
+                for variant in self._deletes(token):
+                    self.deletes.setdefault(variant, set()).add(token)
+
+    # plain scan for one mod with the same rules as the index, minus typo matching :3
+    # every term has to show up in its title, author or categories, or start a word of its description :3
+    @classmethod
+    def matches(cls, mod, terms):
+        text = cls.normalize(' '.join([mod.get('title') or '', mod.get('author') or ''] + list(mod.get('categories') or [])))
+        description = f" {cls.normalize(mod.get('description'))}"
+        return all(term in text or f" {term}" in description for term in terms)
+
+    # lowercase, underscores and punctuation become spaces so "cool mod" finds Cool_Mod :3
+    @staticmethod
+    def normalize(text):
+        return ' '.join(re.sub(r'[\W_]+', ' ', (text or '').lower()).split())
+
+    @classmethod
+    def _grams(cls, text):
+        return {text[i:i + size] for size in range(1, cls.GRAM_SIZE + 1) for i in range(len(text) - size + 1)}
+
+    @staticmethod
+    def _deletes(token):
+        return {token[:i] + token[i + 1:] for i in range(len(token))}
+
+    @staticmethod
+    def _within_one_edit(a, b):
+        if a == b:
+            return True
+        if abs(len(a) - len(b)) > 1:
+            return False
+        if len(a) == len(b):
+            diffs = [i for i in range(len(a)) if a[i] != b[i]]
+            # one substitution or two swapped neighbours :3
+            return len(diffs) == 1 or (len(diffs) == 2 and diffs[1] == diffs[0] + 1
+                                       and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]])
+        shorter, longer = (a, b) if len(a) < len(b) else (b, a)
+        i = 0
+        while i < len(shorter) and shorter[i] == longer[i]:
+            i += 1
+        return shorter[i:] == longer[i + 1:]
+
+    # docs that contain every gram of the term plus docs with a description word starting with it,
+    # still needs a real substring check :3
+    def _candidates(self, term):
+        candidates = set(self._gram_candidates(term))
+        start = bisect.bisect_left(self.sorted_description_words, term)
+        for word in itertools.islice(self.sorted_description_words, start, None):
+            if not word.startswith(term):
+                break
+            candidates.update(self.description_words[word])
+        return candidates
+
+    def _gram_candidates(self, term):
+        if len(term) <= self.GRAM_SIZE:
+            return self.grams.get(term, [])
+        postings = []
+        for i in range(len(term) - self.GRAM_SIZE + 1):
+            posting = self.grams.get(term[i:i + self.GRAM_SIZE])
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+    def _score(self, doc_id, term):
+        score = 0
+        for field, weight in self.FIELD_WEIGHTS:
+            text = self.fields[doc_id][field]
+            pos = text.find(term) if field != 'description' else f" {text}".find(f" {term}")
+            if pos == -1:
+                continue
+            score += weight
+            # whole field and start of a word matches rank higher :3
+            if text == term:
+                score += weight
+            elif pos == 0 or text[pos - 1] == ' ':
+                score += weight // 2
+        return score
+
+    # within limits the candidates to the last result set, None back means the term needs the fuzzy fallback :3
+    def _search_term(self, term, within=None):
+        candidates = self._candidates(term)
+        if within is not None:
+            candidates = within.intersection(candidates)
+
+        scores = {}
+        for doc_id in candidates:
+            if score := self._score(doc_id, term):
+                scores[doc_id] = score
+
+        if not scores and len(term) >= self.FUZZY_MIN_LENGTH:
+            if within is not None:
+                return None
+            # nothing contains the term, try tokens one typo away at half the score :3
+            self.last_exact = False
+            nearby = set()
+            for variant in self._deletes(term) | {term}:
+                if variant in self.tokens:
+                    nearby.add(variant)
+                nearby.update(self.deletes.get(variant, ()))
+            for token in nearby:
+                if not self._within_one_edit(term, token):
+                    continue
+                for doc_id in self.tokens[token]:
+                    scores[doc_id] = max(scores.get(doc_id, 0), self._score(doc_id, token) // 2)
+        return scores
+
+    def _search_terms(self, terms, within=None):
+        self.last_exact = True
+        scores = None
+        for term in terms:
+            term_scores = self._search_term(term, within)
+            if term_scores is None:
+                return None
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc_id: score + term_scores[doc_id] for doc_id, score in scores.items() if doc_id in term_scores}
+            if not scores:
+                break
+        return scores or {}
+
+    # True when every match for new_terms has to be a match for old_terms too, i.e. the user just kept typing :3
+    # the last term has to be extended at its end, description words only match from their start :3
+    @staticmethod
+    def narrows(old_terms, new_terms):
+        if len(new_terms) < len(old_terms):
+            return False
+        if not old_terms:
+            return True
+        return new_terms[:len(old_terms) - 1] == old_terms[:-1] and new_terms[len(old_terms) - 1].startswith(old_terms[-1])
+
+    # returns (mod, score) pairs best first, every word of the query has to match somewhere :3
+    # when the query only extends the last one, only the last results get rescored :3
+    def search(self, query):
+        terms = self.normalize(query).split()
+        if not terms:
+            self.last_exact = True
+            self._last = ([], None)
+            return [(mod, 0) for mod in self.mods]
+
+        last_terms, last_docs = self._last
+        scores = None
+        if last_docs is not None and self.narrows(last_terms, terms):
+            scores = self._search_terms(terms, last_docs)
+        if scores is None:
+            scores = self._search_terms(terms)
+
+        # fuzzy results aren't a superset of anything, so they can't be narrowed later :3
+        self._last = (terms, set(scores) if self.last_exact else None)
+        return sorted(((self.mods[doc_id], score) for doc_id, score in scores.items()), key=lambda item: -item[1])
+
+# holds every thunderstore package we know about, nsfw and deprecated ones included :3
+# the show nsfw/deprecated toggles just pick a view, and each view's duplicate resolution is only done once :3
+class ThunderstoreCatalog:
+    def __init__(self, mods=None):
+        self.mods = list(mods or [])
+        self._views = {}
+        self._view_members = {}
+        self._search_index = None
+        self._sort_orders = {}
+        self._sorted_views = {}
+
+    def __len__(self):
+        return len(self.mods)
+
+    def view(self, show_nsfw, show_deprecated):
+        key = (bool(show_nsfw), bool(show_deprecated))
+        if key not in self._views:
+            self._views[key] = self._build_view(*key)
+            self._view_members[key] = {id(mod) for mod in self._views[key]}
+        return self._views[key]
+
+    # presorted order of every package for one of the AVAILABLE_SORTS methods, None for anything else :3
+    def sort_order(self, sort_method):
+        if sort_method not in AVAILABLE_SORTS:
+            return None
+        if sort_method not in self._sort_orders:
+            self._sort_orders[sort_method] = SortOrder(self.mods, *AVAILABLE_SORTS[sort_method])
+        return self._sort_orders[sort_method]
+
+    # a view already in sort order, picking from it keeps that order without sorting again :3
+    def sorted_view(self, sort_method, show_nsfw, show_deprecated):
+        view = self.view(show_nsfw, show_deprecated)
+        order = self.sort_order(sort_method)
+        if order is None:
+            return view
+        key = (sort_method, bool(show_nsfw), bool(show_deprecated))
+        if key not in self._sorted_views:
+            members = self._view_members[key[1:]]
+            self._sorted_views[key] = [mod for mod in order.mods if id(mod) in members]
+        return self._sorted_views[key]
+
+    # built once by the catalog loader on its worker thread, after the last batch is in :3
+    def build_search_index(self):
+        self._search_index = ModSearchIndex(self.mods)
+        return self._search_index
+
+    # False when the last search fell back to typo matching :3
+    @property
+    def last_exact(self):
+        return self._search_index is None or self._search_index.last_exact
+
+    # ranked search limited to the mods visible in a view, a plain scan until the index is built :3
+    def search(self, query, show_nsfw, show_deprecated):
+        view = self.view(show_nsfw, show_deprecated)
+        if self._search_index is None:
+            terms = ModSearchIndex.normalize(query).split()
+            return [(mod, 0) for mod in view if ModSearchIndex.matches(mod, terms)]
+        members = self._view_members[(bool(show_nsfw), bool(show_deprecated))]
+        return [(mod, score) for mod, score in self._search_index.search(query) if id(mod) in members]
+
+    def _build_view(self, show_nsfw, show_deprecated):
+        # track mods by name to detect duplicates :3
+        mod_map = {}
+
+        for mod_info in self.mods:
+            is_deprecated = mod_info.get('is_deprecated', False)
+            is_nsfw = mod_info.get('has_nsfw_content', False)
+
+            # skip if mod is hidden in this view :3
+            if (is_deprecated and not show_deprecated) or (is_nsfw and not show_nsfw):
+                continue
+
+            # handle duplicates :3
+            name = mod_info['title']
+            if name in mod_map:
+                existing = mod_map[name]
+
+                # keep non-deprecated version if available :3
+                if existing['is_deprecated'] and not is_deprecated:
+                    mod_map[name] = mod_info
+                # if both non-deprecated or both deprecated, keep most recently updated :3
+                elif existing['is_deprecated'] == is_deprecated:
+                    if mod_info['date_updated'] > existing['date_updated']:
+                        mod_map[name] = mod_info
+            else:
+                mod_map[name] = mod_info
+
+        return list(mod_map.values())
+
+SEARCH_DEBOUNCE_MS = 150
+
+# sort methods for the mod lists as (key, reverse), each is turned into a presorted order once per snapshot :3
+AVAILABLE_SORTS = {
+    "Last Updated": (lambda mod: mod.get('date_updated') or mod.get('updated_on') or '', True),
+    "Most Downloads": (lambda mod: mod.get('downloads', 0), True),
+    "Most Likes": (lambda mod: mod.get('likes', 0), True),
+    "Name (A-Z)": (lambda mod: mod.get('title', '').lower(), False),
+    "Name (Z-A)": (lambda mod: mod.get('title', '').lower(), True)
+}
+INSTALLED_SORTS = {
+    "Name (A-Z)": (lambda mod: mod['title'].replace('_', ' ').lower(), False),
+    "Name (Z-A)": (lambda mod: mod['title'].replace('_', ' ').lower(), True)
+}
+
+# mods presorted for one sort method, rank gives a mod's (by identity) position in that order :3
+# sorted() works out each key once, so names are only normalized once per snapshot :3
+class SortOrder:
+    def __init__(self, mods, key, reverse=False):
+        self.mods = sorted(mods, key=key, reverse=reverse)
+        self.rank = {id(mod): position for position, mod in enumerate(self.mods)}
+
+# listbox look-alike that only draws the rows in view and recycles them while scrolling :3
+# rows are (key, text) pairs and the selection follows keys, so filtering or re-sorting keeps it on the same mods :3
+# it answers the listbox calls the rest of the ui makes (get, curselection, nearest, selection_set, yview...) :3
+class VirtualListView(tk.Canvas):
+    def __init__(self, master, width=30, height=15, selectmode=tk.BROWSE, **kwargs):
+        self.font = font.nametofont('TkDefaultFont')
+        self.row_height = self.font.metrics('linespace') + 2
+        super().__init__(master, width=width * self.font.measure('0'), height=height * self.row_height,
+                         highlightthickness=0, takefocus=1, bg='white', **kwargs)
+        self.selectmode = selectmode
+        self.colors = {'fg': 'black', 'bg': 'white', 'selectbackground': '#0078D7', 'selectforeground': 'white'}
+        self.yscrollcommand = None
+        self.items = []
+        self.positions = {}
+        self.selected = set()
+        self.anchor = None
+        self.top = 0
+        self.pool = []
+
+        self.bind('<Configure>', lambda e: self.redraw())
+        self.bind('<Button-1>', self._on_click)
+        self.bind('<Control-Button-1>', self._on_toggle_click)
+        self.bind('<Shift-Button-1>', self._on_range_click)
+        self.bind('<B1-Motion>', self._on_range_click)
+        self.bind('<Up>', lambda e: self._on_arrow(-1))
+        self.bind('<Down>', lambda e: self._on_arrow(1))
+        self.bind('<MouseWheel>', lambda e: self.yview('scroll', -1 if e.delta > 0 else 1, 'units'))
+        self.bind('<Button-4>', lambda e: self.yview('scroll', -1, 'units'))
+        self.bind('<Button-5>', lambda e: self.yview('scroll', 1, 'units'))
+
+    # listbox style options are kept here, the rest goes to the canvas :3
+    def configure(self, cnf=None, **kwargs):
+        kwargs.update(cnf or {})
+        aliases = {'foreground': 'fg', 'background': 'bg'}
+        for option in list(kwargs):
+            name = aliases.get(option, option)
+            if name in self.colors:
+                self.colors[name] = kwargs[option]
+                if name != 'bg':
+                    del kwargs[option]
+            elif name == 'yscrollcommand':
+                self.yscrollcommand = kwargs.pop(option)
+        if kwargs:
+            super().configure(**kwargs)
+        self.redraw()
+
+    config = configure
+
+    # the result list the view is showing, it starts scrolled to the top like a refilled listbox :3
+    def set_items(self, items):
+        self.top = 0
+        self._replace_items(items)
+
+    def _replace_items(self, items):
+        self.items = list(items)
+        self.positions = {key: index for index, (key, text) in enumerate(self.items)}
+        # selections of rows that went away are dropped, like a listbox would :3
+        self.selected.intersection_update(self.positions)
+        if self.anchor is not None and self.anchor >= len(self.items):
+            self.anchor = None
+        self.redraw()
+
+    # adds rows at the end without touching the ones already there, for lists that grow while loading :3
+    def append_items(self, items):
+        for key, text in items:
+            self.positions[key] = len(self.items)
+            self.items.append((key, text))
+        self.redraw()
+
+    def update_item(self, key, text):
+        if key in self.positions:
+            self.items[self.positions[key]] = (key, text)
+            self.redraw()
+
+    def selected_keys(self):
+        return [self.items[index][0] for index in self.curselection()]
+
+    def _index(self, index, end_offset=0):
+        if index == tk.END:
+            return len(self.items) - 1 + end_offset
+        return int(index)
+
+    def _range(self, first, last=None):
+        first = self._index(first)
+        last = first if last is None else self._index(last)
+        return range(max(first, 0), min(last, len(self.items) - 1) + 1)
+
+    def size(self):
+        return len(self.items)
+
+    def get(self, first, last=None):
+        if last is None:
+            index = self._index(first)
+            return self.items[index][1] if 0 <= index < len(self.items) else ''
+        return tuple(self.items[index][1] for index in self._range(first, last))
+
+    def insert(self, index, *rows):
+        index = self._index(index, end_offset=1)
+        self._replace_items(self.items[:index] + [(row, row) for row in rows] + self.items[index:])
+
+    def delete(self, first, last=None):
+        doomed = self._range(first, last)
+        if doomed:
+            self._replace_items(self.items[:doomed.start] + self.items[doomed.stop:])
+
+    def curselection(self):
+        return tuple(sorted(self.positions[key] for key in self.selected if key in self.positions))
+
+    def selection_includes(self, index):
+        return 0 <= index < len(self.items) and self.items[index][0] in self.selected
+
+    def selection_set(self, first, last=None):
+        self.selected.update(self.items[index][0] for index in self._range(first, last))
+        self.redraw()
+
+    def selection_clear(self, first, last=None):
+        self.selected.difference_update(self.items[index][0] for index in self._range(first, last))
+        self.redraw()
+
+    def activate(self, index):
+        self.anchor = self._index(index)
+
+    def nearest(self, y):
+        if not self.items:
+            return -1
+        return min(self.top + max(int(y), 0) // self.row_height, len(self.items) - 1)
+
+    def _visible_rows(self):
+        return max(1, self.winfo_height() // self.row_height)
+
+    def see(self, index):
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self._visible_rows():
+            self.top = index - self._visible_rows() + 1
+        self.redraw()
+
+    def yview(self, *args):
+        if not args:
+            if not self.items:
+                return (0.0, 1.0)
+            return (self.top / len(self.items), min(1.0, (self.top + self._visible_rows()) / len(self.items)))
+        if args[0] == 'moveto':
+            self.top = int(float(args[1]) * len(self.items))
+        elif args[0] == 'scroll':
+            self.top += int(args[1]) * (self._visible_rows() if args[2] == 'pages' else 1)
+        self.redraw()
+
+    # only the rows in the viewport exist as canvas items, they get new text as the view scrolls :3
+    def redraw(self):
+        visible = self._visible_rows() + 1
+        self.top = max(0, min(self.top, len(self.items) - self._visible_rows()))
+        width = self.winfo_width()
+
+        while len(self.pool) < visible:
+            self.pool.append((self.create_rectangle(0, 0, 0, 0, width=0),
+                              self.create_text(4, 0, anchor='nw', font=self.font)))
+
+        for slot, (rect, text) in enumerate(self.pool):
+            index = self.top + slot
+            if slot >= visible or index >= len(self.items):
+                self.itemconfigure(rect, state='hidden')
+                self.itemconfigure(text, state='hidden')
+                continue
+            key, row = self.items[index]
+            selected = key in self.selected
+            y = slot * self.row_height
+            self.coords(rect, 0, y, width, y + self.row_height)
+            self.itemconfigure(rect, state='normal', fill=self.colors['selectbackground'] if selected else self.colors['bg'])
+            self.coords(text, 4, y + 1)
+            self.itemconfigure(text, state='normal', text=row,
+                               fill=self.colors['selectforeground'] if selected else self.colors['fg'])
+
+        if self.yscrollcommand:
+            self.yscrollcommand(*self.yview())
+
+    def _selection_changed(self):
+        self.redraw()
+        self.event_generate('<<ListboxSelect>>')
+
+    def _on_click(self, event):
+        self.focus_set()
+        index = self.nearest(event.y)
+        if index == -1:
+            return
+        if self.selectmode == tk.MULTIPLE:
+            self.selected.symmetric_difference_update({self.items[index][0]})
+        else:
+            self.selected = {self.items[index][0]}
+        self.anchor = index
+        self._selection_changed()
+
+    def _on_toggle_click(self, event):
+        if self.selectmode != tk.EXTENDED:
+            return self._on_click(event)
+        index = self.nearest(event.y)
+        if index == -1:
+            return
+        self.selected.symmetric_difference_update({self.items[index][0]})
+        self.anchor = index
+        self._selection_changed()
+
+    def _on_range_click(self, event):
+        if self.selectmode != tk.EXTENDED or self.anchor is None:
+            return self._on_click(event)
+        index = self.nearest(event.y)
+        if index == -1:
+            return
+        first, last = sorted((self.anchor, index))
+        self.selected = {self.items[i][0] for i in range(first, last + 1)}
+        self._selection_changed()
+
+    def _on_arrow(self, step):
+        if not self.items:
+            return
+        index = 0 if self.anchor is None else max(0, min(self.anchor + step, len(self.items) - 1))
+        self.selected = {self.items[index][0]}
+        self.anchor = index
+        self.see(index)
+        self._selection_changed()
+
+# hash indexes over one list of mods, first mod wins when two share a key just like next(...) did :3
+class ModIndex:
+    def __init__(self, mods=None):
+        # every mod by identity in the order it was added, so removing one doesn't shift a list :3
+        self._members = {}
+        # the keys each mod was indexed under when it was added, remove uses these even if the mod changed since :3
+        self._member_keys = {}
+        # bumped on every add/remove so cached filter results, sort orders and names know when they're stale :3
+        self.version = 0
+        self._derived = {}
+        self.by_id = {}
+        self.by_thunderstore_id = {}
+        self.by_title = {}
+        self.by_name = {}
+        # mod_key() of each mod, so a third-party mod and a thunderstore one with the same id are told apart :3
+        self.by_key = {}
+        # every mod sharing a key in add order, the first one is the one the by_ lookups hand out :3
+        self._sharing = ({}, {}, {}, {}, {})
+        for mod in mods or []:
+            self.add(mod)
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, mod):
+        return id(mod) in self._members
+
+    # the mods in the order they were added, the list is only rebuilt when something was removed :3
+    @property
+    def mods(self):
+        version, mods = self._derived.get('mods', (None, None))
+        if version != self.version:
+            mods = list(self._members.values())
+            self._derived['mods'] = (self.version, mods)
+        return mods
+
+    # by_name matches the backend name used by the listboxes, by_title also ignores case :3
+    @staticmethod
+    def name_key(title):
+        return title.strip().replace(' ', '_')
+
+    @staticmethod
+    def title_key(title):
+        return ModIndex.name_key(title).lower()
+
+    @staticmethod
+    def _keys(mod):
+        title = mod.get('title') or ''
+        return (mod.get('id'), mod.get('thunderstore_id'), ModIndex.title_key(title), ModIndex.name_key(title),
+                mod_key(mod) if mod.get('id') else None)
+
+    def add(self, mod):
+        if mod in self:
+            return
+        version, mods = self._derived.get('mods', (None, None))
+        self._members[id(mod)] = mod
+        self._member_keys[id(mod)] = keys = self._keys(mod)
+        self.version += 1
+        # a list that was current only needs the new mod on the end :3
+        if version == self.version - 1:
+            mods.append(mod)
+            self._derived['mods'] = (self.version, mods)
+        self._index(mod, keys)
+
+    def _indexes(self):
+        return (self.by_id, self.by_thunderstore_id, self.by_title, self.by_name, self.by_key)
+
+    # mods in the order of an INSTALLED_SORTS method, rebuilt only after the list changes :3
+    def sorted_mods(self, sort_method):
+        if sort_method not in INSTALLED_SORTS:
+            return self.mods
+        version, order = self._derived.get(sort_method, (None, None))
+        if version != self.version:
+            order = SortOrder(self.mods, *INSTALLED_SORTS[sort_method])
+            self._derived[sort_method] = (self.version, order)
+        return order.mods
+
+    # lowercased display names for the installed search box, worked out once per version :3
+    def display_names(self):
+        version, names = self._derived.get('display_names', (None, None))
+        if version != self.version:
+            names = {id(mod): mod['title'].replace('_', ' ').lower() for mod in self.mods}
+            self._derived['display_names'] = (self.version, names)
+        return names
+
+    # every mod whose title matches once case and spaces are ignored, not just the first one :3
+    def with_title(self, title):
+        return list(self._sharing[2].get(self.title_key(title), ()))
+
+    def _index(self, mod, keys):
+        for index, sharing, key in zip(self._indexes(), self._sharing, keys):
+            if key:
+                sharing.setdefault(key, []).append(mod)
+                index.setdefault(key, mod)
+
+    # only touches the mods sharing a key with the removed one, not the whole list :3
+    def remove(self, mod):
+        if self._members.pop(id(mod), None) is None:
+            return
+        keys = self._member_keys.pop(id(mod))
+        self.version += 1
+        for index, sharing, key in zip(self._indexes(), self._sharing, keys):
+            if not key:
+                continue
+            sharing[key] = [m for m in sharing[key] if m is not mod]
+            # a mod shadowed by the removed one gets the key back :3
+            if sharing[key]:
+                index[key] = sharing[key][0]
+            else:
+                del sharing[key]
+                del index[key]
+
+# owns the available (thunderstore) and installed mod lists and keeps them indexed :3
+# everything that adds or removes mods goes through here so the indexes never go stale :3
+class ModRegistry:
+    def __init__(self):
+        self.available = ModIndex()
+        self.installed = ModIndex()
+
+    def set_available(self, mods):
+        self.available = ModIndex(mods)
+
+    def set_installed(self, mods):
+        self.installed = ModIndex(mods)
+
+    # adds a freshly installed mod, replacing an older entry with the same id :3
+    def add_installed(self, mod):
+        if existing := self.installed.by_id.get(mod.get('id')):
+            self.installed.remove(existing)
+        self.installed.add(mod)
+
+    def remove_installed(self, mod):
+        if mod not in self.installed:
+            mod = self.installed.by_id.get(mod.get('id'))
+        if mod is not None:
+            self.installed.remove(mod)
+
+    def available_by_id(self, mod_id):
+        return self.available.by_id.get(mod_id)
+
+    def available_by_thunderstore_id(self, thunderstore_id):
+        return self.available.by_thunderstore_id.get(thunderstore_id)
+
+    def available_by_title(self, title):
+        return self.available.by_title.get(ModIndex.title_key(title))
+
+    def available_with_title(self, title):
+        return self.available.with_title(title)
+
+    def available_by_name(self, backend_title):
+        return self.available.by_name.get(ModIndex.name_key(backend_title))
+
+    def installed_by_id(self, mod_id):
+        return self.installed.by_id.get(mod_id)
+
+    def installed_by_key(self, key):
+        return self.installed.by_key.get(key)
+
+    def installed_by_thunderstore_id(self, thunderstore_id):
+        return self.installed.by_thunderstore_id.get(thunderstore_id)
+
+    def installed_by_title(self, title):
+        return self.installed.by_title.get(ModIndex.title_key(title))
+
+    def installed_with_title(self, title):
+        return self.installed.with_title(title)
+
+    def installed_by_name(self, backend_title):
+        return self.installed.by_name.get(ModIndex.name_key(backend_title))
+
+# writes json to a temp file next to path, fsyncs it and swaps it in so a crash never leaves half a file :3
+def write_json_atomic(path, data, **dump_kwargs):
+    write_text_atomic(path, json.dumps(data, **dump_kwargs))
+
+def write_text_atomic(path, text):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# collects json files that need saving and writes each one once per window (or once per batch) :3
+# producers are called at flush time so the newest state is what lands on disk :3
+class JsonWriter:
+    def __init__(self, delay=0.5):
+        self.delay = delay
+        self.lock = threading.RLock()
+        self.pending = {}
+        self.batch_depth = 0
+        self.timer = None
+        self.writes = 0
+        # one flush at a time (timer and shutdown), so an older snapshot can never land after a newer one :3
+        self.flush_lock = threading.Lock()
+        self.writing = set()
+
+    # marks path dirty, producer returns the data to dump :3
+    def mark(self, path, producer, **dump_kwargs):
+        with self.lock:
+            self.pending[path] = (producer, dump_kwargs)
+            if not self.batch_depth:
+                self._schedule()
+
+    def _schedule(self):
+        if self.timer is None:
+            self.timer = threading.Timer(self.delay, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    # marked but not on disk yet, including writes in flight :3
+    def is_pending(self, path):
+        with self.lock:
+            return path in self.pending or path in self.writing
+
+    # drops pending writes for path and anything under it, for folders that are about to be deleted :3
+    def discard(self, path):
+        prefix = os.path.join(path, '')
+        with self.lock:
+            for pending_path in [p for p in self.pending if p == path or p.startswith(prefix)]:
+                del self.pending[pending_path]
+
+    # holds every write back until the outermost batch ends :3
+    @contextlib.contextmanager
+    def batch(self):
+        with self.lock:
+            self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.batch_depth -= 1
+                done = not self.batch_depth
+            if done:
+                self.flush()
+
+    # data is produced under the lock, the slow part (write + fsync) happens outside it so mark() never waits on disk :3
+    # anything that fails goes back into pending for the next flush instead of being dropped :3
+    def flush(self):
+        with self.flush_lock:
+            snapshots = []
+            with self.lock:
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+                pending, self.pending = self.pending, {}
+                for path, (producer, dump_kwargs) in pending.items():
+                    try:
+                        snapshots.append((path, json.dumps(producer(), **dump_kwargs), (producer, dump_kwargs)))
+                    except Exception as e:
+                        logging.error(f"Failed to prepare {path}: {str(e)}")
+                        self._requeue(path, producer, dump_kwargs)
+                self.writing = {path for path, _, _ in snapshots}
+
+            for path, text, (producer, dump_kwargs) in snapshots:
+                try:
+                    write_text_atomic(path, text)
+                    self.writes += 1
+                except Exception as e:
+                    logging.error(f"Failed to write {path}: {str(e)}")
+                    with self.lock:
+                        self._requeue(path, producer, dump_kwargs)
+            with self.lock:
+                self.writing = set()
+
+    # a newer mark() for the same path wins over the failed one :3
+    def _requeue(self, path, producer, dump_kwargs):
+        if path not in self.pending:
+            self.pending[path] = (producer, dump_kwargs)
+            if not self.batch_depth:
+                self._schedule()
+
+# what one startup scan saw: hls mod folders with their mod_info.json and game mod folders with their manifest.json :3
+class ScanSnapshot:
+    def __init__(self):
+        self.mod_folders = {}
+        self.game_mods = {}
+        self.game_files = []
+        self.changed = set()
+        self.parsed = 0
+
+# walks mods_dir, mods_dir/3rd_party and GDWeave/Mods with os.scandir once :3
+# json files are only parsed again when their size or mtime moved since the last scan, on a small pool :3
+class StartupScanner:
+    def __init__(self, cache_path, writer=None, max_workers=4):
+        self.cache_path = cache_path
+        self.writer = writer
+        self.max_workers = max_workers
+        self.cache = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to read startup scan cache: {str(e)}")
+            return {}
+
+    def _save(self):
+        cache = dict(self.cache)
+        if self.writer:
+            self.writer.mark(self.cache_path, lambda: cache)
+        else:
+            write_json_atomic(self.cache_path, cache)
+
+    @staticmethod
+    def _directories(path):
+        dirs, files = [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    (dirs if entry.is_dir() else files).append(entry.name)
+        except FileNotFoundError:
+            pass
+        return dirs, files
+
+    @staticmethod
+    def _parse(path):
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to read {path}: {str(e)}")
+            return None
+
+    # returns {json path: parsed data or None}, reusing cached data for files whose fingerprint didn't change :3
+    def _read_all(self, paths, snapshot):
+        results = {}
+        cache = {}
+        stale = []
+        for path in paths:
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                results[path] = None
+                continue
+            fingerprint = [info.st_mtime_ns, info.st_size]
+            cached = self.cache.get(path)
+            if cached and cached[:2] == fingerprint:
+                results[path] = cached[2]
+                cache[path] = cached
+            else:
+                stale.append((path, fingerprint))
+
+        if stale:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                parsed = pool.map(self._parse, [path for path, _ in stale])
+                for (path, fingerprint), data in zip(stale, parsed):
+                    results[path] = data
+                    if data is not None:
+                        cache[path] = fingerprint + [data]
+                    snapshot.changed.add(path)
+            snapshot.parsed += len(stale)
+        return results, cache
+
+    def scan(self, mods_dir=None, game_mods_path=None):
+        start = time.time()
+        snapshot = ScanSnapshot()
+        mod_paths = {}
+        if mods_dir:
+            dirs, _ = self._directories(mods_dir)
+            for name in dirs:
+                if name == InstalledModsStore.THIRD_PARTY:
+                    third_party_dirs, _ = self._directories(os.path.join(mods_dir, name))
+                    for sub in third_party_dirs:
+                        mod_paths[f"{name}/{sub}"] = os.path.join(mods_dir, name, sub, 'mod_info.json')
+                else:
+                    mod_paths[name] = os.path.join(mods_dir, name, 'mod_info.json')
+
+        game_paths = {}
+        if game_mods_path:
+            dirs, snapshot.game_files = self._directories(game_mods_path)
+            game_paths = {name: os.path.join(game_mods_path, name, 'manifest.json') for name in dirs}
+
+        results, cache = self._read_all(list(mod_paths.values()) + list(game_paths.values()), snapshot)
+        snapshot.mod_folders = {folder: results[path] for folder, path in mod_paths.items()}
+        snapshot.game_mods = {name: results[path] for name, path in game_paths.items()}
+
+        # only what this scan covered is replaced, a scan of just the game folder keeps the mods_dir entries :3
+        roots = [os.path.join(root, '') for root in (mods_dir, game_mods_path) if root]
+        self.cache = {path: entry for path, entry in self.cache.items() if not any(path.startswith(root) for root in roots)}
+        self.cache.update(cache)
+        if snapshot.changed or len(cache) != len(results):
+            self._save()
+        logging.info(
+            f"Startup scan: {len(mod_paths)} mod folder(s), {len(game_paths)} game mod folder(s), "
+            f"{snapshot.parsed} file(s) parsed in {time.time() - start:.3f}s"
+        )
+        return snapshot
+
+# inotify flags from <sys/inotify.h> :3
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+INOTIFY_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+
+# how long a folder dropped into GDWeave/Mods has to sit unchanged before it gets adopted :3
+ADOPTION_SETTLE_MS = 2000
+
+# (file count, total size, newest mtime) of everything under path, cheap enough for one mod folder :3
+def folder_fingerprint(path):
+    count = size = newest = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                info = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            count += 1
+            size += info.st_size
+            newest = max(newest, info.st_mtime_ns)
+    return count, size, newest
+
+# watches a few folders one level deep and hands (kind, root, name) events to callback in settled batches :3
+# kind is 'added', 'removed' or 'modified' for the top-level entry name under root, or 'rescan' when events got lost :3
+# uses inotify on linux and polls with os.scandir everywhere else :3
+class FileWatcher:
+    def __init__(self, roots, callback, interval=2.0, settle=0.3, max_wait=2.0):
+        self.roots = self.unique_roots(roots)
+        self.callback = callback
+        self.interval = interval
+        self.settle = settle
+        self.max_wait = max_wait
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.backend = 'inotify' if self._inotify_available() else 'poll'
+
+    @staticmethod
+    def unique_roots(roots):
+        return [root for root in dict.fromkeys(roots) if root]
+
+    @staticmethod
+    def _inotify_available():
+        if not sys.platform.startswith('linux'):
+            return False
+        try:
+            return hasattr(ctypes.CDLL(None), 'inotify_init1')
+        except OSError:
+            return False
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        logging.info(f"Watching {len(self.roots)} folder(s) for changes using {self.backend}")
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _run(self):
+        try:
+            if self.backend == 'inotify':
+                self._run_inotify()
+            else:
+                self._run_poll()
+        except Exception as e:
+            logging.error(f"File watcher stopped: {str(e)}")
+
+    def _emit(self, events):
+        if events and not self.stop_event.is_set():
+            self.callback(sorted(events, key=lambda event: (event[0], event[1] or '', event[2] or '')))
+
+    def _run_inotify(self):
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(IN_CLOEXEC)
+        if fd < 0:
+            logging.error(f"inotify_init1 failed ({ctypes.get_errno()}), falling back to polling")
+            self.backend = 'poll'
+            return self._run_poll()
+
+        watches = {}
+        missing = list(self.roots)
+
+        def add_watch(path, root, child):
+            wd = libc.inotify_add_watch(fd, os.fsencode(path), INOTIFY_MASK)
+            if wd >= 0:
+                watches[wd] = (root, child)
+            return wd >= 0
+
+        # children that are roots themselves get their own watch instead :3
+        def watch_children(root):
+            dirs, _ = StartupScanner._directories(root)
+            for name in dirs:
+                path = os.path.join(root, name)
+                if path not in self.roots:
+                    add_watch(path, root, name)
+
+        pending = set()
+        first_pending = None
+        first_pass = True
+        try:
+            while not self.stop_event.is_set():
+                # roots that don't exist yet (or were deleted) are retried every interval :3
+                for root in list(missing):
+                    if add_watch(root, root, None):
+                        missing.remove(root)
+                        watch_children(root)
+                        if not first_pass:
+                            dirs, files = StartupScanner._directories(root)
+                            pending.update(('added', root, name) for name in dirs + files)
+                            first_pending = first_pending or time.time()
+                first_pass = False
+
+                # events are held until things go quiet for a moment, or max_wait passes during a long burst :3
+                ready, _, _ = select.select([fd], [], [], self.settle if pending else self.interval)
+                if ready:
+                    events = self._parse_inotify(os.read(fd, 65536), watches, add_watch, missing)
+                    if events and not pending:
+                        first_pending = time.time()
+                    pending.update(events)
+                    if not pending or time.time() - first_pending < self.max_wait:
+                        continue
+                self._emit(pending)
+                pending = set()
+                first_pending = None
+        finally:
+            os.close(fd)
+
+    def _parse_inotify(self, data, watches, add_watch, missing):
+        events = set()
+        offset = 0
+        while offset + 16 <= len(data):
+            wd, mask, _, length = struct.unpack_from('iIII', data, offset)
+            name = os.fsdecode(data[offset + 16:offset + 16 + length].rstrip(b'\0'))
+            offset += 16 + length
+            if mask & IN_Q_OVERFLOW:
+                events.add(('rescan', None, None))
+                continue
+            if wd not in watches:
+                continue
+            root, child = watches[wd]
+            if mask & IN_IGNORED:
+                del watches[wd]
+                if child is None:
+                    missing.append(root)
+                continue
+            if child is not None:
+                # something inside a mod folder changed, report the folder itself :3
+                events.add(('modified', root, child))
+            elif not name:
+                continue
+            elif mask & (IN_CREATE | IN_MOVED_TO):
+                events.add(('added', root, name))
+                path = os.path.join(root, name)
+                if mask & IN_ISDIR and path not in self.roots:
+                    add_watch(path, root, name)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                events.add(('removed', root, name))
+            else:
+                events.add(('modified', root, name))
+        return events
+
+    # {name: fingerprint} for a root, folders are fingerprinted by their direct children :3
+    # previous is the last state of the same root, folders whose own mtime hasn't moved keep their listing from it
+    # so an idle poll only lists the folders that actually changed :3
+    def _poll_state(self, root, previous=None):
+        previous = previous or {}
+        state = {}
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if entry.path in self.roots:
+                                continue
+                            mtime = entry.stat().st_mtime_ns
+                            last = previous.get(entry.name)
+                            if last and last[0] == 'dir' and last[1] == mtime:
+                                state[entry.name] = last
+                                continue
+                            listing = []
+                            with os.scandir(entry.path) as children:
+                                for child in children:
+                                    info = child.stat()
+                                    listing.append((child.name, info.st_mtime_ns, info.st_size))
+                            state[entry.name] = ('dir', mtime, tuple(sorted(listing)))
+                        else:
+                            info = entry.stat()
+                            state[entry.name] = (info.st_mtime_ns, info.st_size)
+                    except OSError:
+                        continue
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return state
+
+    def _run_poll(self):
+        states = {root: self._poll_state(root) for root in self.roots}
+        while not self.stop_event.wait(self.interval):
+            events = set()
+            for root in self.roots:
+                old = states[root]
+                new = self._poll_state(root, old)
+                events.update(('added', root, name) for name in new.keys() - old.keys())
+                events.update(('removed', root, name) for name in old.keys() - new.keys())
+                events.update(('modified', root, name) for name in new.keys() & old.keys() if new[name] != old[name])
+                states[root] = new
+            self._emit(events)
+
+# every installed mod's metadata in one sqlite file under app data, keyed by the folder it lives in :3
+# the per-folder mod_info.json files are kept up to date as a mirror and are what the database gets rebuilt from :3
+class InstalledModsStore:
+    THIRD_PARTY = "3rd_party"
+
+    def __init__(self, db_path, mods_dir, writer=None):
+        self.db_path = db_path
+        self.mods_dir = mods_dir
+        self.writer = writer
+        self.lock = threading.RLock()
+        self.connection = None
+        self._open()
+
+    def _open(self):
+        try:
+            self.connection = self._connect()
+            built = self.connection.execute("SELECT value FROM meta WHERE key = 'built'").fetchone()
+        except sqlite3.DatabaseError as e:
+            # a broken database is only a cache of the mirrors, move it aside and start over :3
+            logging.error(f"Installed mods database is unreadable, rebuilding from mod_info.json files: {str(e)}")
+            if self.connection:
+                self.connection.close()
+            # the wal and shm files belong to the broken database, left behind they'd be replayed into the new one :3
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(f"{self.db_path}{suffix}"):
+                    os.replace(f"{self.db_path}{suffix}", f"{self.db_path}.corrupt{suffix}")
+            self.connection = self._connect()
+            built = None
+        if not built:
+            self.rebuild()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS mods ("
+            "folder TEXT PRIMARY KEY, id TEXT, thunderstore_id TEXT, third_party INTEGER, enabled INTEGER, data TEXT)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS mods_id ON mods (id)")
+        connection.execute("CREATE INDEX IF NOT EXISTS mods_thunderstore_id ON mods (thunderstore_id)")
+        connection.commit()
+        return connection
+
+    @classmethod
+    def folder_for(cls, mod):
+        return f"{cls.THIRD_PARTY}/{mod['id']}" if mod.get('third_party', False) else mod['id']
+
+    def path_for(self, folder):
+        return os.path.join(self.mods_dir, *folder.split('/'))
+
+    def _query(self, sql, params=()):
+        with self.lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def entries(self):
+        return [(folder, json.loads(data)) for folder, data in self._query("SELECT folder, data FROM mods ORDER BY folder")]
+
+    def mods(self):
+        return [json.loads(data) for data, in self._query("SELECT data FROM mods ORDER BY folder")]
+
+    def get(self, mod_id, third_party=None):
+        if third_party is None:
+            rows = self._query("SELECT data FROM mods WHERE id = ? ORDER BY third_party", (mod_id,))
+        else:
+            rows = self._query("SELECT data FROM mods WHERE id = ? AND third_party = ?", (mod_id, int(third_party)))
+        return json.loads(rows[0][0]) if rows else None
+
+    def by_thunderstore_id(self, thunderstore_id):
+        rows = self._query("SELECT data FROM mods WHERE thunderstore_id = ? AND third_party = 0", (thunderstore_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def has_folder(self, folder):
+        return bool(self._query("SELECT 1 FROM mods WHERE folder = ?", (folder,)))
+
+    @staticmethod
+    def _row(folder, mod):
+        return (folder, mod.get('id'), mod.get('thunderstore_id'), int(bool(mod.get('third_party', False))),
+                int(bool(mod.get('enabled', True))), json.dumps(mod))
+
+    # saves mods in one transaction and rewrites their mod_info.json mirrors :3
+    def put_many(self, mods, mirror=True):
+        rows = [self._row(self.folder_for(mod), mod) for mod in mods]
+        with self.lock, self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO mods VALUES (?, ?, ?, ?, ?, ?)", rows)
+        if mirror:
+            for mod in mods:
+                self.write_mirror(self.folder_for(mod), mod)
+
+    def put(self, mod, mirror=True):
+        self.put_many([mod], mirror)
+
+    def write_mirror(self, folder, mod):
+        mod_info_path = os.path.join(self.path_for(folder), 'mod_info.json')
+        if self.writer:
+            self.writer.mark(mod_info_path, lambda: mod, indent=2)
+        else:
+            write_json_atomic(mod_info_path, mod, indent=2)
+
+    def delete(self, mod):
+        self.delete_folder(self.folder_for(mod))
+
+    def delete_folder(self, folder):
+        if self.writer:
+            self.writer.discard(self.path_for(folder))
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM mods WHERE folder = ?", (folder,))
+
+    def clear(self):
+        if self.writer:
+            self.writer.discard(self.mods_dir)
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM mods")
+
+    # mod folders on disk, relative to mods_dir :3
+    def disk_folders(self):
+        folders = []
+        if not os.path.isdir(self.mods_dir):
+            return folders
+        for name in os.listdir(self.mods_dir):
+            if name == self.THIRD_PARTY:
+                third_party_dir = os.path.join(self.mods_dir, name)
+                folders.extend(f"{name}/{sub}" for sub in os.listdir(third_party_dir) if os.path.isdir(os.path.join(third_party_dir, sub)))
+            elif os.path.isdir(os.path.join(self.mods_dir, name)):
+                folders.append(name)
+        return folders
+
+    def _read_mirror(self, folder):
+        mod_info_path = os.path.join(self.path_for(folder), 'mod_info.json')
+        if not os.path.exists(mod_info_path):
+            return None
+        try:
+            with open(mod_info_path, 'r') as f:
+                mod_info = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to read {mod_info_path}: {str(e)}")
+            return None
+        return self._mirror(folder, mod_info)
+
+    def _mirror(self, folder, mod_info):
+        if mod_info is None:
+            return None
+        mod_info = dict(mod_info)
+        if folder.startswith(f"{self.THIRD_PARTY}/"):
+            mod_info['third_party'] = True
+        return mod_info
+
+    # picks up folders added or removed behind our back, only the differing ones get opened :3
+    # with a startup snapshot nothing is read here, and mirrors edited by hand since the last scan are picked up too :3
+    def sync_with_disk(self, snapshot=None):
+        known = {folder for folder, in self._query("SELECT folder FROM mods")}
+        if snapshot is None:
+            on_disk = set(self.disk_folders())
+            added = [(folder, mod) for folder in on_disk - known if (mod := self._read_mirror(folder)) is not None]
+        else:
+            on_disk = set(snapshot.mod_folders)
+            edited = {folder for folder in on_disk & known if os.path.join(self.path_for(folder), 'mod_info.json') in snapshot.changed}
+            added = [(folder, mod) for folder in (on_disk - known) | edited if (mod := self._mirror(folder, snapshot.mod_folders[folder])) is not None]
+        removed = known - on_disk
+        if added or removed:
+            with self.lock, self.connection:
+                self.connection.executemany("INSERT OR REPLACE INTO mods VALUES (?, ?, ?, ?, ?, ?)", [self._row(folder, mod) for folder, mod in added])
+                self.connection.executemany("DELETE FROM mods WHERE folder = ?", [(folder,) for folder in removed])
+            logging.info(f"Installed mods database synced with disk: {len(added)} added or updated, {len(removed)} removed")
+        return bool(added or removed)
+
+    # re-reads one folder's mirror after it changed on disk, returns (old, new) when the database had to follow :3
+    def refresh_folder(self, folder):
+        mod_info_path = os.path.join(self.path_for(folder), 'mod_info.json')
+        if self.writer and self.writer.is_pending(mod_info_path):
+            # our own save hasn't landed yet, the database is already newer than the file :3
+            return None
+        rows = self._query("SELECT data FROM mods WHERE folder = ?", (folder,))
+        old = json.loads(rows[0][0]) if rows else None
+        if not os.path.isdir(self.path_for(folder)):
+            new = None
+        else:
+            new = self._read_mirror(folder)
+            if new is None:
+                # a folder without a mirror is still being installed :3
+                return None
+        if new == old:
+            return None
+        with self.lock, self.connection:
+            if new is None:
+                self.connection.execute("DELETE FROM mods WHERE folder = ?", (folder,))
+            else:
+                self.connection.execute("INSERT OR REPLACE INTO mods VALUES (?, ?, ?, ?, ?, ?)", self._row(folder, new))
+        return old, new
+
+    # reloads everything from the mod_info.json mirrors :3
+    def rebuild(self):
+        rows = [self._row(folder, mod) for folder in self.disk_folders() if (mod := self._read_mirror(folder)) is not None]
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM mods")
+            self.connection.executemany("INSERT OR REPLACE INTO mods VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('built', ?)", (str(int(time.time())),))
+        logging.info(f"Rebuilt installed mods database from {len(rows)} mod_info.json file(s)")
+
+# dependencies that hls manages itself and never installs from the mod list :3
+CORE_DEPENDENCIES = ('NotNet-GDWeave', 'Pyoid-Hook_Line_and_Sinker')
+
+# splits a thunderstore dependency string (owner-name-version) into (thunderstore_id, version) :3
+def parse_dependency(dependency):
+    # gdweave manifests list plain mod ids instead, and those can have hyphens of their own,
+    # so only a trailing x.y.z counts as the version :3
+    head, _, tail = dependency.rpartition('-')
+    if head and re.fullmatch(r'\d+\.\d+\.\d+', tail):
+        return head, tail
+    return dependency, None
+
+# what a resolve pass found: mods to install in levels (each level only needs earlier ones) plus anything odd :3
+class DependencyPlan:
+    def __init__(self):
+        self.requested = []
+        self.levels = []
+        self.missing = []
+        self.conflicts = {}
+        # titles of each group of mods that depend on each other in a loop :3
+        self.cycles = []
+        # titles of mods outside any loop that still wait on one :3
+        self.blocked = []
+
+    # every mod in install order :3
+    def mods(self):
+        return [mod for level in self.levels for mod in level]
+
+    # mods pulled in only because something depends on them :3
+    def dependencies(self):
+        requested = {id(mod) for mod in self.requested}
+        return [mod for mod in self.mods() if id(mod) not in requested]
+
+# tarjan's algorithm limited to keys, components come out dependencies first :3
+def strongly_connected_components(keys, edges):
+    members = set(keys)
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    components = []
+    for root in keys:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges[root]))]
+        while work:
+            node, children = work[-1]
+            descended = False
+            for child in children:
+                if child not in members:
+                    continue
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(edges[child])))
+                    descended = True
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+# walks dependencies of dependencies through the mod registry's indexes in one pass :3
+# installed mods count as satisfied, core dependencies are skipped, cycles and version conflicts get reported :3
+class DependencyResolver:
+    def __init__(self, registry, excluded=CORE_DEPENDENCIES):
+        self.registry = registry
+        self.excluded = tuple(excluded)
+
+    @staticmethod
+    def _key(mod):
+        return mod.get('thunderstore_id') or mod['id']
+
+    def _lookup(self, dependency_id, lookups):
+        for lookup in lookups:
+            if mod := lookup(dependency_id):
+                return mod
+        return None
+
+    # include_requested=False leaves the requested mods themselves out of the levels :3
+    def resolve(self, mods, include_requested=True):
+        plan = DependencyPlan()
+        plan.requested = list(mods)
+        nodes = {}
+        edges = {}
+        wanted_versions = {}
+        queue = []
+
+        for mod in plan.requested:
+            if self._key(mod) not in nodes:
+                nodes[self._key(mod)] = mod
+                queue.append(mod)
+
+        while queue:
+            mod = queue.pop()
+            key = self._key(mod)
+            edges[key] = set()
+            for dependency in mod.get('dependencies', []):
+                dependency_id, dependency_version = parse_dependency(dependency)
+                if not dependency_id or dependency_id.startswith(self.excluded):
+                    continue
+                if dependency_version:
+                    wanted_versions.setdefault(dependency_id, {}).setdefault(dependency_version, []).append(mod['title'])
+                if self._lookup(dependency_id, (self.registry.installed_by_thunderstore_id, self.registry.installed_by_id)):
+                    continue
+
+                dependency_mod = self._lookup(dependency_id, (self.registry.available_by_thunderstore_id, self.registry.available_by_id))
+                if not dependency_mod:
+                    if dependency not in plan.missing:
+                        plan.missing.append(dependency)
+                    continue
+
+                dependency_key = self._key(dependency_mod)
+                edges[key].add(dependency_key)
+                if dependency_key not in nodes:
+                    nodes[dependency_key] = dependency_mod
+                    queue.append(dependency_mod)
+
+        plan.conflicts = {dependency_id: versions for dependency_id, versions in wanted_versions.items() if len(versions) > 1}
+
+        # kahn's algorithm, a level is every mod whose dependencies are all in earlier levels :3
+        remaining = {key: set(dependencies) for key, dependencies in edges.items()}
+        dependents = {}
+        for key, dependencies in edges.items():
+            for dependency_key in dependencies:
+                dependents.setdefault(dependency_key, []).append(key)
+        level = [key for key, dependencies in remaining.items() if not dependencies]
+        done = set()
+        while level:
+            plan.levels.append([nodes[key] for key in level])
+            done.update(level)
+            next_level = []
+            for key in level:
+                for dependent in dependents.get(key, []):
+                    remaining[dependent].discard(key)
+                    if not remaining[dependent] and dependent not in done:
+                        next_level.append(dependent)
+            level = next_level
+
+        # whatever is left waits on a loop somewhere. the loops themselves are reported as cycles and the mods
+        # that only depend on one as blocked, each group still goes in a level after what it depends on :3
+        leftover = [key for key in edges if key not in done]
+        first_level = len(plan.levels)
+        component_levels = {}
+        for component in strongly_connected_components(leftover, edges):
+            members = set(component)
+            if len(component) > 1 or component[0] in edges[component[0]]:
+                plan.cycles.append([nodes[key]['title'] for key in component])
+            else:
+                plan.blocked.append(nodes[component[0]]['title'])
+
+            level = max((component_levels[dependency_key] + 1 for key in component for dependency_key in edges[key]
+                         if dependency_key in component_levels and dependency_key not in members), default=0)
+            for key in component:
+                component_levels[key] = level
+            while len(plan.levels) <= first_level + level:
+                plan.levels.append([])
+            plan.levels[first_level + level].extend(nodes[key] for key in component)
+
+        if not include_requested:
+            requested = {id(mod) for mod in plan.requested}
+            plan.levels = [level for level in ([mod for mod in level if id(mod) not in requested] for level in plan.levels) if level]
+
+        return plan
+
+# keeps the last thunderstore package index on disk so the mod list doesn't have to wait for the network :3
+# the etag and last-modified headers are stored next to it so we can revalidate with conditional gets :3
+class CatalogStore:
+    def __init__(self, cache_dir, url=THUNDERSTORE_PACKAGE_INDEX_URL):
+        self.cache_dir = cache_dir
+        self.url = url
+        self.snapshot_path = os.path.join(cache_dir, 'package_index.json')
+        self.meta_path = os.path.join(cache_dir, 'package_index_meta.json')
+        self.lock = threading.Lock()
+        self.last_parse_stats = None
+        os.makedirs(cache_dir, exist_ok=True)
+        self.meta = self._load_meta()
+
+    def _load_meta(self):
+        try:
+            with open(self.meta_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_meta(self):
+        write_json_atomic(self.meta_path, self.meta, indent=2)
+
+    def has_snapshot(self):
+        return os.path.exists(self.snapshot_path)
+
+    # seconds since the snapshot was last confirmed fresh by thunderstore, None if we never fetched it :3
+    def age(self):
+        validated_at = self.meta.get('validated_at') or self.meta.get('fetched_at')
+        if not validated_at or not self.has_snapshot():
+            return None
+        return time.time() - validated_at
+
+    # how many packages the snapshot had last time we parsed it, None if we never did :3
+    def package_count(self):
+        return self.meta.get('package_count')
+
+    # returns compact mod records streamed from disk or None if there's no usable snapshot :3
+    def load_snapshot(self, on_batch=None):
+        if not self.has_snapshot():
+            return None
+        with self.lock:
+            try:
+                mods, stats = parse_thunderstore_index(self.snapshot_path, on_batch=on_batch)
+                self.last_parse_stats = stats
+                # remember the package count so the next load can show real progress :3
+                if self.meta.get('package_count') != stats['packages']:
+                    self.meta['package_count'] = stats['packages']
+                    self._save_meta()
+                return mods
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logging.error(f"Failed to read catalog snapshot, it will be refetched: {e}")
+                return None
+
+    # streams the snapshot looking for one package and returns it with its full version list :3
+    def find_package(self, thunderstore_id):
+        if not self.has_snapshot():
+            return None
+        with self.lock:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                for package in iter_json_array(f):
+                    if f"{package.get('owner')}-{package.get('name')}" == thunderstore_id:
+                        return package
+        return None
+
+    # conditional get against thunderstore, returns True if a new snapshot was written :3
+    def revalidate(self, timeout=30):
+        headers = {}
+        if self.has_snapshot():
+            if etag := self.meta.get('etag'):
+                headers['If-None-Match'] = etag
+            if last_modified := self.meta.get('last_modified'):
+                headers['If-Modified-Since'] = last_modified
+
+        started = time.time()
+        with http_client.get(self.url, headers=headers, stream=True, timeout=timeout) as response:
+            if response.status_code == 304:
+                self.meta['validated_at'] = time.time()
+                self._save_meta()
+                logging.info(f"Catalog snapshot still fresh (304 in {time.time() - started:.2f}s)")
+                return False
+
+            response.raise_for_status()
+
+            # write to a temp file first so a dropped connection never leaves a half written snapshot :3
+            tmp_path = self.snapshot_path + '.tmp'
+            size = 0
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    if chunk:
+                        f.write(chunk)
+                        size += len(chunk)
+
+            with self.lock:
+                os.replace(tmp_path, self.snapshot_path)
+
+            now = time.time()
+            self.meta = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': now,
+                'validated_at': now,
+                'size': size
+            }
+            self._save_meta()
+            logging.info(f"Catalog snapshot updated ({size / 1024 / 1024:.1f}MB in {now - started:.2f}s)")
+            return True
+
+# version history per package, kept for a while so the version picker doesn't wait on anything :3
+# it comes from the catalog snapshot while that's fresh, otherwise from thunderstore's single package endpoint :3
+class VersionHistoryCache:
+    def __init__(self, catalog_store, ttl=900):
+        self.catalog_store = catalog_store
+        self.ttl = ttl
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def cached(self, thunderstore_id):
+        with self.lock:
+            entry = self.entries.get(thunderstore_id)
+        if entry and time.time() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def get(self, thunderstore_id, uuid4=None, timeout=15):
+        if (versions := self.cached(thunderstore_id)) is not None:
+            return versions
+
+        package = None
+        age = self.catalog_store.age()
+        if uuid4 and (age is None or age >= self.ttl):
+            # the snapshot is old, one package is a few kb instead of the whole index :3
+            try:
+                response = http_client.get(THUNDERSTORE_PACKAGE_URL.format(uuid4=uuid4), timeout=timeout)
+                response.raise_for_status()
+                package = response.json()
+            except (requests.RequestException, ValueError) as e:
+                logging.error(f"Failed to fetch versions for {thunderstore_id}, using the catalog snapshot: {str(e)}")
+
+        if package is None:
+            package = self.catalog_store.find_package(thunderstore_id)
+
+        versions = package.get('versions', []) if package else []
+        with self.lock:
+            self.entries[thunderstore_id] = (time.time(), versions)
+        return versions
+
+    # fills the cache on a background thread so opening the picker later is instant :3
+    def prewarm(self, thunderstore_id, uuid4=None):
+        if self.cached(thunderstore_id) is not None:
+            return
+
+        def warm():
+            try:
+                self.get(thunderstore_id, uuid4)
+            except Exception as e:
+                logging.info(f"Couldn't prewarm versions for {thunderstore_id}: {str(e)}")
+
+        threading.Thread(target=warm, daemon=True).start()
+
+# copy-on-write clone of a file, raises OSError when the filesystem (or platform) can't do it :3
+def reflink_file(source_path, destination_path):
+    if sys.platform.startswith('linux'):
+        import fcntl
+        FICLONE = 0x40049409
+        with open(source_path, 'rb') as source, open(destination_path, 'wb') as destination:
+            try:
+                fcntl.ioctl(destination.fileno(), FICLONE, source.fileno())
+            except OSError:
+                destination.close()
+                os.remove(destination_path)
+                raise
+    elif sys.platform == 'darwin':
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source_path), os.fsencode(destination_path), 0) != 0:
+            raise OSError(ctypes.get_errno(), "clonefile failed")
+    else:
+        raise OSError("reflinks aren't supported on this platform")
+    shutil.copystat(source_path, destination_path)
+
+# ways to get a file from the hls store into the game folder, cheapest first :3
+DEPLOY_STRATEGIES = {
+    'reflink': reflink_file,
+    'hardlink': os.link,
+    'symlink': os.symlink,
+    'copy': shutil.copy2,
+}
+
+# keeps mod folders in GDWeave/Mods in sync with the hls copies one file at a time :3
+# every deployed mod gets a manifest (relative path -> size, mtime, optional sha256) so an unchanged mod costs a stat pass, not a copy :3
+# files are reflinked, hardlinked or symlinked out of the store when the filesystems allow it (mode='auto'), copied otherwise :3
+class ModDeployer:
+    def __init__(self, state_dir, hash_files=False, mode='auto'):
+        self.state_dir = state_dir
+        self.hash_files = hash_files
+        self.mode = mode
+        # (source device, destination device) -> the strategy that worked there :3
+        self.strategies = {}
+        os.makedirs(state_dir, exist_ok=True)
+
+    def manifest_path(self, mod_id):
+        return os.path.join(self.state_dir, f"{mod_id}.json")
+
+    def load_manifest(self, mod_id, destination_dir):
+        try:
+            with open(self.manifest_path(mod_id), 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # a manifest for another game folder (or one that got wiped) says nothing about this one :3
+        if manifest.get('destination') != destination_dir or not os.path.isdir(destination_dir):
+            return None
+        return manifest
+
+    def save_manifest(self, mod_id, manifest):
+        with open(self.manifest_path(mod_id), 'w') as f:
+            json.dump(manifest, f)
+
+    @staticmethod
+    def snapshot(directory):
+        files = {}
+        for root, dirs, names in os.walk(directory):
+            for name in names:
+                path = os.path.join(root, name)
+                stats = os.stat(path)
+                files[os.path.relpath(path, directory).replace(os.sep, '/')] = (stats.st_size, stats.st_mtime_ns)
+        return files
+
+    # brings destination_dir in line with source_dir and returns what it had to do :3
+    def deploy(self, mod_id, source_dir, destination_dir):
+        result = {'added': 0, 'replaced': 0, 'deleted': 0, 'unchanged': 0}
+        source = self.snapshot(source_dir)
+        manifest = self.load_manifest(mod_id, destination_dir)
+
+        if manifest is None and os.path.exists(destination_dir):
+            # nothing recorded about what's there, start from a clean folder like before :3
+            shutil.rmtree(destination_dir)
+        os.makedirs(destination_dir, exist_ok=True)
+
+        recorded = manifest['files'] if manifest else {}
+        files = {}
+        for relative, (size, mtime) in source.items():
+            entry = recorded.get(relative)
+            source_path = os.path.join(source_dir, *relative.split('/'))
+            destination_path = os.path.join(destination_dir, *relative.split('/'))
+
+            if entry and self._unchanged(entry, size, mtime, source_path, destination_path):
+                entry.update(size=size, mtime=mtime)
+                files[relative] = entry
+                result['unchanged'] += 1
+                continue
+
+            existed = os.path.lexists(destination_path)
+            os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+            self.place_file(source_path, destination_path)
+            files[relative] = self._entry(size, mtime, source_path, destination_path)
+            result['replaced' if existed else 'added'] += 1
+
+        # only files we put there get removed, anything else in the folder is left alone :3
+        for relative in recorded.keys() - source.keys():
+            destination_path = os.path.join(destination_dir, *relative.split('/'))
+            if os.path.lexists(destination_path):
+                os.remove(destination_path)
+                result['deleted'] += 1
+        if result['deleted']:
+            self._prune_empty_dirs(destination_dir)
+        result['strategy'] = self.strategy_for(source_dir, destination_dir) or 'none'
+
+        self.save_manifest(mod_id, {'destination': destination_dir, 'files': files})
+        return result
+
+    def undeploy(self, mod_id, destination_dir):
+        if os.path.exists(destination_dir):
+            shutil.rmtree(destination_dir)
+        self.forget(mod_id)
+
+    def forget(self, mod_id):
+        if os.path.exists(self.manifest_path(mod_id)):
+            os.remove(self.manifest_path(mod_id))
+
+    # the strategy last used between these two folders, or None if nothing's been placed there yet :3
+    def strategy_for(self, source_dir, destination_dir):
+        try:
+            return self.strategies.get((os.stat(source_dir).st_dev, os.stat(destination_dir).st_dev))
+        except OSError:
+            return None
+
+    # links or copies through a temp name so a half written file never sits in the game folder :3
+    # the first strategy that works for a pair of devices is remembered and tried first from then on :3
+    def place_file(self, source_path, destination_path):
+        temp_path = f"{destination_path}.hls-tmp"
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+
+        devices = (os.stat(source_path).st_dev, os.stat(os.path.dirname(destination_path)).st_dev)
+        names = ['copy'] if self.mode == 'copy' else list(DEPLOY_STRATEGIES)
+        if (known := self.strategies.get(devices)) in names:
+            names.remove(known)
+            names.insert(0, known)
+
+        for name in names:
+            try:
+                DEPLOY_STRATEGIES[name](os.path.abspath(source_path), temp_path)
+            except (OSError, NotImplementedError) as e:
+                if name == 'copy':
+                    raise
+                continue
+            if self.strategies.get(devices) != name:
+                logging.info(f"Deploying mod files with {name} ({source_path} -> {os.path.dirname(destination_path)})")
+                self.strategies[devices] = name
+            break
+        os.replace(temp_path, destination_path)
+
+    def _entry(self, size, mtime, source_path, destination_path):
+        # stat follows symlinks, so a linked file reports its store copy :3
+        stats = os.stat(destination_path)
+        entry = {'size': size, 'mtime': mtime, 'deployed_mtime': stats.st_mtime_ns}
+        if self.hash_files:
+            entry['sha256'] = file_sha256(source_path)
+        return entry
+
+    def _unchanged(self, entry, size, mtime, source_path, destination_path):
+        try:
+            deployed = os.stat(destination_path)
+        except OSError:
+            return False
+        if deployed.st_size != size or deployed.st_mtime_ns != entry.get('deployed_mtime'):
+            return False
+        if entry['size'] == size and entry['mtime'] == mtime:
+            return True
+        # touched but maybe not changed, the hash settles it when we have one :3
+        return bool(entry.get('sha256')) and entry['size'] == size and file_sha256(source_path) == entry['sha256']
+
+    @staticmethod
+    def _prune_empty_dirs(directory):
+        for root, dirs, names in os.walk(directory, topdown=False):
+            if root != directory and not os.listdir(root):
+                os.rmdir(root)
+
+# installed mods are told apart by id and third_party, a third-party mod can share an id with a thunderstore one :3
+def mod_key(mod):
+    return mod['id'], mod.get('third_party', False)
+
+# the difference between the mods that should be enabled and what GDWeave/Mods actually holds :3
+# desired_keys are mod_key()s, deployed_ids are the folder names in GDWeave/Mods :3
+# only mods in scope are touched (all of them when scope is None), unmanaged folders are only pruned when asked to :3
+class ReconcilePlan:
+    def __init__(self, installed_mods, desired_keys, deployed_ids, prune_unmanaged=False, scope=None):
+        desired_keys = set(desired_keys)
+        deployed_ids = set(deployed_ids)
+        installed_keys = {mod_key(mod) for mod in installed_mods}
+        installed_ids = {mod['id'] for mod in installed_mods}
+        mods = installed_mods if scope is None else [mod for mod in installed_mods if mod_key(mod) in scope]
+
+        self.enable = [mod for mod in mods if mod_key(mod) in desired_keys and not mod.get('enabled', True)]
+        self.disable = [mod for mod in mods if mod_key(mod) not in desired_keys and mod.get('enabled', True)]
+        # already-enabled mods that are already deployed are left alone :3
+        self.deploy = [
+            mod for mod in mods
+            if mod_key(mod) in desired_keys and (mod['id'] not in deployed_ids or not mod.get('enabled', True))
+        ]
+        self.undeploy = [mod for mod in mods if mod_key(mod) not in desired_keys and mod['id'] in deployed_ids]
+        self.prune = sorted(deployed_ids - installed_ids) if prune_unmanaged else []
+        self.unknown = sorted(mod_id for mod_id, _ in desired_keys - installed_keys)
+
+    @property
+    def changed(self):
+        return self.enable + self.disable
+
+    def __bool__(self):
+        return bool(self.enable or self.disable or self.deploy or self.undeploy or self.prune)
+
+# thunderstore ids sometimes carry a trailing version, owner-name-1.2.3 :3
+VERSIONED_ID_PATTERN = re.compile(r'-\d+\.\d+\.\d+$')
+VERSION_NUMBERS_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)')
+
+# parsed once per version string for the whole session :3
+_parsed_versions = {}
+
+# parses a mod version with packaging, odd strings fall back to their first x.y.z and a missing one counts as 0.0.0 :3
+# manifests sometimes have numbers instead of strings, those are read as their text :3
+# pre-release tags are kept, so 1.0.0-beta sorts before 1.0.0 :3
+# None back means there's no version in there at all :3
+def parse_mod_version(value):
+    version_string = '' if value is None else str(value).strip()
+    if version_string not in _parsed_versions:
+        try:
+            parsed = version.parse(version_string or '0.0.0')
+        except (version.InvalidVersion, TypeError):
+            match = VERSION_NUMBERS_PATTERN.search(version_string)
+            parsed = version.Version('.'.join(match.groups())) if match else None
+        _parsed_versions[version_string] = parsed
+    return _parsed_versions[version_string]
+
+# which installed mods have a newer catalog version, joined by thunderstore id in one pass :3
+# every installed mod ends up in entries as (installed, available or None, reason) :3
+class UpdatePlan:
+    REASONS = ('update', 'up_to_date', 'newer_installed', 'blacklisted', 'not_in_catalog', 'no_thunderstore_id', 'invalid_version')
+
+    def __init__(self, installed_mods, registry, blacklisted_versions=None):
+        blacklisted = {
+            (thunderstore_id, blocked)
+            for thunderstore_id, versions in (blacklisted_versions or {}).items()
+            for blocked in versions
+        }
+        self.entries = []
+        for installed in installed_mods:
+            thunderstore_id = installed.get('thunderstore_id')
+            if not thunderstore_id:
+                self.entries.append((installed, None, 'no_thunderstore_id'))
+                continue
+            available = registry.available_by_thunderstore_id(VERSIONED_ID_PATTERN.sub('', thunderstore_id))
+            if available is None:
+                self.entries.append((installed, None, 'not_in_catalog'))
+            elif (thunderstore_id, available.get('version')) in blacklisted:
+                self.entries.append((installed, available, 'blacklisted'))
+            elif installed.get('version') == available.get('version'):
+                # the usual case, nothing to parse :3
+                self.entries.append((installed, available, 'up_to_date'))
+            else:
+                installed_version = parse_mod_version(installed.get('version'))
+                available_version = parse_mod_version(available.get('version'))
+                # one unreadable version skips just that mod instead of the whole check :3
+                if installed_version is None or available_version is None:
+                    reason = 'invalid_version'
+                elif available_version > installed_version:
+                    reason = 'update'
+                elif available_version < installed_version:
+                    reason = 'newer_installed'
+                else:
+                    reason = 'up_to_date'
+                self.entries.append((installed, available, reason))
+
+    @property
+    def updates(self):
+        return [(installed, available) for installed, available, reason in self.entries if reason == 'update']
+
+    def with_reason(self, reason):
+        return [installed for installed, _, entry_reason in self.entries if entry_reason == reason]
+
+    def summary(self):
+        counts = {reason: 0 for reason in self.REASONS}
+        for _, _, reason in self.entries:
+            counts[reason] += 1
+        return ', '.join(f"{count} {reason.replace('_', ' ')}" for reason, count in counts.items() if count)
+
+# raised inside an install job once it has been cancelled :3
+class JobCancelled(Exception):
+    pass
+
+# one mod going through the download manager :3
+class InstallJob:
+    STATES = ('queued', 'downloading', 'extracting', 'deploying', 'done', 'failed', 'cancelled')
+    FINISHED = ('done', 'failed', 'cancelled')
+
+    def __init__(self, mod, after=(), job_id=None):
+        self.id = job_id or uuid.uuid4().hex
+        self.mod = mod
+        self.after = list(after)
+        self.state = 'queued'
+        self.error = None
+        self.result = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def finished(self):
+        return self.state in self.FINISHED
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled(f"{self.mod['title']} was cancelled")
+
+    # (id, title, state, result, error) as of right now, the job itself keeps changing on its worker :3
+    def snapshot(self):
+        return (self.id, self.mod.get('title', self.mod.get('id')), self.state, self.result, self.error)
+
+# runs install jobs on a fixed number of workers instead of a thread per mod :3
+# jobs can wait on other jobs (dependency levels), and unfinished jobs are saved so they pick back up next launch :3
+class DownloadManager:
+    def __init__(self, worker, queue_path, max_workers=3):
+        self.worker = worker
+        self.queue_path = queue_path
+        self.max_workers = max_workers
+        self.jobs = {}
+        # finished jobs are dropped from jobs, only how they ended is kept for anything waiting on them :3
+        self.outcomes = {}
+        self.waiting = []
+        self.ready = queue.Queue()
+        self.subscribers = []
+        self.lock = threading.RLock()
+        self.threads = []
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def start(self):
+        for _ in range(self.max_workers):
+            thread = threading.Thread(target=self._work, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        self._restore()
+
+    # after is a list of jobs that have to finish first :3
+    # a mod that is already queued or installing gets its existing job back, two jobs would share one .part file :3
+    def submit(self, mod, after=()):
+        with self.lock:
+            if existing := self.job_for_mod(mod.get('id')):
+                logging.info(f"{mod.get('title')} is already being installed")
+                return existing
+            job = InstallJob(mod, [dependency.id for dependency in after])
+            self.jobs[job.id] = job
+            self._schedule(job)
+            self._save()
+        self._notify(job)
+        return job
+
+    def cancel(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if not job or job.finished:
+                return False
+            job.cancel_event.set()
+            # queued jobs stop right away, running ones at their next step :3
+            if job.state == 'queued':
+                self._finish(job, 'cancelled', error=f"{job.mod['title']} was cancelled")
+        return True
+
+    def cancel_all(self):
+        with self.lock:
+            job_ids = [job.id for job in self.jobs.values() if not job.finished]
+        for job_id in job_ids:
+            self.cancel(job_id)
+
+    def set_state(self, job, state):
+        job.check_cancelled()
+        job.state = state
+        self._notify(job)
+
+    def job_for_mod(self, mod_id):
+        with self.lock:
+            for job in self.jobs.values():
+                if not job.finished and job.mod.get('id') == mod_id:
+                    return job
+        return None
+
+    def active_jobs(self):
+        with self.lock:
+            return [job for job in self.jobs.values() if not job.finished]
+
+    def busy(self):
+        return bool(self.active_jobs())
+
+    def _state_of(self, job_id):
+        if job := self.jobs.get(job_id):
+            return job.state
+        return self.outcomes.get(job_id)
+
+    def _schedule(self, job):
+        blockers = [self._state_of(job_id) for job_id in job.after]
+        if any(state in ('failed', 'cancelled') for state in blockers):
+            self._finish(job, 'failed', error=f"{job.mod['title']} skipped, a dependency failed to install")
+        elif all(state is None or state == 'done' for state in blockers):
+            self.ready.put(job)
+        else:
+            self.waiting.append(job)
+
+    def _finish(self, job, state, result=None, error=None):
+        with self.lock:
+            job.state = state
+            job.result = result
+            job.error = error
+            self.jobs.pop(job.id, None)
+            self.outcomes[job.id] = state
+            if job in self.waiting:
+                self.waiting.remove(job)
+            # anything waiting on this job may be free to go (or doomed) now :3
+            waiting, self.waiting = self.waiting, []
+            for waiting_job in waiting:
+                self._schedule(waiting_job)
+            self._save()
+        self._notify(job)
+
+    def _work(self):
+        while True:
+            job = self.ready.get()
+            if job.finished:
+                continue
+            try:
+                job.check_cancelled()
+                result = self.worker(job)
+                self._finish(job, 'done', result=result)
+            except JobCancelled as e:
+                self._finish(job, 'cancelled', error=str(e))
+            except Exception as e:
+                self._finish(job, 'failed', error=str(e))
+
+    # subscribers get a snapshot, not the job, so a later state change can't rewrite what they were told :3
+    def _notify(self, job):
+        snapshot = job.snapshot()
+        for callback in self.subscribers:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logging.error(f"Download subscriber failed: {str(e)}")
+
+    def _save(self):
+        pending = [{'id': job.id, 'mod': job.mod, 'after': job.after} for job in self.jobs.values() if not job.finished]
+        try:
+            write_json_atomic(self.queue_path, pending, indent=2)
+        except (OSError, TypeError) as e:
+            logging.error(f"Failed to save download queue: {str(e)}")
+
+    def _restore(self):
+        if not os.path.exists(self.queue_path):
+            return
+        try:
+            with open(self.queue_path, 'r') as f:
+                pending = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to read download queue: {str(e)}")
+            return
+
+        if pending:
+            logging.info(f"Resuming {len(pending)} unfinished download(s)")
+        with self.lock:
+            jobs = [InstallJob(entry['mod'], entry.get('after', []), entry['id']) for entry in pending]
+            for job in jobs:
+                self.jobs[job.id] = job
+            for job in jobs:
+                self._schedule(job)
+        for job in jobs:
+            self._notify(job)
+
 # main class for the hook line sinker user interface :3
 class HookLineSinkerUI:
     def __init__(self, root):
@@ -124,6 +2621,15 @@ class HookLineSinkerUI:
         self.gui_queue = queue.Queue()
         self.gdweave_queue = queue.Queue()
         print("Queues initialized")
+
+        # started once the ui is up, see start_fs_watcher :3
+        self.fs_watcher = None
+        self.config_ids = None
+        self.pending_adoptions = {}
+
+        # settings, the mod cache and mod_info.json mirrors are written through here, flushed on exit too :3
+        self.json_writer = JsonWriter()
+        atexit.register(self.json_writer.flush)
         
         print("Loading settings...")
         self.load_settings()
@@ -219,10 +2725,55 @@ class HookLineSinkerUI:
         os.makedirs(self.mods_dir, exist_ok=True)
         print("Mod directories created")
 
+        # one pass over our mod folders and the game's, shared by the store sync and third-party adoption :3
+        self.startup_scanner = StartupScanner(os.path.join(self.app_data_dir, "startup_scan.json"), self.json_writer)
+        self.startup_snapshot = self.startup_scanner.scan(self.mods_dir, self.gdweave_mods_path())
+
+        # installed mod metadata lives in one database, mod_info.json files are its mirror :3
+        self.installed_store = InstalledModsStore(os.path.join(self.app_data_dir, "installed_mods.db"), self.mods_dir, self.json_writer)
+        self.installed_store.sync_with_disk(self.startup_snapshot)
+
+        # on-disk thunderstore catalog so startup doesn't wait on the full index download :3
+        self.catalog_store = CatalogStore(os.path.join(self.app_data_dir, "catalog"))
+        self.version_history = VersionHistoryCache(self.catalog_store)
+        self.catalog = ThunderstoreCatalog()
+        self.available_catalog = self.catalog
+        self.catalog_loading = False
+        self.catalog_batch_mods = []
+        self.catalog_progress = (0, None)
+        # how many batch mods the loading view already holds, plus the titles and categories it has seen :3
+        self.catalog_shown = 0
+        self.catalog_shown_titles = set()
+        self.catalog_shown_categories = set()
+        self.pending_update_check = False
+
+        # debounced search boxes and the last filter results they narrow down from :3
+        self.pending_filters = {}
+        self.available_filter_state = None
+        self.installed_filter_state = None
+
         print("Initializing mod lists...")
-        self.available_mods = []
-        self.installed_mods = []
+        self.mod_registry = ModRegistry()
+        self.dependency_resolver = DependencyResolver(self.mod_registry)
         print("Mod lists initialized")
+
+        # installs go through a small worker pool, unfinished ones resume on the next launch :3
+        self.downloads = DownloadManager(self.run_install_job, os.path.join(self.app_data_dir, "download_queue.json"))
+        self.downloads.subscribe(lambda update: self.gui_queue.put(('download_job', update)))
+        self.finished_job_ids = set()
+
+        # what was last deployed into GDWeave/Mods for each mod, so enabling only copies what changed :3
+        self.deployer = ModDeployer(
+            os.path.join(self.app_data_dir, "deployments"),
+            mode=self.settings.get('deploy_mode', 'auto')
+        )
+
+        # downloaded archives by thunderstore id + version, reinstalls come straight from disk :3
+        self.package_cache = PackageCache(
+            os.path.join(self.app_data_dir, "package_cache"),
+            max_bytes=self.settings.get('package_cache_mb', 1024) * 1024 * 1024
+        )
+        atexit.register(self.package_cache.flush)
         
         # mod category constants :3
         TOOLS = "Tools"
@@ -243,7 +2794,6 @@ class HookLineSinkerUI:
         self.last_installed_category = self.settings.get('installed_category', 'All')
 
         self.load_mod_cache()
-        self.mod_downloading = False
 
         # initialize attributes :3
         self.windowed_mode = tk.BooleanVar(value=self.settings.get('windowed_mode', True))
@@ -299,12 +2849,15 @@ class HookLineSinkerUI:
             self.shut_up_windef()
         self.show_analytics_prompt()
         self.check_for_duplicate_mods()
-        self.multi_mod_warning_shown = False
         self.send_ga_event("app_launch", {"version": get_version(), "platform": sys.platform})
 
         # check for updates silently after 5 seconds removed :3
+        # the mod update check needs the catalog, so it waits for it if it's still loading :3
         if self.auto_update.get():
-            self.check_for_updates(silent=True)
+            if self.catalog_loading:
+                self.pending_update_check = True
+            else:
+                self.check_for_updates(silent=True)
         else:
             self.check_for_program_updates()
             logging.info("Auto update is disabled, not prompting for any updates or program updates")
@@ -499,6 +3052,23 @@ class HookLineSinkerUI:
         self.survey_thread = threading.Thread(target=self.check_survey_prompt, daemon=True)
         self.survey_thread.start()
 
+    # available_mods and installed_mods live in the mod registry so they stay indexed :3
+    @property
+    def available_mods(self):
+        return self.mod_registry.available.mods
+
+    @available_mods.setter
+    def available_mods(self, mods):
+        self.mod_registry.set_available(mods)
+
+    @property
+    def installed_mods(self):
+        return self.mod_registry.installed.mods
+
+    @installed_mods.setter
+    def installed_mods(self, mods):
+        self.mod_registry.set_installed(mods)
+
     def track_activity(self, event):
         self.last_activity_time = time.time()
 
@@ -615,12 +3185,7 @@ class HookLineSinkerUI:
             user_id = str(uuid.uuid4())
             self.settings['user_id'] = user_id
             # save only the settings dict, don't call full save_settings() :3
-            settings_path = os.path.join(self.app_data_dir, 'settings.json')
-            try:
-                with open(settings_path, 'w') as f:
-                    json.dump(self.settings, f, indent=4)
-            except Exception as e:
-                logging.error(f"Failed to save user ID: {e}")
+            self.mark_settings_dirty()
         return user_id
 
     def send_ga_event(self, event_name, params=None):
@@ -694,7 +3259,7 @@ class HookLineSinkerUI:
                         MEASUREMENT_ID = ga_config['mid']
                         API_SECRET = ga_config['key']
                 
-                    response = requests.post(
+                    response = http_client.post(
                         f"https://www.google-analytics.com/mp/collect?measurement_id={MEASUREMENT_ID}&api_secret={API_SECRET}",
                         json=payload,
                         timeout=5
@@ -1172,7 +3737,8 @@ class HookLineSinkerUI:
         self.create_settings_tab()
         
         # initialize mod-related functions :3
-        self.copy_existing_gdweave_mods()
+        self.copy_existing_gdweave_mods(self.startup_snapshot)
+        self.startup_snapshot = None
         self.load_available_mods()
         self.refresh_mod_lists()
 
@@ -1204,7 +3770,7 @@ class HookLineSinkerUI:
 
         ttk.Label(search_frame, text="Search:").grid(row=0, column=0, padx=5)
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', lambda name, index, mode: self.filter_available_mods())
+        self.search_var.trace('w', lambda name, index, mode: self.schedule_filter('available', self.filter_available_mods))
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.grid(row=0, column=1, sticky="ew", padx=5)
 
@@ -1246,7 +3812,7 @@ class HookLineSinkerUI:
         ).pack(side="left", padx=5)
 
         # create listbox for available mods with scrollbar :3
-        self.available_listbox = tk.Listbox(available_frame, width=30, height=15, selectmode=tk.EXTENDED)
+        self.available_listbox = VirtualListView(available_frame, width=30, height=15, selectmode=tk.EXTENDED)
         self.available_listbox.grid(row=2, column=0, pady=(2,2), padx=2, sticky="nsew")
         self.available_listbox.bind('<<ListboxSelect>>', self.on_available_listbox_select)
         self.available_listbox.bind('<Button-3>', self.show_context_menu)
@@ -1312,7 +3878,7 @@ class HookLineSinkerUI:
 
         ttk.Label(installed_search_frame, text="Search:").grid(row=0, column=0, padx=5)
         self.installed_search_var = tk.StringVar()
-        self.installed_search_var.trace('w', lambda name, index, mode: self.filter_installed_mods())
+        self.installed_search_var.trace('w', lambda name, index, mode: self.schedule_filter('installed', self.filter_installed_mods))
         installed_search_entry = ttk.Entry(installed_search_frame, textvariable=self.installed_search_var)
         installed_search_entry.grid(row=0, column=1, sticky="ew", padx=5)
 
@@ -1349,7 +3915,7 @@ class HookLineSinkerUI:
                         command=self.filter_installed_mods).pack(fill="x", padx=5, pady=2)
 
         # create listbox for installed mods with scrollbar :3
-        self.installed_listbox = tk.Listbox(installed_frame, width=30, height=15, selectmode=tk.EXTENDED)
+        self.installed_listbox = VirtualListView(installed_frame, width=30, height=15, selectmode=tk.EXTENDED)
         installed_scrollbar = ttk.Scrollbar(installed_frame, orient="vertical", command=self.installed_listbox.yview)
         self.installed_listbox.configure(yscrollcommand=installed_scrollbar.set)
 
@@ -1568,7 +4134,7 @@ class HookLineSinkerUI:
                     'api_paste_expire_date': 'N'
                 }
                 
-                response = requests.post(api_url, data=data)
+                response = http_client.post(api_url, data=data)
                 if response.status_code == 200 and response.text.startswith('https://pastebin.com/'):
                     paste_id = response.text.split('/')[-1]
                     
@@ -1630,7 +4196,7 @@ class HookLineSinkerUI:
 
         try:
             # fetch paste content :3
-            response = requests.get(f'https://pastebin.com/raw/{paste_id}')
+            response = http_client.get(f'https://pastebin.com/raw/{paste_id}')
             if response.status_code != 200:
                 raise Exception("Failed to fetch modpack data")
 
@@ -1738,25 +4304,23 @@ class HookLineSinkerUI:
                 with open(modpack_path) as f:
                     modpack_info = json.load(f)
 
-                # disable all currently installed mods :3
-                for mod in self.installed_mods:
-                    mod['enabled'] = False
-                    self.save_mod_info(mod)
+                # mods from the pack that are already installed, everything else ends up disabled :3
+                desired_keys = set()
 
                 # process each mod in the modpack :3
                 for mod_entry in modpack_info['mods']:
                     mod_id = mod_entry['id']
                     
-                    # check if mod exists :3
-                    existing_mod = next((mod for mod in self.installed_mods if mod['id'] == mod_id), None)
+                    # check if mod exists, the same id can be both a thunderstore and a third-party mod :3
+                    entry_key = (mod_id, mod_entry.get('third_party', False))
+                    existing_mod = self.mod_registry.installed_by_key(entry_key) or self.mod_registry.installed_by_id(mod_id)
                     
                     if existing_mod:
                         # check if versions match :3
                         if existing_mod.get('version') != mod_entry.get('version'):
                             # find the specific version in available mods :3
                             if mod_entry.get('thunderstore_id'):
-                                available_mod = next((mod for mod in self.available_mods 
-                                            if mod['thunderstore_id'] == mod_entry['thunderstore_id']), None)
+                                available_mod = self.mod_registry.available_by_thunderstore_id(mod_entry['thunderstore_id'])
                                 if available_mod:
                                     # uninstall current version :3
                                     self.uninstall_mod_files(existing_mod)
@@ -1771,13 +4335,11 @@ class HookLineSinkerUI:
                                     continue
 
                         # enable existing mod if version matches or couldn't find/install specific version :3
-                        existing_mod['enabled'] = True
-                        self.save_mod_info(existing_mod)
+                        desired_keys.add(mod_key(existing_mod))
                     else:
                         # install mod if it doesn't exist :3
                         if mod_entry.get('thunderstore_id'):
-                            available_mod = next((mod for mod in self.available_mods 
-                                            if mod['thunderstore_id'] == mod_entry['thunderstore_id']), None)
+                            available_mod = self.mod_registry.available_by_thunderstore_id(mod_entry['thunderstore_id'])
                             if available_mod:
                                 temp_mod = available_mod.copy()
                                 temp_mod.update({
@@ -1787,8 +4349,9 @@ class HookLineSinkerUI:
                                 })
                                 self.download_and_install_mod(temp_mod)
 
-                # refresh UI :3
-                self.refresh_mod_lists()
+                # switch the game folder over in one pass, only the difference gets touched :3
+                # queued installs enable and deploy themselves when they finish :3
+                self.reconcile_mods(desired_keys)
                 messagebox.showinfo("Success", f"Modpack '{modpack_name}' applied successfully!")
                 self.set_status(f"Applied modpack: {modpack_name}")
 
@@ -1801,17 +4364,8 @@ class HookLineSinkerUI:
     def save_mod_info(self, mod):
         """Saves the mod information to its mod_info.json file"""
         try:
-            # determine the correct path based on whether it's a third-party mod :3
-            if mod.get('third_party', False):
-                mod_dir = os.path.join(self.mods_dir, "3rd_party", mod['id'])
-            else:
-                mod_dir = os.path.join(self.mods_dir, mod['id'])
-                
-            mod_info_path = os.path.join(mod_dir, 'mod_info.json')
-            
             # save the mod info :3
-            with open(mod_info_path, 'w') as f:
-                json.dump(mod, f, indent=2)
+            self.installed_store.put(mod)
                 
             # also update the mod status :3
             self.save_mod_status(mod)
@@ -1927,13 +4481,6 @@ class HookLineSinkerUI:
             for i in actual_mods[:10]:
                 listbox.selection_set(i)
             messagebox.showwarning("Selection Limit", "You can only select up to 10 mods for installation at once.")
-        elif len(actual_mods) > 3 and not self.multi_mod_warning_shown:
-            # show warning only once and allow the selection :3
-            messagebox.showwarning("Performance Warning", 
-                "You have selected more than 3 mods for installation.\n\n"
-                "The program may become unresponsive while downloading and installing multiple mods.\n\n"
-                "This is normal and the program will recover once the installation is complete.")
-            self.multi_mod_warning_shown = True
 
     def set_status_safe(self, message):
         if threading.current_thread() is threading.main_thread():
@@ -1990,9 +4537,15 @@ class HookLineSinkerUI:
         
         self.mod_details.config(state='disabled')
     def filter_available_mods(self, event=None):
+        self.cancel_pending_filter('available')
+        # filtering mid-load works on what the loading view already holds, later ticks keep appending after it :3
+        if self.catalog_loading and len(self.available_catalog) != self.catalog_shown:
+            self.available_catalog = ThunderstoreCatalog(self.catalog_batch_mods[:self.catalog_shown])
         search_text = self.search_var.get().lower()
         selected_category = self.available_category.get()
-        self.available_listbox.delete(0, tk.END)
+        sort_method = self.sort_method.get()
+        show_nsfw = self.show_nsfw.get()
+        show_deprecated = self.show_deprecated.get()
         
         # get list of installed mod titles (excluding 3rd party) :3
         installed_mod_titles = {
@@ -2000,43 +4553,74 @@ class HookLineSinkerUI:
             if not mod.get('third_party', False)
         }
         
+        # the search index hands back only matching mods along with how well they matched :3
+        query = ModSearchIndex.normalize(search_text).split()
+        scores = {}
+        if query:
+            results = self.available_catalog.search(search_text, show_nsfw, show_deprecated)
+            for mod, score in results:
+                scores[id(mod)] = score
+
+        # if the filters can only have gotten stricter, the last results are the only mods that can still match :3
+        previous = self.available_filter_state
+        state = {
+            'source': (self.available_catalog, self.mod_registry.available, self.mod_registry.available.version, show_nsfw, show_deprecated),
+            'installed': installed_mod_titles,
+            'sort': sort_method,
+            'category': selected_category,
+            'query': query,
+            'exact': not query or self.available_catalog.last_exact
+        }
+        narrowing = (previous is not None and previous['exact'] and previous['query']
+                     and previous['source'] == state['source'] and previous['installed'] == installed_mod_titles
+                     and previous['sort'] == sort_method and previous['category'] in ("All", selected_category)
+                     and ModSearchIndex.narrows(previous['query'], query))
+
+        # candidates come out already in sort order: narrowed results keep theirs, search hits are put in
+        # order by their precomputed rank and everything else is picked straight from the presorted view :3
+        if narrowing:
+            candidates = previous['sorted']
+        elif query:
+            candidates = [mod for mod, score in results]
+            if order := self.available_catalog.sort_order(sort_method):
+                candidates.sort(key=lambda x: order.rank[id(x)])
+        else:
+            candidates = self.available_catalog.sorted_view(sort_method, show_nsfw, show_deprecated)
+
         filtered_mods = []
-        for mod in self.available_mods:
+        for mod in candidates:
+            # skip if it didn't match the search :3
+            if query and id(mod) not in scores:
+                continue
+
             # skip if mod is already installed :3
             if mod['title'] in installed_mod_titles:
                 continue
                 
-            # check if mod matches search criteria :3
-            if search_text and not (
-                search_text in mod['title'].lower() or 
-                search_text in mod.get('author', '').lower() or 
-                search_text in mod.get('description', '').lower()
-            ):
-                continue
-                
             # check if mod matches category filter :3
             if selected_category != "All" and selected_category not in mod.get('categories', []):
                 continue
                 
             filtered_mods.append(mod)
 
-        # sort the filtered mods based on selected method :3
-        sort_method = self.sort_method.get()
-        if sort_method == "Last Updated":
-            filtered_mods.sort(key=lambda x: x.get('updated_on', ''), reverse=True)
-        elif sort_method == "Most Downloads":
-            filtered_mods.sort(key=lambda x: x.get('downloads', 0), reverse=True)
-        elif sort_method == "Most Likes":
-            filtered_mods.sort(key=lambda x: x.get('likes', 0), reverse=True)
-        elif sort_method == "Name (A-Z)":
-            filtered_mods.sort(key=lambda x: x.get('title', '').lower())
-        elif sort_method == "Name (Z-A)":
-            filtered_mods.sort(key=lambda x: x.get('title', '').lower(), reverse=True)
+        state['sorted'] = filtered_mods
+        self.available_filter_state = state
+
+        # when searching, better matches go first and the sort method breaks ties :3
+        if query:
+            filtered_mods = sorted(filtered_mods, key=lambda x: scores[id(x)], reverse=True)
 
         # display filtered mods with converted display names :3
-        for mod in filtered_mods:
-            display_title = self.get_display_name(mod['title'])
-            self.available_listbox.insert(tk.END, display_title)
+        self.available_listbox.set_items([(mod['id'], self.get_display_name(mod['title'])) for mod in filtered_mods])
+
+    # search boxes wait until typing pauses before filtering, so a whole word costs one refresh :3
+    def schedule_filter(self, name, callback):
+        self.cancel_pending_filter(name)
+        self.pending_filters[name] = self.root.after(SEARCH_DEBOUNCE_MS, callback)
+
+    def cancel_pending_filter(self, name):
+        if pending := self.pending_filters.pop(name, None):
+            self.root.after_cancel(pending)
 
     def check_for_duplicate_mods(self):
         mod_ids = {}
@@ -2044,70 +4628,40 @@ class HookLineSinkerUI:
         duplicates = []
         processed_duplicates = set()
 
-        # check normal mods :3
-        for mod_folder in os.listdir(self.mods_dir):
-            mod_info_path = os.path.join(self.mods_dir, mod_folder, 'mod_info.json')
-            if os.path.exists(mod_info_path):
-                with open(mod_info_path, 'r') as f:
-                    mod_info = json.load(f)
-                    mod_id = mod_info.get('id')
-                    mod_title = mod_info.get('title')
-                    mod_version = mod_info.get('version', 'Unknown')
-                    
-                    # check for duplicate ids :3
-                    if mod_id:
-                        if mod_id in mod_ids and mod_id not in processed_duplicates:
-                            duplicates.append((mod_ids[mod_id], mod_info_path, mod_id, mod_title, mod_version))
-                            processed_duplicates.add(mod_id)
-                        else:
-                            mod_ids[mod_id] = mod_info_path
-                    
-                    # check for duplicate titles :3
-                    if mod_title:
-                        if mod_title in mod_titles and mod_title not in processed_duplicates:
-                            duplicates.append((mod_titles[mod_title], mod_info_path, mod_title, mod_id, mod_version))
-                            processed_duplicates.add(mod_title)
-                        else:
-                            mod_titles[mod_title] = mod_info_path
+        # normal mods first, then third-party ones, same order the folders used to be walked in :3
+        installed = sorted(self.installed_store.entries(), key=lambda entry: entry[0].startswith(f"{InstalledModsStore.THIRD_PARTY}/"))
+        versions = {}
+        for folder, mod_info in installed:
+            mod_info_path = os.path.join(self.installed_store.path_for(folder), 'mod_info.json')
+            versions[mod_info_path] = mod_info.get('version', 'Unknown')
+            mod_id = mod_info.get('id')
+            mod_title = mod_info.get('title')
+            mod_version = mod_info.get('version', 'Unknown')
+
+            # check for duplicate ids :3
+            if mod_id:
+                if mod_id in mod_ids and mod_id not in processed_duplicates:
+                    duplicates.append((mod_ids[mod_id], mod_info_path, mod_id, mod_title, mod_version))
+                    processed_duplicates.add(mod_id)
+                else:
+                    mod_ids[mod_id] = mod_info_path
 
-        # check third-party mods :3
-        third_party_mods_dir = os.path.join(self.mods_dir, "3rd_party")
-        if os.path.exists(third_party_mods_dir):
-            for mod_folder in os.listdir(third_party_mods_dir):
-                mod_info_path = os.path.join(third_party_mods_dir, mod_folder, 'mod_info.json')
-                if os.path.exists(mod_info_path):
-                    with open(mod_info_path, 'r') as f:
-                        mod_info = json.load(f)
-                        mod_id = mod_info.get('id')
-                        mod_title = mod_info.get('title')
-                        mod_version = mod_info.get('version', 'Unknown')
-                        
-                        # check for duplicate ids :3
-                        if mod_id:
-                            if mod_id in mod_ids and mod_id not in processed_duplicates:
-                                duplicates.append((mod_ids[mod_id], mod_info_path, mod_id, mod_title, mod_version))
-                                processed_duplicates.add(mod_id)
-                            else:
-                                mod_ids[mod_id] = mod_info_path
-                        
-                        # check for duplicate titles :3
-                        if mod_title:
-                            if mod_title in mod_titles and mod_title not in processed_duplicates:
-                                duplicates.append((mod_titles[mod_title], mod_info_path, mod_title, mod_id, mod_version))
-                                processed_duplicates.add(mod_title)
-                            else:
-                                mod_titles[mod_title] = mod_info_path
+            # check for duplicate titles :3
+            if mod_title:
+                if mod_title in mod_titles and mod_title not in processed_duplicates:
+                    duplicates.append((mod_titles[mod_title], mod_info_path, mod_title, mod_id, mod_version))
+                    processed_duplicates.add(mod_title)
+                else:
+                    mod_titles[mod_title] = mod_info_path
 
         # handle duplicates :3
         for original, duplicate, duplicate_identifier, duplicate_title, duplicate_version in duplicates:
-            original_version = 'Unknown'
-            with open(original, 'r') as f:
-                original_info = json.load(f)
-                original_version = original_info.get('version', 'Unknown')
+            original_version = versions.get(original, 'Unknown')
             if messagebox.askyesno("Duplicate Mod Found", f"Duplicate mod found: {duplicate_title} {duplicate_version} ({duplicate_identifier}) and {duplicate_title} {original_version} ({duplicate_identifier}), would you like to delete the oldest version to fix this confliction?"):
                 try:
                     duplicate_folder = os.path.dirname(duplicate)
                     shutil.rmtree(duplicate_folder)
+                    self.installed_store.delete_folder(os.path.relpath(duplicate_folder, self.mods_dir).replace(os.sep, '/'))
                     self.set_status(f"Removed duplicate mod: {os.path.basename(duplicate_folder)}")
                 except FileNotFoundError:
                     messagebox.showerror("Error", f"The file {duplicate_folder} was already deleted.")
@@ -2149,22 +4703,33 @@ class HookLineSinkerUI:
             
             self.large_mod_list_warning_shown = True
             
+        self.cancel_pending_filter('installed')
         search_text = self.installed_search_var.get().lower()
         selected_filter = self.installed_category.get()
-        
-        # clear current items :3
-        self.installed_listbox.delete(0, tk.END)
-        
+        sort_method = self.installed_sort_method.get()
+
+        # if only the search text grew, the last results are the only mods that can still match :3
+        previous = self.installed_filter_state
+        state = {
+            'source': (self.mod_registry.installed, self.mod_registry.installed.version),
+            'options': (selected_filter, sort_method, self.hide_third_party.get()),
+            'query': search_text
+        }
+        narrowing = (previous is not None and previous['source'] == state['source']
+                     and previous['options'] == state['options'] and previous['query'] in search_text)
+
         # store filtered mods :3
         self.filtered_installed_mods = []
-        
-        for mod in self.installed_mods:
+        display_names = self.mod_registry.installed.display_names()
+
+        # narrowed results are already in order, otherwise start from the presorted installed list :3
+        for mod in (previous['mods'] if narrowing else self.mod_registry.installed.sorted_mods(sort_method)):
             # skip if hiding third party mods :3
             if self.hide_third_party.get() and mod.get('third_party', False):
                 continue
                 
             # apply search filter :3
-            if search_text and search_text not in self.get_display_name(mod['title']).lower():
+            if search_text and search_text not in display_names[id(mod)]:
                 continue
                 
             # apply status/category filter :3
@@ -2180,19 +4745,18 @@ class HookLineSinkerUI:
             # add to filtered list :3
             self.filtered_installed_mods.append(mod)
         
-        # apply sorting :3
-        sort_method = self.installed_sort_method.get()
-        if sort_method == "Name (A-Z)":
-            self.filtered_installed_mods.sort(key=lambda x: self.get_display_name(x['title']).lower())
-        elif sort_method == "Name (Z-A)":
-            self.filtered_installed_mods.sort(key=lambda x: self.get_display_name(x['title']).lower(), reverse=True)
-        
+        state['mods'] = list(self.filtered_installed_mods)
+        self.installed_filter_state = state
+
         # update listbox :3
-        for mod in self.filtered_installed_mods:
-            status = "✅" if mod.get('enabled', True) else "❌"
-            third_party = "[3rd] " if mod.get('third_party', False) else ""
-            display_title = self.get_display_name(mod['title'])
-            self.installed_listbox.insert(tk.END, f"{status} {third_party}{display_title}".strip())
+        self.installed_listbox.set_items([self.installed_mod_row(mod) for mod in self.filtered_installed_mods])
+
+    # (key, text) row for the installed list, third party mods are keyed apart since they can share ids :3
+    def installed_mod_row(self, mod):
+        status = "✅" if mod.get('enabled', True) else "❌"
+        third_party = "[3rd] " if mod.get('third_party', False) else ""
+        display_title = self.get_display_name(mod['title'])
+        return (mod.get('third_party', False), mod['id']), f"{status} {third_party}{display_title}".strip()
 
     # there is no fucking way i'm doing this right so just praying this works :3
     def get_selected_installed_mod_indices(self):
@@ -2462,6 +5026,7 @@ class HookLineSinkerUI:
                     if os.path.exists(self.mods_dir):
                         shutil.rmtree(self.mods_dir)
                         os.makedirs(self.mods_dir)
+                    self.installed_store.clear()
                     
                     # update settings :3
                     self.settings['thunderstore_migrated'] = True
@@ -2911,6 +5476,8 @@ class HookLineSinkerUI:
         # start a thread to check the latest version :3
         threading.Thread(target=self.update_latest_version_label, daemon=True).start()
         self.root.after(100, self.process_gui_queue)
+        self.downloads.start()
+        self.start_fs_watcher()
 
     # dexrn: shut up windows defender
     def shut_up_windef(self):
@@ -3017,7 +5584,7 @@ class HookLineSinkerUI:
     def get_latest_version(self):
         """Fetches the latest version from HookLineSinker.lol"""
         try:
-            response = requests.get("https://hooklinesinker.lol/download/version.json")
+            response = http_client.get("https://hooklinesinker.lol/download/version.json")
             version_data = response.json()
             return version_data['version']
         except Exception as e:
@@ -3203,47 +5770,149 @@ Special Thanks:
         logging.info("Automatic backup process completed")
         logging.info("Made rotating backup")
 
+    # the game's GDWeave/Mods folder, None until a game path is set :3
+    def gdweave_mods_path(self):
+        if not self.settings.get('game_path'):
+            return None
+        return os.path.join(self.settings['game_path'], 'GDWeave', 'Mods')
+
+    def gdweave_configs_path(self):
+        if not self.settings.get('game_path'):
+            return None
+        return os.path.join(self.settings['game_path'], 'GDWeave', 'configs')
+
+    # (re)starts watching our mod folders and the game's mods and configs for changes made outside hls :3
+    def start_fs_watcher(self):
+        if self.fs_watcher is not None:
+            self.fs_watcher.stop()
+        self.config_ids = None
+        self.fs_watcher = FileWatcher(self.watched_folders(), lambda events: self.gui_queue.put(('fs_events', events)))
+        self.fs_watcher.start()
+
+    def watched_folders(self):
+        return [self.mods_dir, os.path.join(self.mods_dir, InstalledModsStore.THIRD_PARTY), self.gdweave_mods_path(), self.gdweave_configs_path()]
+
+    # applies watcher events to the store, the registry and the lists without a full rescan :3
+    def handle_fs_events(self, events):
+        third_party_dir = os.path.join(self.mods_dir, InstalledModsStore.THIRD_PARTY)
+        folders = set()
+        for kind, root, name in events:
+            if kind == 'rescan':
+                logging.info("File watcher lost events, rescanning mods")
+                self.config_ids = None
+                self.installed_store.sync_with_disk()
+                self.refresh_mod_lists()
+                return
+            if root == self.mods_dir and name != InstalledModsStore.THIRD_PARTY:
+                folders.add(name)
+            elif root == third_party_dir:
+                folders.add(f"{InstalledModsStore.THIRD_PARTY}/{name}")
+            elif root == self.gdweave_mods_path():
+                if kind == 'added' and not self.is_hls_deployed(name):
+                    self.queue_adoption(os.path.join(root, name))
+            elif root == self.gdweave_configs_path() and name.endswith('.json') and self.config_ids is not None:
+                if os.path.exists(os.path.join(root, name)):
+                    self.config_ids.add(name[:-len('.json')])
+                else:
+                    self.config_ids.discard(name[:-len('.json')])
+
+        changed = 0
+        for folder in folders:
+            change = self.installed_store.refresh_folder(folder)
+            if change is None:
+                continue
+            old, new = change
+            if old is not None:
+                third_party = old.get('third_party', False)
+                existing = self.mod_registry.installed_by_key((old['id'], third_party))
+                if existing is not None:
+                    self.mod_registry.installed.remove(existing)
+            if new is not None:
+                self.mod_registry.installed.add(new)
+            logging.info(f"Mod folder changed on disk: {folder} ({'removed' if new is None else 'added' if old is None else 'modified'})")
+            changed += 1
+        if changed:
+            self.update_installed_view()
+
+    # folders hls put into GDWeave/Mods itself, they're never third-party mods to adopt :3
+    def is_hls_deployed(self, name):
+        if os.path.exists(self.deployer.manifest_path(name)):
+            return True
+        return any(self.mod_registry.installed_by_key((name, third_party)) for third_party in (False, True))
+
+    # a folder dropped into GDWeave/Mods is only adopted once it stops changing, a half-copied mod would be kept forever :3
+    def queue_adoption(self, path):
+        if not os.path.isdir(path):
+            return
+        first = not self.pending_adoptions
+        self.pending_adoptions[path] = folder_fingerprint(path)
+        if first:
+            self.root.after(ADOPTION_SETTLE_MS, self.adopt_settled_game_mods)
+
+    def adopt_settled_game_mods(self):
+        settled = []
+        for path, fingerprint in list(self.pending_adoptions.items()):
+            if not os.path.isdir(path):
+                del self.pending_adoptions[path]
+                continue
+            current = folder_fingerprint(path)
+            if current == fingerprint:
+                settled.append(path)
+                del self.pending_adoptions[path]
+            else:
+                self.pending_adoptions[path] = current
+        if self.pending_adoptions:
+            self.root.after(ADOPTION_SETTLE_MS, self.adopt_settled_game_mods)
+        if not settled:
+            return
+
+        # only the settled folders are read, the rest of GDWeave/Mods is left alone :3
+        snapshot = ScanSnapshot()
+        for path in settled:
+            manifest_path = os.path.join(path, 'manifest.json')
+            snapshot.game_mods[os.path.basename(path)] = StartupScanner._parse(manifest_path) if os.path.exists(manifest_path) else None
+        self.copy_existing_gdweave_mods(snapshot)
+
+    # redraws the installed list after the registry changed in place :3
+    def update_installed_view(self):
+        if hasattr(self, 'installed_frame'):
+            self.installed_frame.configure(text=f"Installed Mods ({len(self.installed_mods)})")
+        self.save_mod_cache()
+        self.filter_installed_mods()
+
     # copies existing gdweave mods to the hls mods directory :3
-    def copy_existing_gdweave_mods(self):
+    def copy_existing_gdweave_mods(self, snapshot=None):
         if not self.settings.get('game_path'):
             logging.info("Game path not set, skipping existing mod copy.")
             return
 
-        gdweave_mods_path = os.path.join(self.settings['game_path'], 'GDWeave', 'Mods')
+        gdweave_mods_path = self.gdweave_mods_path()
         if not os.path.exists(gdweave_mods_path):
             logging.info("GDWeave Mods folder not found, skipping existing mod copy.")
             return
 
+        if snapshot is None:
+            snapshot = self.startup_scanner.scan(game_mods_path=gdweave_mods_path)
+
         third_party_mods_dir = os.path.join(self.mods_dir, "3rd_party")
         os.makedirs(third_party_mods_dir, exist_ok=True)
 
         # get the list of known mod ids from our managed mods :3
-        known_mod_ids = set()
-        for mod_folder in os.listdir(self.mods_dir):
-            mod_info_path = os.path.join(self.mods_dir, mod_folder, 'mod_info.json')
-            if os.path.exists(mod_info_path):
-                with open(mod_info_path, 'r') as f:
-                    mod_info = json.load(f)
-                    known_mod_ids.add(mod_info.get('id'))
+        known_mod_ids = {mod.get('id') for mod in self.installed_store.mods() if not mod.get('third_party', False)}
 
         newly_installed_mods = []
 
-        for mod_folder in os.listdir(gdweave_mods_path):
+        for mod_folder in snapshot.game_files:
+            logging.info(f"Skipped: {mod_folder} (not a directory)")
+
+        for mod_folder, manifest in snapshot.game_mods.items():
             src_mod_path = os.path.join(gdweave_mods_path, mod_folder)
-            
-            if not os.path.isdir(src_mod_path):
-                logging.info(f"Skipped: {mod_folder} (not a directory)")
-                continue
 
-            manifest_path = os.path.join(src_mod_path, 'manifest.json')
-            if not os.path.exists(manifest_path):
-                logging.info(f"Skipped: {mod_folder} (no manifest.json found)")
+            if manifest is None:
+                logging.info(f"Skipped: {mod_folder} (no readable manifest.json found)")
                 continue
 
             try:
-                with open(manifest_path, 'r') as f:
-                    manifest = json.load(f)
-                
                 mod_id = manifest.get('Id')
                 mod_title = manifest.get('Name', mod_folder)
                 mod_author = manifest.get('Author', 'Unknown')
@@ -3271,8 +5940,7 @@ Special Thanks:
                         'third_party': True,
                         'updated_on': int(time.time())
                     }
-                    with open(os.path.join(dst_mod_path, 'mod_info.json'), 'w') as f:
-                        json.dump(mod_info, f, indent=2)
+                    self.installed_store.put(mod_info)
 
                     logging.info(f"Copied third-party mod: {mod_title} (ID: {mod_id})")
                     newly_installed_mods.append(mod_info)
@@ -3283,9 +5951,11 @@ Special Thanks:
                 logging.info(f"Error processing mod {mod_folder}: {str(e)}")
 
         # add newly installed mods to the installed mods list :3
-        self.installed_mods.extend(newly_installed_mods)
+        for mod_info in newly_installed_mods:
+            self.mod_registry.add_installed(mod_info)
 
-        self.refresh_mod_lists()
+        if newly_installed_mods:
+            self.update_installed_view()
 
     # deletes temporary files and folders :3
     def delete_temp_files(self):
@@ -3345,7 +6015,7 @@ Special Thanks:
                 os.makedirs(temp_dir, exist_ok=True)
                 
                 # download the installer :3
-                with requests.get(url, stream=True) as response:
+                with http_client.get(url, stream=True) as response:
                     response.raise_for_status()
                     total_size = int(response.headers.get('content-length', 0))
                     
@@ -3386,13 +6056,9 @@ Special Thanks:
 
     def check_thunderstore_title_exists(self, title):
         logging.debug(f"Checking if title '{title}' exists in Thunderstore mods")
-        backend_title = self.get_backend_name(title)
-        for mod in self.available_mods:
-            logging.debug(f"Comparing with mod title: {mod['title']}")
-            mod_backend_title = self.get_backend_name(mod['title'])
-            if mod_backend_title.lower() == backend_title.lower():
-                logging.debug(f"Found matching mod: {mod['title']}")
-                return True
+        if mod := self.mod_registry.available_by_title(self.get_backend_name(title)):
+            logging.debug(f"Found matching mod: {mod['title']}")
+            return True
         logging.debug(f"No matching mod found for title: {title}")
         return False
 
@@ -3411,29 +6077,16 @@ Special Thanks:
 
             logging.info(f"Selected ZIP file: {zip_path}")
 
-            # create temp directories :3
-            temp_dir = os.path.join(self.app_data_dir, 'temp')
-            os.makedirs(temp_dir, exist_ok=True)
-            import_temp_dir = os.path.join(temp_dir, f"import_{int(time.time())}")
-            os.makedirs(import_temp_dir)
-            extracted_zip_dir = os.path.join(import_temp_dir, 'extractedzip')
-            os.makedirs(extracted_zip_dir)
-
-            # extract zip contents :3
+            # find the manifest without unpacking anything yet :3
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extracted_zip_dir)
+                manifest_prefix, manifest = find_zip_manifest(zip_ref)
 
-            manifest_path = self.find_manifest(extracted_zip_dir)
-            if not manifest_path:
+            if manifest is None:
                 error_msg = "manifest.json not found in the ZIP file. This may not be a valid mod package."
                 logging.error(error_msg)
                 messagebox.showerror("Error", error_msg)
                 return
 
-            # read manifest and check dependencies :3
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
-
             mod_id = manifest.get('Id')
             if not mod_id:
                 error_msg = "Id not found in manifest.json. This may not be a valid mod package."
@@ -3456,39 +6109,22 @@ Special Thanks:
                     return
 
             if dependencies := manifest.get('Dependencies', []):
-                all_dependencies = []
-                missing_dependencies = []
-
-                for dep_id in dependencies:
-                    if not self.is_mod_installed(dep_id):
-                        if dep_mod := self.find_mod_by_id(dep_id):
-                            if dep_mod not in all_dependencies:
-                                all_dependencies.append(dep_mod)
-                        else:
-                            missing_dependencies.append(dep_id)
+                # resolve through a stand-in for the imported mod so its own dependencies get walked too :3
+                imported = {'id': mod_id, 'title': manifest.get('Name', mod_id), 'dependencies': dependencies}
+                plan = self.dependency_resolver.resolve([imported], include_requested=False)
 
-                if all_dependencies or missing_dependencies:
+                if plan.levels or plan.missing or plan.conflicts or plan.cycles:
                     message = f"The mod '{manifest.get('Name', mod_id)}' has dependencies:\n\n"
-
-                    if all_dependencies:
-                        message += "The following dependencies will be installed:\n"
-                        message += "\n".join([f"• {dep['title']}" for dep in all_dependencies])
-                        message += "\n"
-
-                    if missing_dependencies:
-                        message += "\nThe following dependencies could not be found:\n"
-                        message += "\n".join([f"• {dep_id}" for dep in missing_dependencies])
-                        message += "\n\nThe mod may not work correctly without these dependencies. Try finding and importing them manually."
-
+                    message += self.describe_dependency_plan(plan, "The mod may not work correctly without these dependencies. Try finding and importing them manually.")
                     message += "\n\nWould you like to continue?"
 
                     if not messagebox.askyesno("Dependencies Required", message):
                         return
 
                     # install available dependencies :3
-                    for dep_mod in all_dependencies:
-                        self.set_status(f"Installing dependency: {dep_mod['title']}")
-                        self.download_and_install_mod(dep_mod)
+                    if plan.levels:
+                        self.set_status("Installing dependencies...")
+                        self.install_plan(plan)
 
             # check if mod already exists :3
             if self.mod_id_exists(mod_id):
@@ -3497,14 +6133,8 @@ Special Thanks:
 
             # continue with mod installation :3
             mod_dir = os.path.join(self.mods_dir, "3rd_party", mod_id)
-            if os.path.exists(mod_dir):
-                shutil.rmtree(mod_dir)
-
-            manifest_parent = os.path.dirname(manifest_path)
-            if manifest_parent != extracted_zip_dir:
-                shutil.move(manifest_parent, mod_dir)
-            else:
-                shutil.move(extracted_zip_dir, mod_dir)
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                extract_zip_subtree(zip_ref, manifest_prefix, mod_dir)
 
             # create mod_info.json :3
             mod_info = {
@@ -3518,9 +6148,7 @@ Special Thanks:
                 'updated_on': int(time.time())
             }
 
-            mod_info_path = os.path.join(mod_dir, 'mod_info.json')
-            with open(mod_info_path, 'w') as f:
-                json.dump(mod_info, f, indent=2)
+            self.installed_store.put(mod_info)
 
             self.set_status(f"3rd party mod '{mod_info['title']}' imported successfully!")
             self.refresh_mod_lists()
@@ -3532,20 +6160,6 @@ Special Thanks:
             logging.error(traceback.format_exc())
             self.set_status(error_message)
 
-    # searches for manifest.json file containing an 'Id' field in a given directory and its subdirectories :3
-    def find_manifest(self, directory):
-        for root, dirs, files in os.walk(directory):
-            if 'manifest.json' in files:
-                manifest_path = os.path.join(root, 'manifest.json')
-                try:
-                    with open(manifest_path, 'r') as f:
-                        manifest_data = json.load(f)
-                        if manifest_data.get('Id'):  # only return if Id field exists :3
-                            return manifest_path
-                except (json.JSONDecodeError, IOError):
-                    continue
-        return None
-    
     # refreshes all mods by reloading available mods and updating the UI :3
     def refresh_all_mods(self):
         self.load_available_mods()
@@ -3559,7 +6173,7 @@ Special Thanks:
             try:
                 api_url = "https://api.github.com/repos/NotNite/GDWeave/releases/latest"
                 headers = {'Accept': 'application/vnd.github.v3+json'}
-                response = requests.get(api_url, headers=headers, timeout=30)
+                response = http_client.get(api_url, headers=headers, timeout=30)
                 response.raise_for_status()
                 data = response.json()
                 version = data['tag_name'].lstrip('v')  # remove 'v' prefix if present :3
@@ -3625,11 +6239,9 @@ Special Thanks:
                 )
                 return
 
-        all_dependencies = []
-        missing_dependencies = []
-
         try:
-            # first check all dependencies :3
+            # collect the selected mods :3
+            selected_mods = []
             for index in selected:
                 mod_title = self.available_listbox.get(index)
                 logging.debug(f"Processing mod: {mod_title}")
@@ -3643,143 +6255,96 @@ Special Thanks:
                 logging.debug(f"Cleaned title: {clean_title}, backend title: {backend_title}")
                 
                 # find the mod using the backend name :3
-                mod = next((m for m in self.available_mods if self.get_backend_name(m['title'].strip()) == backend_title), None)
+                mod = self.mod_registry.available_by_name(backend_title)
                 if not mod:
                     logging.debug(f"Could not find mod for {backend_title}")
                     continue
+                selected_mods.append(mod)
 
-                self.set_status_safe(f"Checking dependencies for {mod['title']}...")
-                if dependencies := mod.get('dependencies', []):
-                    logging.debug(f"Found dependencies for {mod['title']}: {dependencies}")
-                    for dep in dependencies:
-                        # parse dependency string (format: owner-name-version) :3
-                        parts = dep.split('-')
-                        if len(parts) >= 2:
-                            thunderstore_id = f"{parts[0]}-{parts[1]}"
-                            logging.debug(f"Checking dependency: {thunderstore_id}")
-                            # skip gdweave and hls dependencies :3
-                            if thunderstore_id.startswith(('NotNet-GDWeave', 'Pyoid-Hook_Line_and_Sinker')):
-                                logging.debug(f"Skipping core dependency: {thunderstore_id}")
-                                continue
-                            # check if dependency is installed using thunderstore_id :3
-                            if not any(m.get('thunderstore_id') == thunderstore_id for m in self.installed_mods):
-                                logging.debug(f"Dependency {thunderstore_id} not installed")
-                                if dep_mod := next((m for m in self.available_mods if m.get('thunderstore_id') == thunderstore_id), None):
-                                    if dep_mod not in all_dependencies:
-                                        logging.debug(f"Adding {thunderstore_id} to dependencies to install")
-                                        all_dependencies.append(dep_mod)
-                                else:
-                                    logging.debug(f"Dependency {thunderstore_id} not found in available mods")
-                                    missing_dependencies.append(dep)
+            if not selected_mods:
+                return
 
-            # if there are dependencies, prompt user :3
-            if all_dependencies or missing_dependencies:
-                logging.debug(f"Found dependencies to handle - to install: {len(all_dependencies)}, missing: {len(missing_dependencies)}")
-                message = ""
-                if all_dependencies:
-                    message += "The following dependencies will be installed:\n"
-                    message += "\n".join([f"• {dep['title']}" for dep in all_dependencies])
-                    message += "\n\n"
-
-                if missing_dependencies:
-                    message += "The following dependencies could not be found:\n"
-                    message += "\n".join([f"• {dep}" for dep in missing_dependencies])
-                    message += "\n\nThe mod may not work correctly without these dependencies."
+            # resolve the whole dependency tree at once :3
+            self.set_status_safe("Checking dependencies...")
+            plan = self.dependency_resolver.resolve(selected_mods)
+            dependencies = plan.dependencies()
+            logging.debug(f"Dependency plan - levels: {len(plan.levels)}, to install: {len(dependencies)}, missing: {len(plan.missing)}")
 
+            # if there are dependencies, prompt user :3
+            if dependencies or plan.missing or plan.conflicts or plan.cycles:
+                message = self.describe_dependency_plan(plan)
                 message += "\n\nWould you like to continue?"
 
                 if not messagebox.askyesno("Dependencies Required", message):
                     logging.debug("User cancelled dependency installation")
                     return
 
-                # install available dependencies first :3
-                for dep_mod in all_dependencies:
-                    logging.debug(f"Installing dependency: {dep_mod['title']}")
-                    self.set_status_safe(f"Installing dependency: {dep_mod['title']}")
-                    self.download_and_install_mod(dep_mod)
-
-            # install selected mods :3
-            for index in selected:
-                mod_title = self.available_listbox.get(index)
-                logging.debug(f"Installing selected mod: {mod_title}")
-                if mod_title.startswith("Category:"):
-                    logging.debug("Skipping category header")
-                    continue
-
-                clean_title = mod_title.replace('✅', '').replace('❌', '').replace('[3rd]', '').strip()
-                backend_title = self.get_backend_name(clean_title)
-                mod = next((m for m in self.available_mods if self.get_backend_name(m['title'].strip()) == backend_title), None)
-                if not mod:
-                    logging.debug(f"Could not find mod for {clean_title}")
-                    continue
-
-                self.set_status_safe(f"Installing {mod['title']}")
-                logging.debug(f"Downloading and installing {mod['title']}")
-                self.download_and_install_mod(mod)
-
-            self.set_status_safe("Installation complete")
-            logging.debug("Installation completed successfully")
-            self.refresh_mod_lists()
+            self.install_plan(plan)
 
         except Exception as e:
             error_message = f"Installation failed: {str(e)}"
             logging.debug(f"Installation failed with error: {error_message}")
             messagebox.showerror("Error", error_message)
-            logging.ERROR(error_message)
+            logging.error(error_message)
+
+    # builds the dependency prompt for a resolved plan :3
+    def describe_dependency_plan(self, plan, missing_hint="The mod may not work correctly without these dependencies."):
+        sections = []
+        if dependencies := plan.dependencies():
+            sections.append("The following dependencies will be installed:\n" + "\n".join(f"• {dep['title']}" for dep in dependencies))
+
+        if plan.missing:
+            sections.append("The following dependencies could not be found:\n" + "\n".join(f"• {dep}" for dep in plan.missing) + f"\n\n{missing_hint}")
+
+        if plan.conflicts:
+            lines = []
+            for dependency_id, versions in plan.conflicts.items():
+                wanted = ", ".join(f"{version} ({', '.join(requirers)})" for version, requirers in versions.items())
+                lines.append(f"• {dependency_id}: {wanted}")
+            sections.append("These mods want different versions of the same dependency, the latest will be installed:\n" + "\n".join(lines))
+
+        if plan.cycles:
+            sections.append("These mods depend on each other in a loop:\n" + "\n".join(f"• {', '.join(titles)}" for titles in plan.cycles))
+
+        if plan.blocked:
+            sections.append("These mods need a mod from a loop above and will be installed after it:\n" + "\n".join(f"• {title}" for title in plan.blocked))
+
+        return "\n\n".join(sections)
+
+    # queues a dependency plan level by level, each level waits for the one before it :3
+    def install_plan(self, plan):
+        previous = []
+        for level in plan.levels:
+            previous = [self.download_and_install_mod(mod, after=previous) for mod in level]
 
     # checks if a mod is installed by its ID :3
     def is_mod_installed(self, mod_id):
-        return any(m['id'] == mod_id for m in self.installed_mods)
+        return self.mod_registry.installed_by_id(mod_id) is not None
     
     def find_mod_by_id(self, mod_id):
-        return next((m for m in self.available_mods if m['id'] == mod_id), None)
+        return self.mod_registry.available_by_id(mod_id)
 
     def check_mod_dependencies(self, mod):
         missing_deps = []
         for dep in mod.get('dependencies', []):
-            # parse dependency string (format: owner-name-version) :3
-            parts = dep.split('-')
-            if len(parts) >= 2:
-                thunderstore_id = f"{parts[0]}-{parts[1]}"
-                # skip gdweave and hls dependencies :3
-                if thunderstore_id.startswith(('NotNet-GDWeave', 'Pyoid-Hook_Line_and_Sinker')):
-                    continue
-                # check if dependency is installed using thunderstore_id :3
-                if not any(m.get('thunderstore_id') == thunderstore_id for m in self.installed_mods):
-                    missing_deps.append(dep)
+            thunderstore_id, _ = parse_dependency(dep)
+            # skip gdweave and hls dependencies :3
+            if not thunderstore_id or thunderstore_id.startswith(CORE_DEPENDENCIES):
+                continue
+            # check if dependency is installed using thunderstore_id, or plain id for gdweave manifests :3
+            if not (self.mod_registry.installed_by_thunderstore_id(thunderstore_id) or self.mod_registry.installed_by_id(thunderstore_id)):
+                missing_deps.append(dep)
         return missing_deps
 
     # searches for an installed mod by its ID :3
     # checks both regular and third-party mods :3
     def find_installed_mod_by_id(self, mod_id):
         # check regular mods :3
-        for mod in self.installed_mods:
-            if mod['id'] == mod_id:
-                return mod
-        
-            # check third-party mods :3
-            third_party_dir = os.path.join(self.mods_dir, "3rd_party")
-            if os.path.exists(third_party_dir):
-                for mod_folder in os.listdir(third_party_dir):
-                    mod_info_path = os.path.join(third_party_dir, mod_folder, 'mod_info.json')
-                    if os.path.exists(mod_info_path):
-                        with open(mod_info_path, 'r') as f:
-                            mod_info = json.load(f)
-                            if mod_info['id'] == mod_id:
-                                return mod_info
-            return None
-        
+        if mod := self.mod_registry.installed_by_id(mod_id):
+            return mod
+
         # check third-party mods :3
-        third_party_dir = os.path.join(self.mods_dir, "3rd_party")
-        if os.path.exists(third_party_dir):
-            for mod_folder in os.listdir(third_party_dir):
-                mod_info_path = os.path.join(third_party_dir, mod_folder, 'mod_info.json')
-                if os.path.exists(mod_info_path):
-                    with open(mod_info_path, 'r') as f:
-                        mod_info = json.load(f)
-                        if mod_info['id'] == mod_id:
-                            return mod_info
-        return None
+        return self.installed_store.get(mod_id, third_party=True)
 
     # installs or updates GDWeave mod loader :3
     # backs up existing mods and configs before installation :3
@@ -3825,12 +6390,9 @@ Special Thanks:
 
             # download and install GDWeave :3
             self.set_status("Downloading GDWeave...")
-            response = requests.get(gdweave_url)
-            response.raise_for_status()
-            
             zip_path = os.path.join(temp_dir, "GDWeave.zip")
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            download_size, download_hash = stream_download(gdweave_url, zip_path)
+            logging.info(f"Downloaded GDWeave: {download_size} bytes, sha256 {download_hash}")
             
             self.set_status("Installing GDWeave...")
             logging.info(f"Zip file downloaded to: {zip_path}")
@@ -4167,12 +6729,8 @@ Special Thanks:
         gdweave_mods_path = os.path.join(self.settings['game_path'], 'GDWeave', 'Mods')
         if os.path.exists(gdweave_mods_path):
             try:
-                for item in os.listdir(gdweave_mods_path):
-                    item_path = os.path.join(gdweave_mods_path, item)
-                    if os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-                    else:
-                        os.remove(item_path)
+                # only the game folder is emptied, which mods are enabled stays as it was :3
+                self.reconcile_mods(set(), prune_unmanaged=True, set_flags=False)
                 self.set_status("All mods have been removed from the game's mods folder.")
             except Exception as e:
                 self.set_status(f"Error clearing GDWeave mods: {str(e)}")
@@ -4194,6 +6752,7 @@ Special Thanks:
                     shutil.rmtree(item_path)
                 else:
                     os.remove(item_path)
+            self.installed_store.clear()
 
             # clear mod cache :3
             self.mod_cache = {}
@@ -4209,7 +6768,7 @@ Special Thanks:
     # fetches the latest version from the server :3
     def update_latest_version_label(self):
         try:
-            response = requests.get("https://hooklinesinker.lol/download/version.json")
+            response = http_client.get("https://hooklinesinker.lol/download/version.json")
             latest_version = response.json()['version']
             self.gui_queue.put(('latest_version', latest_version))
         except Exception as e:
@@ -4218,17 +6777,61 @@ Special Thanks:
 
     # processes messages in the gui queue :3
     def process_gui_queue(self):
+        catalog_progress = False
         try:
             while True:
                 message = self.gui_queue.get_nowait()
                 if message[0] == 'latest_version':
                     self.latest_version_label.config(text=f"Latest Version: {message[1]}")
+                elif message[0] == 'catalog_batch':
+                    # batches are only collected here, the list is redrawn once per queue check :3
+                    self.catalog_batch_mods.extend(message[1])
+                    self.catalog_progress = (message[2], message[3])
+                    catalog_progress = True
+                elif message[0] == 'catalog_loaded':
+                    catalog_progress = False
+                    self.finish_catalog_load(message[1], message[2])
+                elif message[0] == 'catalog_failed':
+                    catalog_progress = False
+                    self.catalog_loading = False
+                    self.catalog_batch_mods = []
+                    self.set_status(f"Failed to load mods: {message[1]}")
+                    if self.pending_update_check:
+                        self.pending_update_check = False
+                        self.check_for_updates(silent=True)
+                elif message[0] == 'catalog_updated':
+                    # thunderstore had a newer index than our snapshot, reparse it quietly :3
+                    self.load_available_mods(revalidate=False, progressive=False)
+                elif message[0] == 'download_job':
+                    self.handle_download_job(message[1])
+                elif message[0] == 'fs_events':
+                    self.handle_fs_events(message[1])
         except queue.Empty:
-            pass
+            if catalog_progress and self.catalog_loading:
+                self.show_catalog_progress()
         finally:
             # schedule the next queue check :3
             self.root.after(100, self.process_gui_queue)
             
+    # reflects a download manager job change in the ui :3
+    def handle_download_job(self, update):
+        job_id, title, state, result, error = update
+        if state in InstallJob.FINISHED:
+            # a job only finishes once, this just makes sure the ui never handles it twice :3
+            if job_id in self.finished_job_ids:
+                return
+            self.finished_job_ids.add(job_id)
+        if state == 'done':
+            self.installation_complete(result)
+        elif state == 'failed':
+            self.installation_failed(error)
+        elif state == 'cancelled':
+            self.set_status(f"Cancelled {title}")
+        else:
+            pending = len(self.downloads.active_jobs())
+            suffix = f" ({pending} in queue)" if pending > 1 else ""
+            self.set_status(f"{state.capitalize()} {title}...{suffix}")
+
     def find_mod_by_title(self, title):
         # remove status prefix if present (✅ or ❌) :3
         if title.startswith('✅ ') or title.startswith('❌ '):
@@ -4238,22 +6841,19 @@ Special Thanks:
         if '[3rd]' in title:
             title = title.replace('[3rd]', '').strip()
     
-        # first check installed mods list :3
-        for mod in self.installed_mods:
-            if mod['title'] == title:
-                return mod
-            
-        # then check available mods from Thunderstore :3
-        for mod in self.available_mods:
-            if mod['title'] == title:
-                return mod
+        # first check installed mods list, then available mods from Thunderstore :3
+        # the title lookup ignores case, so every mod sharing the key is checked for the exact title :3
+        for mods in (self.mod_registry.installed_with_title(title), self.mod_registry.available_with_title(title)):
+            for mod in mods:
+                if mod['title'] == title:
+                    return mod
             
         raise ValueError(f"no mod found with title: {title}")
 
     # checks for program updates and prompts user to update if available :3
     def check_for_program_updates(self, silent=False):
         try:
-            response = requests.get("https://hooklinesinker.lol/download/version.json")
+            response = http_client.get("https://hooklinesinker.lol/download/version.json")
             version_data = response.json()
             remote_version = version_data['version']
             update_message = version_data.get('message', '')
@@ -4299,7 +6899,7 @@ Special Thanks:
                 installer_path = os.path.join(temp_dir, 'HLS_Setup.exe')
                 logging.info(f"Downloading installer from {url} to {installer_path}")
                 
-                with requests.get(url, stream=True) as response:
+                with http_client.get(url, stream=True) as response:
                     response.raise_for_status()
                     total_size = int(response.headers.get('content-length', 0))
                     downloaded_size = 0
@@ -4406,13 +7006,11 @@ Special Thanks:
         ).start()
 
     def update_available_mods_list(self):
-        # clear current list :3
-        self.available_listbox.delete(0, tk.END)
-        
-        # add mods to listbox sorted by title :3
-        for mod in sorted(self.available_mods, key=lambda x: x['title']):
-            display_title = self.get_display_name(mod['title'])
-            self.available_listbox.insert(tk.END, display_title)
+        # show mods sorted by title :3
+        self.available_listbox.set_items([
+            (mod['id'], self.get_display_name(mod['title']))
+            for mod in sorted(self.available_mods, key=lambda x: x['title'])
+        ])
 
     def extract_mod_from_zip(self, zip_path, temp_dir):
         """Extract mod from zip file by finding manifest.json with Id field"""
@@ -4457,7 +7055,7 @@ Special Thanks:
             try:
                 self.set_status("Downloading update...")
                 url = f"https://hooklinesinker.lol/download/{new_version}"
-                response = requests.get(url, stream=True, allow_redirects=True)
+                response = http_client.get(url, stream=True, allow_redirects=True)
                 response.raise_for_status()
 
                 temp_dir = os.path.join(os.getenv('APPDATA'), 'HookLineSinker', 'temp')
@@ -4730,11 +7328,15 @@ Special Thanks:
                 # get the actual mod from the filtered list :3
                 selected_title = listbox.get(index)
                 # find the corresponding mod in available_mods :3
-                mod = next((m for m in self.available_mods 
-                           if self.get_display_name(m['title']) == selected_title), None)
+                mod = self.mod_registry.available_by_name(self.get_backend_name(selected_title))
                 
                 if mod:
-                    menu.add_command(label="Install", command=self.install_mod)
+                    if job := self.downloads.job_for_mod(mod['id']):
+                        menu.add_command(label="Cancel Install", command=lambda: self.downloads.cancel(job.id))
+                    else:
+                        menu.add_command(label="Install", command=self.install_mod)
+                if self.downloads.busy():
+                    menu.add_command(label="Cancel All Installs", command=self.downloads.cancel_all)
                     
             elif listbox == self.installed_listbox:
                 # get the actual mod from the filtered list :3
@@ -4742,8 +7344,7 @@ Special Thanks:
                 # remove status indicators (✅/❌) and [3rd] tag :3
                 clean_title = re.sub(r'^[✅❌]\s*(?:\[3rd\]\s*)?', '', selected_text)
                 # find the corresponding mod in installed_mods :3
-                mod = next((m for m in self.installed_mods 
-                           if self.get_display_name(m['title']) == clean_title), None)
+                mod = self.mod_registry.installed_by_name(self.get_backend_name(clean_title))
                 
                 if mod:
                     # basic mod management options :3
@@ -4752,9 +7353,11 @@ Special Thanks:
                     menu.add_command(label="Test Mod", command=lambda: self.test_mod(mod))
                     menu.add_separator()
                     
-                    # version management submenu :3
+                    # version management submenu, the version list starts loading now :3
+                    self.prewarm_mod_versions(mod)
                     version_menu = tk.Menu(menu, tearoff=0)
                     menu.add_cascade(label="Version Management", menu=version_menu)
+                    version_menu.add_command(label="Change Version...", command=self.show_version_selection)
                     version_menu.add_command(label="Mark Current Version as Unwanted", 
                                            command=lambda: self.blacklist_version(mod))
                     version_menu.add_command(label="View Blacklisted Versions", 
@@ -4799,7 +7402,14 @@ Special Thanks:
     def mod_has_config(self, mod):
         if not self.settings.get('game_path'):
             return False
-            
+
+        # while the watcher runs the configs folder is listed once and kept fresh by its events :3
+        if self.fs_watcher is not None:
+            if self.config_ids is None:
+                _, files = StartupScanner._directories(self.gdweave_configs_path())
+                self.config_ids = {name[:-len('.json')] for name in files if name.endswith('.json')}
+            return mod['id'] in self.config_ids
+
         config_path = os.path.join(self.settings['game_path'], 'GDWeave', 'configs', f"{mod['id']}.json")
         return os.path.exists(config_path)
             
@@ -4808,23 +7418,15 @@ Special Thanks:
             if not mod.get('thunderstore_id'):
                 return []
 
-            # get all mods from thunderstore API :3
-            response = requests.get("https://thunderstore.io/c/webfishing/api/v1/package/")
-            response.raise_for_status()
-            all_mods = response.json()
-
-            # find the matching mod :3
-            mod_data = next(
-                (m for m in all_mods if f"{m['owner']}-{m['name']}" == mod['thunderstore_id']),
-                None
-            )
+            # usually already cached by the context menu or selecting the mod :3
+            versions = self.version_history.get(mod['thunderstore_id'], self.get_package_uuid(mod))
 
-            if not mod_data:
+            if not versions:
                 return []
 
             # sort versions by date created :3
             versions = sorted(
-                mod_data['versions'],
+                versions,
                 key=lambda x: x['date_created'],
                 reverse=True
             )[:20]  # get latest 20 versions :3
@@ -4835,6 +7437,18 @@ Special Thanks:
             logging.error(f"Error fetching versions for {mod['title']}: {str(e)}")
             return []
 
+    # installed mods don't store the package uuid, so it comes from the catalog :3
+    def get_package_uuid(self, mod):
+        if mod.get('uuid4'):
+            return mod['uuid4']
+        available_mod = self.mod_registry.available_by_thunderstore_id(mod.get('thunderstore_id'))
+        return available_mod.get('uuid4') if available_mod else None
+
+    # starts loading a mod's version history in the background :3
+    def prewarm_mod_versions(self, mod):
+        if mod.get('thunderstore_id') and not mod.get('third_party', False):
+            self.version_history.prewarm(mod['thunderstore_id'], self.get_package_uuid(mod))
+
     def install_specific_version(self, mod, version):
         try:
             # create temporary mod info for installation :3
@@ -4842,6 +7456,7 @@ Special Thanks:
             temp_mod.update({
                 'version': version['version_number'],
                 'download': version['download_url'],
+                'file_size': version.get('file_size', 0),
                 'dependencies': version['dependencies']
             })
             
@@ -4859,36 +7474,18 @@ Special Thanks:
 
     def test_mod(self, mod):
         try:
-            # check dependencies first :3
-            dependencies = self.check_mod_dependencies(mod)
-
-            # disable all mods first :3
-            for installed_mod in self.installed_mods:
-                if installed_mod.get('enabled', True):
-                    installed_mod['enabled'] = False
-                    self.update_mod_status_in_listbox(installed_mod)
-                    self.save_mod_status(installed_mod)
-                    self.remove_mod_from_game(installed_mod)
-
-            # enable the selected mod and its dependencies :3
+            # the selected mod plus whichever of its dependencies are installed :3
             mods_to_enable = [mod]
+            for dep in mod.get('dependencies', []):
+                dep_id, _ = parse_dependency(dep)
+                if not dep_id or dep_id.startswith(CORE_DEPENDENCIES):
+                    continue
+                dep_mod = self.mod_registry.installed_by_thunderstore_id(dep_id) or self.mod_registry.installed_by_id(dep_id)
+                if dep_mod and dep_mod not in mods_to_enable:
+                    mods_to_enable.append(dep_mod)
 
-            # find and add dependencies to enable list if there are any :3
-            if dependencies:
-                for dep_id in dependencies:
-                    if dep_mod := next(
-                        (m for m in self.installed_mods if m['id'] == dep_id), None
-                    ):
-                        mods_to_enable.append(dep_mod)
-
-            # enable all required mods :3
-            for mod_to_enable in mods_to_enable:
-                mod_to_enable['enabled'] = True
-                self.update_mod_status_in_listbox(mod_to_enable)
-                self.save_mod_status(mod_to_enable)
-                self.copy_mod_to_game(mod_to_enable)
-
-            self.refresh_mod_lists()
+            # everything else gets disabled in the same pass :3
+            self.reconcile_mods({mod_key(mod_to_enable) for mod_to_enable in mods_to_enable})
 
             # update status message to show enabled dependencies :3
             if len(mods_to_enable) > 1:
@@ -5065,9 +7662,7 @@ Special Thanks:
                 
     # copies a third-party mod to the game directory :3
     def copy_third_party_mod_to_game(self, mod):
-        src_path = os.path.join(self.mods_dir, "3rd_party", mod['id'])
-        dst_path = os.path.join(self.settings['game_path'], 'GDWeave', 'Mods', mod['id'])
-        shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
+        self.copy_mod_to_game(dict(mod, third_party=True))
         self.set_status(f"Installed 3rd party mod: {mod['title']}")
         self.refresh_mod_lists()
 
@@ -5105,12 +7700,13 @@ Special Thanks:
         
         if os.path.exists(mod_path):
             shutil.rmtree(mod_path)
+        self.installed_store.delete(mod)
         
         # remove from game directory if it exists :3
         game_mod_path = os.path.join(self.settings['game_path'], 'GDWeave', 'Mods', mod['id'])
-        if os.path.exists(game_mod_path):
-            shutil.rmtree(game_mod_path)
-        
+        self.deployer.undeploy(mod['id'], game_mod_path)
+
+        self.mod_registry.remove_installed(mod)
         self.set_status(f"Uninstalled mod: {mod['title']}")
     # enables selected mods :3
     def enable_mod(self):
@@ -5118,19 +7714,14 @@ Special Thanks:
             return
         selected_indices = self.get_selected_installed_mod_indices()
         if selected_indices:
-            enabled_count = 0
-            for index in selected_indices:
-                mod = self.filtered_installed_mods[index]
-                if not mod.get('enabled', True):
-                    mod['enabled'] = True
-                    self.update_mod_status_in_listbox(mod)
-                    self.save_mod_status(mod)
-                    self.copy_mod_to_game(mod)
-                    enabled_count += 1
-                    logging.info(f"Enabled mod: {mod['title']} (ID: {mod['id']}, Third Party: {mod.get('third_party', False)})")
+            # only the selected mods are looked at, other disabled mods left in GDWeave/Mods stay put :3
+            selected_keys = {mod_key(self.filtered_installed_mods[index]) for index in selected_indices}
+            plan = self.reconcile_mods(selected_keys, scope=selected_keys)
+            enabled_count = len(plan.enable)
+            for mod in plan.enable:
+                logging.info(f"Enabled mod: {mod['title']} (ID: {mod['id']}, Third Party: {mod.get('third_party', False)})")
 
             if enabled_count > 0:
-                self.refresh_mod_lists()
                 self.set_status(f"Enabled {enabled_count} mod(s)")
             else:
                 self.set_status("No mods were enabled. Selected mods may already be enabled.")
@@ -5140,30 +7731,27 @@ Special Thanks:
         if not self.check_setup():
             return
         selected_indices = self.get_selected_installed_mod_indices()
-        if selected_indices:
-            disabled_count = 0
-            for index in selected_indices:
-                mod = self.filtered_installed_mods[index]
-                try:
-                    mod['enabled'] = False
-                    self.update_mod_status_in_listbox(mod)
-                    self.save_mod_status(mod)
-                    self.remove_mod_from_game(mod)
-                    disabled_count += 1
-                    self.send_ga_event('mod_disable_success', {
-                        'mod_id': mod.get('id'),
-                        'mod_title': mod.get('title'),
-                        'version': mod.get('version')
-                    })
-                except Exception as e:
-                    error_message = f"Failed to disable mod {mod.get('title')}: {str(e)}"
-                    logging.error(error_message)
-                    self.send_ga_event('mod_disable_error', {
-                        'mod_id': mod.get('id'),
-                        'error': str(e)
-                    })
+        if selected_indices:
+            selected_mods = [self.filtered_installed_mods[index] for index in selected_indices]
+            try:
+                self.reconcile_mods(set(), scope={mod_key(mod) for mod in selected_mods})
+            except Exception as e:
+                error_message = f"Failed to disable mods: {str(e)}"
+                logging.error(error_message)
+                self.set_status(error_message)
+                self.send_ga_event('mod_disable_error', {
+                    'mod_id': ','.join(mod.get('id', '') for mod in selected_mods),
+                    'error': str(e)
+                })
+                return
 
-            self.refresh_mod_lists()
+            disabled_count = len(selected_mods)
+            for mod in selected_mods:
+                self.send_ga_event('mod_disable_success', {
+                    'mod_id': mod.get('id'),
+                    'mod_title': mod.get('title'),
+                    'version': mod.get('version')
+                })
             self.set_status(f"Disabled {disabled_count} mod(s)")
             self.send_ga_event('mods_disabled', {
                 'count': disabled_count
@@ -5190,11 +7778,7 @@ Special Thanks:
 
     # updates the status of a mod in the installed mods listbox :3
     def update_mod_status_in_listbox(self, mod):
-        index = self.installed_mods.index(mod)
-        status = "✅" if mod.get('enabled', True) else "❌"
-        third_party = "[3rd] " if mod.get('third_party', False) else "" 
-        self.installed_listbox.delete(index)
-        self.installed_listbox.insert(index, f"{status} {third_party}{mod['title']}".strip())
+        self.installed_listbox.update_item(*self.installed_mod_row(mod))
         
     def show_version_selection(self):
         selected_indices = self.get_selected_installed_mod_indices()
@@ -5300,27 +7884,17 @@ Special Thanks:
             self.save_settings()
 
     # saves the status of a mod to its mod_info.json file :3
-    def save_mod_status(self, mod):
-        if mod.get('third_party', False):
-            mod_folder = os.path.join(self.mods_dir, "3rd_party", mod['id'])
-        else:
-            mod_folder = os.path.join(self.mods_dir, mod['id'])
-        
-        mod_json_path = os.path.join(mod_folder, 'mod_info.json')
-        
-        if not os.path.exists(mod_folder):
-            os.makedirs(mod_folder)
-        
+    def save_mod_status(self, mod, update_cache=True):
         try:
-            with open(mod_json_path, 'w') as f:
-                json.dump(mod, f, indent=2)
+            self.installed_store.put(mod)
             logging.info(f"Saved mod status for {mod['title']} (ID: {mod['id']})")
         except Exception as e:
             error_message = f"Failed to save mod status for {mod['title']} (ID: {mod['id']}): {str(e)}"
             self.set_status(error_message)
             logging.info(error_message)
 
-        self.save_mod_cache()
+        if update_cache:
+            self.save_mod_cache()
 
     def update_installed_filter_options(self):
         # start with status filters :3
@@ -5388,6 +7962,8 @@ Special Thanks:
 
             # check if this is an installed mod :3
             is_installed = listbox == self.installed_listbox
+            if is_installed:
+                self.prewarm_mod_versions(mod)
 
             # title section with status indicators :3
             title_text = f"{self.get_display_name(mod['title'])} v{mod.get('version', '?')}\n"
@@ -5555,31 +8131,14 @@ Special Thanks:
     # checks if a thunderstore mod is installed and enabled :3
     def is_thunderstore_mod_enabled(self, thunderstore_id):
         try:
-            # check installed mods list first :3
-            for mod in self.installed_mods:
-                # skip third party mods :3
-                if mod.get('third_party', False):
-                    continue
-                    
-                # check if thunderstore_id matches and mod is enabled :3
-                if mod.get('thunderstore_id') == thunderstore_id and mod.get('enabled', False):
-                    return True
-                    
-            # check mods directory as backup :3
-            for mod_folder in os.listdir(self.mods_dir):
-                # skip 3rd party folder :3
-                if mod_folder == '3rd_party':
-                    continue
+            # check installed mods list first, third party mods don't count :3
+            mod = self.mod_registry.installed_by_thunderstore_id(thunderstore_id)
+            if mod and not mod.get('third_party', False) and mod.get('enabled', False):
+                return True
                     
-                mod_info_path = os.path.join(self.mods_dir, mod_folder, 'mod_info.json')
-                if os.path.exists(mod_info_path):
-                    with open(mod_info_path, 'r') as f:
-                        mod_info = json.load(f)
-                        # check if thunderstore_id matches and mod is enabled :3
-                        if mod_info.get('thunderstore_id') == thunderstore_id and mod_info.get('enabled', False):
-                            return True
-                            
-            return False
+            # check the installed mods database as backup :3
+            mod_info = self.installed_store.by_thunderstore_id(thunderstore_id)
+            return bool(mod_info and mod_info.get('enabled', False))
             
         except Exception as e:
             logging.error(f"Error checking if thunderstore mod {thunderstore_id} is enabled: {str(e)}")
@@ -5604,7 +8163,9 @@ Special Thanks:
             'blacklisted_versions': {},
             'available_sort_by': 'Last Updated',
             'installed_sort_by': 'Recently Installed',
-            'windef_prompt_shown': False
+            'windef_prompt_shown': False,
+            'package_cache_mb': 1024,
+            'deploy_mode': 'auto'
         }
 
     # verifies the game installation path :3
@@ -5658,11 +8219,17 @@ Special Thanks:
             "analytics_enabled": self.analytics_enabled.get(),
         })
         
-        settings_path = os.path.join(self.app_data_dir, 'settings.json')
-        with open(settings_path, 'w') as f:
-            json.dump(self.settings, f)
+        self.mark_settings_dirty()
         self.set_status("Settings saved successfully!")
-        logging.info("Settings saved:", self.settings)
+        logging.info(f"Settings saved: {self.settings}")
+
+        # the watched game folders follow the game path :3
+        if self.fs_watcher is not None and self.fs_watcher.roots != FileWatcher.unique_roots(self.watched_folders()):
+            self.start_fs_watcher()
+
+    # settings.json goes through the json writer so bursts of changes land as one atomic write :3
+    def mark_settings_dirty(self):
+        self.json_writer.mark(os.path.join(self.app_data_dir, 'settings.json'), lambda: dict(self.settings), indent=4)
         
     # updates the ui lists of available and installed mods :3
     def refresh_mod_lists(self):
@@ -5670,20 +8237,14 @@ Special Thanks:
             # preserve the current items in the listbox :3
             current_items = list(self.available_listbox.get(0, tk.END))
             
-            # only update if the list is empty (first load) :3
-            if not current_items:
-                self.load_available_mods()
+            # only update if nothing has been loaded yet (first load) :3
+            if not current_items and not self.catalog:
+                self.load_available_mods(revalidate=False)
 
         self.installed_mods = self.get_installed_mods()
         
         if hasattr(self, 'installed_listbox'):
-            self.installed_listbox.delete(0, tk.END)
-            for mod in self.installed_mods:
-                status = "✅" if mod.get('enabled', True) else "❌"
-                third_party = "[3rd] " if mod.get('third_party', False) else ""
-                display_title = self.get_display_name(mod['title'])
-                display_text = f"{status} {third_party}{display_title}".strip()
-                self.installed_listbox.insert(tk.END, display_text)
+            self.installed_listbox.set_items([self.installed_mod_row(mod) for mod in self.installed_mods])
 
             # update installed mods count :3
             if hasattr(self, 'installed_frame'):
@@ -5719,146 +8280,92 @@ Special Thanks:
 
     # retrieves list of installed mods from the mods directory :3
     def get_installed_mods(self):
-        installed_mods = []
-        
-        # check official mods :3
-        for mod_folder in os.listdir(self.mods_dir):
-            if mod_folder != "3rd_party":
-                mod_info_path = os.path.join(self.mods_dir, mod_folder, 'mod_info.json')
-                if os.path.exists(mod_info_path):
-                    with open(mod_info_path, 'r') as f:
-                        mod_info = json.load(f)
-                        installed_mods.append(mod_info)
+        return self.installed_store.mods()
+
+    # queues a mod on the download manager, after is a list of jobs that have to finish first :3
+    def download_and_install_mod(self, mod, after=()):
+        return self.downloads.submit(mod, after)
+
+    # runs on a download manager worker :3
+    def run_install_job(self, job):
+        return self._download_and_install_mod_thread(job.mod, install=False, job=job)
+
+    @property
+    def mod_downloading(self):
+        return self.downloads.busy()
+
+    # moves a job to its next step, bailing out if it was cancelled in the meantime :3
+    def advance_job(self, job, state):
+        if job is not None:
+            self.downloads.set_state(job, state)
+
+    # downloads a mod's zip and stores it in the package cache :3
+    # returns the archive path and whether it's a pinned cache entry :3
+    def download_mod_archive(self, mod, job=None):
+        # partial downloads keep a stable name per version so a later attempt can resume them :3
+        partial_dir = os.path.join(self.app_data_dir, 'temp', 'partial')
+        os.makedirs(partial_dir, exist_ok=True)
+        zip_path = os.path.join(partial_dir, re.sub(r'[^\w.-]', '_', PackageCache.key_for(mod)) + '.zip')
+        size_checked = []
+
+        # runs once the headers are in, before any of the body is read :3
+        def check_size(file_size):
+            if size_checked:
+                return
+            size_checked.append(file_size)
 
-        # check third-party mods :3
-        third_party_mods_dir = os.path.join(self.mods_dir, "3rd_party")
-        if os.path.exists(third_party_mods_dir):
-            for mod_folder in os.listdir(third_party_mods_dir):
-                mod_info_path = os.path.join(third_party_mods_dir, mod_folder, 'mod_info.json')
-                if os.path.exists(mod_info_path):
-                    with open(mod_info_path, 'r') as f:
-                        mod_info = json.load(f)
-                        mod_info['third_party'] = True
-                        installed_mods.append(mod_info)
-
-        return installed_mods
-
-    # downloads and installs a mod :3
-    def download_and_install_mod(self, mod, install=True):
-        # create thy thread to handle the download and installation :3
-        thread = threading.Thread(
-            target=self._download_and_install_mod_thread,
-            args=(mod, install)
-        )
-        thread.daemon = True
-        thread.start()
-        
-    def _download_and_install_mod_thread(self, mod, install=True):
-        download_temp_dir = None
-        try:
-            self.mod_downloading = True
-            self.set_status_safe(f"Downloading {mod['title']}...")
-            
-            # create temp directory :3
-            temp_dir = os.path.join(self.app_data_dir, 'temp')
-            os.makedirs(temp_dir, exist_ok=True)
-            
-            # create unique temp directory with uuid :3
-            download_temp_dir = os.path.join(temp_dir, f"download_{uuid.uuid4().hex}")
-            os.makedirs(download_temp_dir)
-            
-            # download the mod file with error handling and size check :3
-            try:
-                # first try head request to check file size :3
-                max_retries = 3
-                retry_count = 0
-                while True:
-                    try:
-                        response = requests.head(mod['download'], timeout=30)
-                        file_size = int(response.headers.get('content-length', 0))
+            # log the mod size :3
+            logging.info(f"Downloading mod {mod['title']} ({file_size / 1024 / 1024:.1f}MB)")
+            self.send_ga_event('mod_download_start', {
+                'mod_id': mod['id'],
+                'mod_title': mod['title'],
+                'file_size_mb': round(file_size / 1024 / 1024, 1)
+            })
 
-                        # if head request returns 0 size, try get request with stream=true :3
-                        if file_size == 0:
-                            response = requests.get(mod['download'], stream=True, timeout=30)
-                            file_size = int(response.headers.get('content-length', 0))
-                        break
-                    except Exception as e:
-                        if ('ConnectionResetError' in str(e) or '10054' in str(e)):
-                            retry_count += 1
-                            self.send_ga_event('mod_download_retry', {
-                                'mod_id': mod['id'],
-                                'retry_count': retry_count,
-                                'error': str(e),
-                                'request_type': 'head'
-                            })
-                            if retry_count >= max_retries:
-                                self.send_ga_event('mod_download_error', {
-                                    'mod_id': mod['id'],
-                                    'error': 'max_retries_exceeded',
-                                    'final_error': str(e)
-                                })
-                                self.root.after(0, lambda: messagebox.showerror("Download Error", 
-                                    "Thunderstore appears to be having issues. Please try again in a few minutes."))
-                                raise ValueError("Thunderstore connection issues - please try again later")
-                            time.sleep(1)  # wait a second before retrying :3
-                            continue
-                        raise  # re-raise if it's a different error :3
-
-                # log the mod size :3
-                logging.info(f"Downloading mod {mod['title']} ({file_size / 1024 / 1024:.1f}MB)")
-                self.send_ga_event('mod_download_start', {
-                    'mod_id': mod['id'],
-                    'mod_title': mod['title'],
-                    'file_size_mb': round(file_size / 1024 / 1024, 1)
-                })
+            # check if file is over 50mb (50 * 1024 * 1024 bytes) :3
+            if file_size > 52428800:  # 50MB in bytes :3
+                warning_msg = (
+                    f"WARNING: {mod['title']} is {file_size / 1024 / 1024:.1f}MB which exceeds the recommended 50MB limit.\n\n"
+                    "This is unusually large for a mod. Large mods are not recommended as they may:\n\n"
+                    "• Take a long time to download\n"
+                    "• Use excessive system memory\n"
+                    "• Cause Hook, Line, Sinker to stop responding\n\n"
+                    "Consider finding a smaller alternative mod.\n\n"
+                    "Do you want to continue anyway?"
+                )
+                if not messagebox.askyesno("Excessive File Size", warning_msg, icon='warning'):
+                    self.send_ga_event('mod_download_cancelled', {
+                        'mod_id': mod['id'],
+                        'reason': 'file_too_large',
+                        'file_size_mb': round(file_size / 1024 / 1024, 1)
+                    })
+                    raise ValueError("Download cancelled - file too large")
 
-                # check if file is over 50mb (50 * 1024 * 1024 bytes) :3
-                if file_size > 52428800:  # 50MB in bytes :3
-                    warning_msg = (
-                        f"WARNING: {mod['title']} is {file_size / 1024 / 1024:.1f}MB which exceeds the recommended 50MB limit.\n\n"
-                        "This is unusually large for a mod. Large mods are not recommended as they may:\n\n"
-                        "• Take a long time to download\n"
-                        "• Use excessive system memory\n"
-                        "• Cause Hook, Line, Sinker to stop responding\n\n"
-                        "Consider finding a smaller alternative mod.\n\n"
-                        "Do you want to continue anyway?"
-                    )
-                    if not messagebox.askyesno("Excessive File Size", warning_msg, icon='warning'):
-                        self.send_ga_event('mod_download_cancelled', {
-                            'mod_id': mod['id'],
-                            'reason': 'file_too_large',
-                            'file_size_mb': round(file_size / 1024 / 1024, 1)
-                        })
-                        raise ValueError("Download cancelled - file too large")
+        # cancelling an install stops the download between chunks :3
+        def check_cancelled(written, file_size):
+            if job is not None:
+                job.check_cancelled()
 
-                # proceed with download :3
-                retry_count = 0
-                while True:
-                    try:
-                        response = requests.get(mod['download'], timeout=30)
-                        response.raise_for_status()
-                        break
-                    except Exception as e:
-                        if ('ConnectionResetError' in str(e) or '10054' in str(e)):
-                            retry_count += 1
-                            self.send_ga_event('mod_download_retry', {
-                                'mod_id': mod['id'],
-                                'retry_count': retry_count,
-                                'error': str(e),
-                                'request_type': 'get'
-                            })
-                            if retry_count >= max_retries:
-                                self.send_ga_event('mod_download_error', {
-                                    'mod_id': mod['id'],
-                                    'error': 'max_retries_exceeded',
-                                    'final_error': str(e)
-                                })
-                                self.root.after(0, lambda: messagebox.showerror("Download Error", 
-                                    "Thunderstore appears to be having issues. Please try again in a few minutes."))
-                                raise ValueError("Thunderstore connection issues - please try again later")
-                            time.sleep(1)  # wait a second before retrying :3
-                            continue
-                        raise  # re-raise if it's a different error :3
+        def report_retry(attempt, error, delay):
+            self.send_ga_event('mod_download_retry', {
+                'mod_id': mod['id'],
+                'retry_count': attempt,
+                'error': str(error),
+                'request_type': 'get'
+            })
+            self.set_status_safe(f"Connection dropped while downloading {mod['title']}, retrying...")
+
+        retry = RetryPolicy()
+        try:
+            try:
+                download_size, download_hash = stream_download(
+                    mod['download'], zip_path,
+                    expected_size=mod.get('file_size', 0),
+                    on_size=check_size,
+                    on_chunk=check_cancelled,
+                    retry=retry,
+                    on_retry=report_retry
+                )
 
             except requests.Timeout:
                 self.send_ga_event('mod_download_error', {
@@ -5867,101 +8374,94 @@ Special Thanks:
                 })
                 raise ValueError("Download timed out - please try again")
             except requests.RequestException as e:
+                if retry.retryable(e):
+                    self.send_ga_event('mod_download_error', {
+                        'mod_id': mod['id'],
+                        'error': 'max_retries_exceeded',
+                        'final_error': str(e)
+                    })
+                    self.root.after(0, lambda: messagebox.showerror("Download Error", 
+                        "Thunderstore appears to be having issues. Please try again in a few minutes."))
+                    raise ValueError("Thunderstore connection issues - please try again later")
                 self.send_ga_event('mod_download_error', {
                     'mod_id': mod['id'],
                     'error': str(e)
                 })
                 raise ValueError(f"Download failed: {str(e)}")
-            
-            zip_path = os.path.join(download_temp_dir, f"{mod['id']}.zip")
-            try:
-                with open(zip_path, 'wb') as f:
-                    f.write(response.content)
             except IOError as e:
                 self.send_ga_event('mod_download_error', {
                     'mod_id': mod['id'],
                     'error': f'save_failed: {str(e)}'
                 })
                 raise ValueError(f"Failed to save downloaded file: {str(e)}")
-                
-            # extract the zip :3
-            extract_dir = os.path.join(download_temp_dir, 'extracted')
-            os.makedirs(extract_dir)
-            
+        except BaseException:
+            # cancelled or out of retries, this download won't be resumed from here so don't leave its pieces behind :3
+            discard_download(zip_path)
+            raise
+
+        logging.info(f"Downloaded {mod['title']}: {download_size} bytes, sha256 {download_hash}")
+
+        # keep the archive for next time, the cache hands back where it ended up :3
+        # if it can't take it the caller installs from zip_path and deletes it afterwards :3
+        try:
+            return self.package_cache.put(PackageCache.key_for(mod), zip_path, download_hash, mod['download']), True
+        except OSError as e:
+            logging.error(f"Failed to cache {mod['title']}: {str(e)}")
+            return zip_path, False
+
+    def _download_and_install_mod_thread(self, mod, install=True, job=None):
+        cache_key = None
+        uncached_zip = None
+        try:
+            self.advance_job(job, 'downloading')
+            self.set_status_safe(f"Downloading {mod['title']}...")
+
+            # same version installed before, skip the download entirely :3
+            if zip_path := self.package_cache.acquire(PackageCache.key_for(mod), mod['download']):
+                logging.info(f"Installing {mod['title']} from the package cache")
+                cache_key = PackageCache.key_for(mod)
+            else:
+                zip_path, cached = self.download_mod_archive(mod, job)
+                if cached:
+                    cache_key = PackageCache.key_for(mod)
+                else:
+                    uncached_zip = zip_path
+
+            # read the manifest straight out of the zip :3
+            self.advance_job(job, 'extracting')
             try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(extract_dir)
+                zip_ref = zipfile.ZipFile(zip_path, 'r')
             except zipfile.BadZipFile:
                 self.send_ga_event('mod_install_error', {
                     'mod_id': mod['id'],
                     'error': 'invalid_zip'
                 })
                 raise ValueError("Downloaded file is not a valid zip archive")
-            except Exception as e:
-                self.send_ga_event('mod_install_error', {
-                    'mod_id': mod['id'],
-                    'error': f'extract_failed: {str(e)}'
-                })
-                raise ValueError(f"Failed to extract zip file: {str(e)}")
-                
-            # find manifest.json with valid id field :3
-            manifest_path = None
-            manifest = None
-            for root, dirs, files in os.walk(extract_dir):
-                if 'manifest.json' in files:
-                    try:
-                        with open(os.path.join(root, 'manifest.json'), 'r') as f:
-                            manifest_data = json.load(f)
-                            if manifest_data.get('Id'):
-                                manifest_path = os.path.join(root, 'manifest.json')
-                                manifest = manifest_data
-                                break
-                    except json.JSONDecodeError:
-                        continue
-                    except IOError:
-                        continue
-                        
-            if not manifest_path or not manifest:
-                self.send_ga_event('mod_install_error', {
-                    'mod_id': mod['id'],
-                    'error': 'missing_manifest'
-                })
-                raise ValueError(f"{mod['title']} is likely not an installable mod!")
-                
-            # get the mod id from manifest :3
-            mod_id = manifest.get('Id')
-            if not mod_id:
-                self.send_ga_event('mod_install_error', {
-                    'mod_id': mod['id'],
-                    'error': 'invalid_manifest'
-                })
-                raise ValueError(f"{mod['title']} is likely not an installable mod!")
-                
-            # create the final mod directory :3
-            mod_dir = os.path.join(self.mods_dir, mod_id)
-            if os.path.exists(mod_dir):
+
+            with zip_ref:
+                # find manifest.json with valid id field :3
+                manifest_prefix, manifest = find_zip_manifest(zip_ref)
+                if manifest is None:
+                    self.send_ga_event('mod_install_error', {
+                        'mod_id': mod['id'],
+                        'error': 'missing_manifest'
+                    })
+                    raise ValueError(f"{mod['title']} is likely not an installable mod!")
+
+                # get the mod id from manifest :3
+                mod_id = manifest.get('Id')
+
+                # unpack just the mod's folder next to its final spot and rename it in :3
+                self.advance_job(job, 'deploying')
+                mod_dir = os.path.join(self.mods_dir, mod_id)
                 try:
-                    shutil.rmtree(mod_dir)
+                    extract_zip_subtree(zip_ref, manifest_prefix, mod_dir)
                 except Exception as e:
                     self.send_ga_event('mod_install_error', {
                         'mod_id': mod['id'],
-                        'error': f'remove_existing_failed: {str(e)}'
+                        'error': f'extract_failed: {str(e)}'
                     })
-                    raise ValueError(f"Failed to remove existing mod directory: {str(e)}")
-                
-            # move the mod files :3
-            try:
-                manifest_parent = os.path.dirname(manifest_path)
-                if manifest_parent != extract_dir:
-                    shutil.move(manifest_parent, mod_dir)
-                else:
-                    shutil.move(extract_dir, mod_dir)
-            except Exception as e:
-                self.send_ga_event('mod_install_error', {
-                    'mod_id': mod['id'],
-                    'error': f'move_files_failed: {str(e)}'
-                })
-                raise ValueError(f"Failed to move mod files: {str(e)}")
+                    raise ValueError(f"Failed to extract zip file: {str(e)}")
                 
             # create mod_info.json :3
             mod_info = {
@@ -5984,19 +8484,16 @@ Special Thanks:
             }
             
             try:
-                mod_info_path = os.path.join(mod_dir, 'mod_info.json')
-                with open(mod_info_path, 'w') as f:
-                    json.dump(mod_info, f, indent=2)
+                self.installed_store.put(mod_info)
             except Exception as e:
                 self.send_ga_event('mod_install_error', {
                     'mod_id': mod['id'],
                     'error': f'create_info_failed: {str(e)}'
                 })
                 raise ValueError(f"Failed to create mod_info.json: {str(e)}")
-                
-            # add to installed mods :3
-            self.installed_mods.append(mod_info)
-            
+
+            # the registry is only touched on the ui thread, installation_complete adds mod_info there :3
+
             # copy to game if enabled :3
             if mod_info['enabled']:
                 try:
@@ -6021,6 +8518,9 @@ Special Thanks:
             else:
                 return mod_info
                 
+        except JobCancelled:
+            logging.info(f"Cancelled install of {mod['title']}")
+            raise
         except Exception as e:
             error_message = f"Failed to install {mod['title']}: {str(e)}"
             self.set_status_safe(error_message)
@@ -6030,13 +8530,12 @@ Special Thanks:
             else:
                 raise ValueError(error_message)
         finally:
-            self.mod_downloading = False
-            # clean up temp directory :3
-            if download_temp_dir and os.path.exists(download_temp_dir):
-                try:
-                    shutil.rmtree(download_temp_dir)
-                except Exception as e:
-                    logging.error(f"Failed to clean up temp directory: {str(e)}")
+            # unpin the cached archive so it can be evicted again :3
+            if cache_key:
+                self.package_cache.release(cache_key)
+            # an archive the cache didn't take is only good for this install :3
+            if uncached_zip:
+                discard_download(uncached_zip)
 
     # called when mod installation is complete :3
     def installation_complete(self, mod_info):
@@ -6046,7 +8545,7 @@ Special Thanks:
 
     def download_file(self, url, destination):
         try:
-            response = requests.get(url, stream=True)
+            response = http_client.get(url, stream=True)
             response.raise_for_status()
             
             # get file size if available :3
@@ -6065,15 +8564,12 @@ Special Thanks:
         os.makedirs(mod_path, exist_ok=True)
         
         # save mod_info.json :3
-        with open(os.path.join(mod_path, 'mod_info.json'), 'w') as f:
-            json.dump(mod_info, f, indent=2)
+        self.installed_store.put(mod_info)
         
         # copy mod files to game directory :3
         self.copy_mod_to_game(mod_info)
-        
-        # add to installed mods list :3
-        self.installed_mods.append(mod_info)
-        
+
+        # installation_complete adds it to the installed mods list :3
         self.set_status(f"Installed mod: {mod_info['title']}")
         self.installation_complete(mod_info)
 
@@ -6088,8 +8584,9 @@ Special Thanks:
                     for file in files:
                         logging.info(f"  - {os.path.join(os.path.relpath(root, mod_path), file)}")
                         
-    # called when mod installation is complete :3
+    # called on the ui thread when mod installation is complete, workers never touch the mod registry themselves :3
     def installation_complete(self, mod_info):
+        self.mod_registry.add_installed(mod_info)
         self.set_status(f"Mod {mod_info['title']} version {mod_info['version']} installed successfully!")
         self.refresh_mod_lists()
         self.verify_appdata_mods() 
@@ -6116,7 +8613,7 @@ Special Thanks:
                 repo_owner, repo_name = path_parts[1:3]
                 api_url = f"{base_url}/api/v1/repos/{repo_owner}/{repo_name}/releases/latest"
 
-            response = requests.get(api_url)
+            response = http_client.get(api_url)
             response.raise_for_status()
             data = response.json()
 
@@ -6139,7 +8636,7 @@ Special Thanks:
     def check_for_updates(self, silent=False):
         try:
             # check for program update first :3
-            response = requests.get("https://hooklinesinker.lol/download/version.json")
+            response = http_client.get("https://hooklinesinker.lol/download/version.json")
             version_data = response.json()
             remote_version = version_data['version']
             update_message = version_data.get('message', '')
@@ -6174,21 +8671,14 @@ Special Thanks:
                 self.set_status_safe("No mods installed. Skipping mod update check.")
             else:
                 # first pass - collect all mods that need updates :3
-                mods_to_update = []
-                for installed_mod in self.installed_mods:
-                    for available_mod in self.available_mods:
-                        if installed_mod['title'].lower() == available_mod['title'].lower():
-                            try:
-                                if self.is_update_available(installed_mod, available_mod):
-                                    updates_available = True
-                                    mods_to_update.append({
-                                        'installed': installed_mod,
-                                        'available': available_mod
-                                    })
-                            except Exception as e:
-                                error_message = f"Error checking update for mod {installed_mod['title']}: {str(e)}"
-                                self.set_status_safe(error_message)
-                            break
+                plan = UpdatePlan(self.installed_mods, self.mod_registry, self.settings.get('blacklisted_versions', {}))
+                logging.info(f"Mod update check: {plan.summary()}")
+                for mod in plan.with_reason('blacklisted'):
+                    logging.info(f"Skipping blacklisted update for {mod.get('title')}")
+                for mod in plan.with_reason('invalid_version'):
+                    logging.warning(f"Skipping update check for {mod.get('title')}, its version can't be read")
+                mods_to_update = [{'installed': installed, 'available': available} for installed, available in plan.updates]
+                updates_available = bool(mods_to_update)
 
                 # if updates are available, show single prompt :3
                 if mods_to_update:
@@ -6239,78 +8729,6 @@ Special Thanks:
             error_message = f"Failed to check for updates: {str(e)}"
             self.set_status_safe(error_message)
 
-    def is_update_available(self, installed_mod, available_mod):
-        """Check if an update is available for a mod"""
-        try:
-            # get the mod's thunderstore id :3
-            mod_id = installed_mod.get('thunderstore_id')
-            if not mod_id:
-                return False
-                
-            # check if the available version is blacklisted :3
-            blacklisted = self.settings.get('blacklisted_versions', {}).get(mod_id, [])
-            if available_mod.get('version') in blacklisted:
-                logging.info(f"Skipping blacklisted version {available_mod.get('version')} "
-                            f"for {installed_mod.get('title')}")
-                return False
-            
-            logging.info(f"Checking for updates - installed mod: {installed_mod.get('title')}, available mod: {available_mod.get('title')}")
-            
-            # get base thunderstore id by removing version component :3
-            def get_base_id(thunderstore_id):
-                if not thunderstore_id:
-                    logging.debug(f"No thunderstore_id provided")
-                    return ''
-                # match version pattern at end of string :3
-                version_pattern = r'-\d+\.\d+\.\d+$'
-                base_id = re.sub(version_pattern, '', thunderstore_id)
-                logging.debug(f"Converting thunderstore_id '{thunderstore_id}' to base_id '{base_id}'")
-                return base_id
-                
-            installed_base_id = get_base_id(installed_mod.get('thunderstore_id', ''))
-            available_base_id = get_base_id(available_mod.get('thunderstore_id', ''))
-            
-            logging.info(f"Comparing base IDs - Installed: {installed_base_id}, Available: {available_base_id}")
-            
-            # if no thunderstore ids or different mods, no update needed :3
-            if not installed_base_id or not available_base_id or installed_base_id != available_base_id:
-                logging.info("No update needed - Different or missing thunderstore IDs")
-                return False
-                
-            def parse_version(version_str):
-                logging.debug(f"Parsing version string: {version_str}")
-                # extract version numbers, defaulting to 0.0.0 :3
-                match = re.search(r'(\d+)\.(\d+)\.(\d+)', version_str or '0.0.0')
-                if not match:
-                    logging.debug("No version match found, using default [0,0,0]")
-                    return [0, 0, 0]
-                version = [int(x) for x in match.groups()]
-                logging.debug(f"Parsed version: {version}")
-                return version
-                
-            installed_version = parse_version(installed_mod.get('version'))
-            available_version = parse_version(available_mod.get('version'))
-            
-            logging.info(f"Comparing versions - Installed: {installed_version}, Available: {available_version}")
-            
-            # compare version components :3
-            for i in range(3):
-                if available_version[i] > installed_version[i]:
-                    logging.info(f"Update available - Component {i} is newer ({available_version[i]} > {installed_version[i]})")
-                    return True
-                elif available_version[i] < installed_version[i]:
-                    logging.info(f"No update needed - Component {i} is older ({available_version[i]} < {installed_version[i]})")
-                    return False
-            
-            logging.info("No update needed - Versions are identical")
-            return False
-            
-        except Exception as e:
-            error_msg = f"Error checking update for mod {installed_mod.get('title')}: {str(e)}"
-            logging.error(error_msg)
-            logging.error(f"Full traceback: {traceback.format_exc()}")
-            return False
-
     # saves the current state of installed mods to a cache file :3
     def save_mod_cache(self):
         try:
@@ -6323,9 +8741,8 @@ Special Thanks:
                 }
                 for mod in self.installed_mods
             }
-            with open(self.mod_cache_file, 'w') as f:
-                json.dump(mod_cache, f, indent=2)
-            logging.info(f"Mod cache saved. Total mods cached: {len(mod_cache)}")
+            self.json_writer.mark(self.mod_cache_file, lambda: mod_cache, indent=2)
+            logging.info(f"Mod cache queued for saving. Total mods cached: {len(mod_cache)}")
         except Exception as e:
             error_message = f"Failed to save mod cache: {str(e)}"
             self.set_status(error_message)
@@ -6348,11 +8765,6 @@ Special Thanks:
             logging.error(f"Source directory for mod '{mod_info['title']}' (ID: {mod_id}) not found.")
             return
 
-        logging.info(f"Contents of source directory {source_dir} before copying:")
-        for root, dirs, files in os.walk(source_dir):
-            for file in files:
-                logging.info(os.path.join(root, file))
-
         if not self.settings.get('game_path'):
             logging.error("Game path not set. Cannot copy mod to game.")
             return
@@ -6361,23 +8773,66 @@ Special Thanks:
         logging.info(f"Destination directory: {destination_dir}")
 
         try:
-            if os.path.exists(destination_dir):
-                logging.info(f"Removing existing destination directory: {destination_dir}")
-                shutil.rmtree(destination_dir)
-            
-            logging.info(f"Copying from {source_dir} to {destination_dir}")
-            shutil.copytree(source_dir, destination_dir)
-            
-            logging.info(f"Contents of destination directory {destination_dir} after copying:")
-            for root, dirs, files in os.walk(destination_dir):
-                for file in files:
-                    logging.info(os.path.join(root, file))
-            
-            logging.info(f"Mod '{mod_info['title']}' (ID: {mod_id}) copied successfully to game directory.")
+            result = self.deployer.deploy(mod_id, source_dir, destination_dir)
+            logging.info(
+                f"Mod '{mod_info['title']}' (ID: {mod_id}) synced to game directory: "
+                f"{result['added']} added, {result['replaced']} replaced, {result['deleted']} deleted, {result['unchanged']} unchanged ({result['strategy']})"
+            )
         except Exception as e:
             logging.error(f"Error copying mod '{mod_info['title']}' (ID: {mod_id}) to game directory: {str(e)}")
             logging.error(traceback.format_exc())
 
+    # makes GDWeave/Mods hold exactly the given mods, enabling/disabling and deploying only what differs :3
+    # mod_info.json is only rewritten for mods whose enabled flag changed, and the lists refresh once at the end :3
+    # desired_keys are mod_key()s, set_flags=False only changes the game folder and leaves enabled alone :3
+    def reconcile_mods(self, desired_keys, prune_unmanaged=False, scope=None, set_flags=True):
+        gdweave_mods_path = os.path.join(self.settings['game_path'], 'GDWeave', 'Mods')
+        deployed_ids = os.listdir(gdweave_mods_path) if os.path.isdir(gdweave_mods_path) else []
+        plan = ReconcilePlan(self.installed_mods, desired_keys, deployed_ids, prune_unmanaged, scope)
+        if plan.unknown:
+            logging.info(f"Not installed, skipping: {', '.join(plan.unknown)}")
+        if not set_flags:
+            plan.enable, plan.disable = [], []
+
+        for mod in plan.enable:
+            mod['enabled'] = True
+        for mod in plan.disable:
+            mod['enabled'] = False
+
+        for mod in plan.undeploy:
+            try:
+                self.remove_mod_from_game(mod)
+            except Exception as e:
+                logging.error(f"Failed to remove {mod['title']} from game directory: {str(e)}")
+        for name in plan.prune:
+            path = os.path.join(gdweave_mods_path, name)
+            try:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+                self.deployer.forget(name)
+            except Exception as e:
+                logging.error(f"Failed to remove {path}: {str(e)}")
+        for mod in plan.deploy:
+            self.copy_mod_to_game(mod)
+
+        # every toggled mod_info.json and the mod cache get written once when the batch ends :3
+        with self.json_writer.batch():
+            for mod in plan.changed:
+                self.save_mod_status(mod, update_cache=False)
+
+            logging.info(
+                f"Reconciled game mods: {len(plan.deploy)} deployed, {len(plan.undeploy)} removed, "
+                f"{len(plan.prune)} pruned, {len(plan.changed)} toggled"
+            )
+            if plan:
+                self.refresh_mod_lists()
+        return plan
+
+    def enabled_mod_keys(self):
+        return {mod_key(mod) for mod in self.installed_mods if mod.get('enabled', True)}
+
     # removes a mod from the game directory :3
     def remove_mod_from_game(self, mod):
         gdweave_mods_path = os.path.join(self.settings['game_path'], 'GDWeave', 'Mods')
@@ -6385,9 +8840,10 @@ Special Thanks:
         
         if os.path.exists(mod_path_in_game):
             logging.info(f"Removing mod from game: {mod_path_in_game}")
-            shutil.rmtree(mod_path_in_game)
+            self.deployer.undeploy(mod['id'], mod_path_in_game)
             logging.info(f"Successfully removed mod '{mod['title']}' (ID: {mod['id']}) from game directory.")
         else:
+            self.deployer.forget(mod['id'])
             logging.info(f"Mod '{mod['title']}' (ID: {mod['id']}) not found in game directory.")
 
     # periodically checks for updates in the background :3
@@ -6442,126 +8898,195 @@ Special Thanks:
     def handle_filter_toggle(self, filter_type):
         # save settings first :3
         self.save_settings()
-        
-        # store current category selection :3
-        current_category = self.available_category.get()
-        
-        # clear the available mods list to force full refresh :3
-        self.available_mods = []
-        
-        # reload available mods with new filter settings :3
-        self.load_available_mods()
-        
-        # update category filters :3
-        categories = {"All"}  # always include "All" as an option :3
-        for mod in self.available_mods:
-            categories.update(mod.get('categories', []))
-        
-        # update combobox values while preserving selection if possible :3
-        self.available_category['values'] = sorted(list(categories))
-        
-        # check if any mods in the current category exist after filtering :3
-        mods_in_category = any(
-            current_category in mod.get('categories', [])
-            for mod in self.available_mods
-        ) if current_category != "All" else True
-        
-        # keep current category if it exists and has mods, otherwise default to "All" :3
-        if current_category in categories and mods_in_category:
-            self.available_category.set(current_category)
+
+        # the catalog already has every package in memory, so just switch views :3
+        if self.catalog_loading:
+            self.restart_catalog_progress()
         else:
-            self.available_category.set("All")
-        
-        # apply filters :3
-        self.filter_available_mods()
+            self.apply_catalog_view(keep_category=True)
 
     # loads and displays available mods categorized :3
-    def load_available_mods(self):
+    # parsing (and the first download if there's no snapshot yet) happens on a worker thread, the ui gets batches through gui_queue :3
+    def load_available_mods(self, revalidate=True, progressive=True):
+        if self.catalog_loading:
+            return
+        self.catalog_loading = True
+        self.catalog_batch_mods = []
+        self.catalog_progress = (0, self.catalog_store.package_count())
+        if progressive:
+            self.restart_catalog_progress()
+        threading.Thread(target=self.load_catalog_thread, args=(revalidate, progressive), daemon=True).start()
+
+    # worker side of load_available_mods, never touches tkinter directly :3
+    def load_catalog_thread(self, revalidate, progressive):
+        total = self.catalog_store.package_count()
+
+        def on_batch(batch, parsed):
+            self.gui_queue.put(('catalog_batch', list(batch), parsed, total))
+
         try:
-            # fetch mods from thunderstore api :3
-            response = requests.get("https://thunderstore.io/c/webfishing/api/v1/package/")
-            thunderstore_mods = response.json()
-            
-            # track mods by name to detect duplicates :3
-            mod_map = {}
-            
-            for mod in thunderstore_mods:
-                is_deprecated = mod.get('is_deprecated', False)
-                is_nsfw = mod.get('has_nsfw_content', False)
-                
-                # skip if mod should be filtered based on current settings :3
-                if (is_deprecated and not self.show_deprecated.get()) or (is_nsfw and not self.show_nsfw.get()):
-                    continue
-                
-                # get latest version info :3
-                if not mod['versions']:
-                    continue
-                    
-                latest_version = mod['versions'][0]
-                
-                # create mod info structure :3
-                mod_info = {
-                    'title': mod['name'],
-                    'thunderstore_id': f"{mod['owner']}-{mod['name']}", 
-                    'id': f"{mod['owner']}-{mod['name']}", 
-                    'description': latest_version['description'],
-                    'version': latest_version['version_number'],
-                    'download': latest_version['download_url'],
-                    'categories': mod['categories'],
-                    'author': mod['owner'],
-                    'dependencies': latest_version['dependencies'],
-                    'website': latest_version.get('website_url', ''),
-                    'downloads': latest_version.get('downloads', 0),
-                    'likes': mod.get('rating_score', 0),
-                    'last_updated': mod.get('date_updated', ''),
-                    'is_deprecated': is_deprecated,
-                    'has_nsfw_content': is_nsfw,
-                    'date_updated': mod['date_updated']
-                }
-                
-                # handle duplicates :3
-                if mod['name'] in mod_map:
-                    existing = mod_map[mod['name']]
-                    
-                    # keep non-deprecated version if available :3
-                    if existing['is_deprecated'] and not is_deprecated:
-                        mod_map[mod['name']] = mod_info
-                    # if both non-deprecated or both deprecated, keep most recently updated :3
-                    elif existing['is_deprecated'] == is_deprecated:
-                        if mod['date_updated'] > existing['date_updated']:
-                            mod_map[mod['name']] = mod_info
-                else:
-                    mod_map[mod['name']] = mod_info
+            thunderstore_mods = self.catalog_store.load_snapshot(on_batch=on_batch if progressive else None)
+
+            if thunderstore_mods is None:
+                # first run (or broken snapshot) so there's nothing to show yet, fetch it now :3
+                self.set_status_safe("Downloading Thunderstore mod list...")
+                self.catalog_store.revalidate()
+                revalidate = False
+                thunderstore_mods = self.catalog_store.load_snapshot(on_batch=on_batch if progressive else None)
+        except requests.RequestException as e:
+            self.gui_queue.put(('catalog_failed', str(e)))
+            return
+        except Exception as e:
+            logging.error(f"Unexpected error loading Thunderstore catalog: {str(e)}")
+            self.gui_queue.put(('catalog_failed', str(e)))
+            return
+
+        if thunderstore_mods is None:
+            self.gui_queue.put(('catalog_failed', "the mod list could not be read"))
+            return
+
+        # build the catalog and its search index here so the ui thread doesn't have to :3
+        catalog = ThunderstoreCatalog(thunderstore_mods)
+        catalog.build_search_index()
+        self.gui_queue.put(('catalog_loaded', catalog, progressive))
+
+        if revalidate:
+            self.revalidate_catalog()
+
+    # checks thunderstore for a newer package index and tells the ui thread if there is one :3
+    def revalidate_catalog(self):
+        try:
+            if self.catalog_store.revalidate():
+                self.gui_queue.put(('catalog_updated',))
+        except requests.RequestException as e:
+            logging.error(f"Failed to revalidate Thunderstore catalog: {str(e)}")
+        except Exception as e:
+            logging.error(f"Unexpected error revalidating Thunderstore catalog: {str(e)}")
+
+    # shows the mods parsed so far while the catalog is still loading :3
+    # only mods that arrived since the last tick are looked at and appended, sorting and dedupe wait for finish_catalog_load :3
+    def show_catalog_progress(self):
+        parsed, total = self.catalog_progress
+        if hasattr(self, 'available_frame'):
+            progress = f"{parsed}/{total}" if total else str(parsed)
+            self.available_frame.configure(text=f"Thunderstore Mods (loading {progress})")
+
+        new_mods = self.catalog_batch_mods[self.catalog_shown:]
+        if not new_mods:
+            return
+        self.catalog_shown = len(self.catalog_batch_mods)
+
+        show_nsfw = self.show_nsfw.get()
+        show_deprecated = self.show_deprecated.get()
+        selected_category = self.available_category.get() or "All"
+        terms = ModSearchIndex.normalize(self.search_var.get()).split()
+        installed_mod_titles = {mod['title'] for mod in self.installed_mods if not mod.get('third_party', False)}
+        category_count = len(self.catalog_shown_categories)
+
+        rows = []
+        for mod in new_mods:
+            if (mod.get('is_deprecated', False) and not show_deprecated) or (mod.get('has_nsfw_content', False) and not show_nsfw):
+                continue
+            if mod['title'] in self.catalog_shown_titles:
+                continue
+            self.catalog_shown_titles.add(mod['title'])
+            self.mod_registry.available.add(mod)
+            self.catalog_shown_categories.update(mod.get('categories', []))
+
+            if mod['title'] in installed_mod_titles:
+                continue
+            if selected_category != "All" and selected_category not in mod.get('categories', []):
+                continue
+            if terms and not ModSearchIndex.matches(mod, terms):
+                continue
+            rows.append((mod['id'], self.get_display_name(mod['title'])))
+
+        # grow the category list as new ones show up, the current selection stays :3
+        if len(self.catalog_shown_categories) != category_count:
+            self.available_category['values'] = ["All"] + sorted(self.catalog_shown_categories)
+        if not self.available_category.get():
+            self.available_category.set("All")
+
+        if rows:
+            self.available_listbox.append_items(rows)
+
+    # starts the loading view over, when the nsfw/deprecated toggles change mid-load or a new load begins :3
+    def restart_catalog_progress(self):
+        self.catalog_shown = 0
+        self.catalog_shown_titles = set()
+        self.catalog_shown_categories = set()
+        self.available_mods = []
+        if hasattr(self, 'available_listbox'):
+            self.available_listbox.set_items([])
+        self.show_catalog_progress()
+
+    # the worker finished parsing, swap in the full catalog :3
+    def finish_catalog_load(self, catalog, progressive):
+        self.catalog_loading = False
+        self.catalog_batch_mods = []
+        self.catalog_shown = 0
+        self.catalog_shown_titles = set()
+        self.catalog_shown_categories = set()
+        self.ingest_thunderstore_mods(catalog)
+        self.refresh_mod_lists()
+
+        if not progressive:
+            self.set_status("Thunderstore mod list updated")
+
+        if self.pending_update_check:
+            self.pending_update_check = False
+            self.check_for_updates(silent=True)
+
+    # keeps every compact mod record parsed out of the package index and shows the current view of it :3
+    def ingest_thunderstore_mods(self, thunderstore_mods):
+        if isinstance(thunderstore_mods, ThunderstoreCatalog):
+            self.catalog = thunderstore_mods
+        else:
+            self.catalog = ThunderstoreCatalog(thunderstore_mods)
+        self.apply_catalog_view(keep_category=True)
+
+    # swaps available_mods to the catalog view matching the nsfw/deprecated toggles, nothing is reloaded :3
+    def apply_catalog_view(self, keep_category=False):
+        try:
+            current_category = self.available_category.get()
+
+            self.available_catalog = self.catalog
+            self.available_mods = list(self.catalog.view(self.show_nsfw.get(), self.show_deprecated.get()))
 
-            # convert map to list :3
-            self.available_mods = list(mod_map.values())
-            
             # collect unique categories :3
             categories = set()
             for mod in self.available_mods:
                 categories.update(mod.get('categories', []))
-            
+
             # update category dropdown :3
             self.available_category['values'] = ["All"] + sorted(list(categories))
-            self.available_category.set("All")
-                
-            # update the listbox with categorized mods :3
-            self.update_available_mods_list()
-            
-        except requests.RequestException as e:
+
+            # keep current category if it still has mods, otherwise default to "All" :3
+            if keep_category and current_category in categories:
+                self.available_category.set(current_category)
+            else:
+                self.available_category.set("All")
+
+            # reapply search/sort on a view switch, otherwise just list the mods :3
+            if keep_category:
+                self.filter_available_mods()
+            else:
+                self.update_available_mods_list()
+
+        except (KeyError, TypeError) as e:
             self.set_status(f"Failed to load mods: {str(e)}")
 
     # checks if a mod id exists in the mods directory :3
     def mod_id_exists(self, mod_id):
-        # check in the mods directory :3
-        if os.path.exists(os.path.join(self.mods_dir, mod_id)):
+        # check the mods and 3rd party mods folders :3
+        if self.installed_store.has_folder(mod_id) or self.installed_store.has_folder(f"{InstalledModsStore.THIRD_PARTY}/{mod_id}"):
             return True
 
-        # check in the 3rd party mods directory :3
-        if os.path.exists(os.path.join(self.mods_dir, "3rd_party", mod_id)):
+        # a folder the database doesn't know about (say a crashed install) is still taken :3
+        if os.path.exists(os.path.join(self.mods_dir, mod_id)) or os.path.exists(os.path.join(self.mods_dir, InstalledModsStore.THIRD_PARTY, mod_id)):
             return True
 
-        return any(mod.get('id') == mod_id for mod in self.installed_mods)
+        return self.mod_registry.installed_by_id(mod_id) is not None
 
     # checks if a mod exists in the mods directory :3
     def mod_exists(self, mod):
@@ -6580,22 +9105,14 @@ Special Thanks:
 
     # loads third-party mods from the mods directory :3
     def load_third_party_mods(self):
-        third_party_mods_dir = os.path.join(self.mods_dir, "3rd_party")
-        if not os.path.exists(third_party_mods_dir):
-            return
-
-        for mod_folder in os.listdir(third_party_mods_dir):
-            mod_path = os.path.join(third_party_mods_dir, mod_folder)
-            if os.path.isdir(mod_path):
-                mod_info_path = os.path.join(mod_path, 'mod_info.json')
-                if os.path.exists(mod_info_path):
-                    with open(mod_info_path, 'r') as f:
-                        mod_info = json.load(f)
-                        mod_info['third_party'] = True
-                        self.available_mods.append(mod_info)
+        for mod_info in self.installed_store.mods():
+            if mod_info.get('third_party', False):
+                self.mod_registry.available.add(mod_info)
 
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = HookLineSinkerUI(root)
     root.mainloop()
+    app.json_writer.flush()
+    http_client.log_metrics()